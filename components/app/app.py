@@ -4,9 +4,10 @@ API Interface
 Implements the REST API interface
 
 By: Julian Bolivar
-Version: 1.0.0
+Version: 1.1.0
 Date:  2023/06/20
 Revision 1.0.0 (2023/06/20): Initial Release
+Revision 1.1.0 (2026/10/17): Scoring with force and stratified sample options, feature store data
 """
 
 # Main System Imports
@@ -36,7 +37,7 @@ sys.path.insert(0, os.path.join(RUNNING_PATH, '../scoring'))
 from diagnostics import (model_predictions, dataframe_summary, missing_data, 
                         execution_time, outdated_packages_list)
 
-from scoring import score_model
+from scoring import sample_score, score_model
 
 # Main Logger
 LOGHANDLER = None
@@ -55,6 +56,7 @@ dataset_csv_path = os.path.join(RUNNING_PATH,'..',config['ingestion']['output_fo
 db_file = os.path.join(RUNNING_PATH,'..',config['database']['database_folder_path'],'pipeline_data.sqlite')
 model_file = os.path.join(RUNNING_PATH,'..',config['production']['prod_deployment_path'],'trainedmodel.pkl')
 report_path = os.path.join(RUNNING_PATH,'..',config['production']['prod_deployment_path'])
+feature_store = os.path.join(RUNNING_PATH,'..',config['ingestion']['feature_store_path'])
 
 prediction_model = None
 
@@ -106,13 +108,21 @@ def predict():
 def get_score():        
     #check the score of the deployed model
     data_test_file = os.path.join(dataset_csv_path, 'finaldata.csv')
-    return {'F1 score': score_model(data_test_file, model_file, db_file, LOGGER_=LOGGER)}
+    # ?force=1 scores it again bypassing the score cache
+    force = request.args.get('force', '0') == '1'
+    # ?sample=N estimates it on a stratified sample of N rows, nothing recorded
+    if 'sample' in request.args:
+        sample = request.args.get('sample', type=int)
+        if sample is None or sample <= 0:
+            return jsonify({'error': 'sample must be a positive integer'}), 400
+        return sample_score(data_test_file, model_file, sample, LOGGER_=LOGGER)
+    return {'F1 score': score_model(data_test_file, model_file, db_file, LOGGER_=LOGGER, force=force)}
 
 # Summary Statistics Endpoint
 @app.route("/summarystats", methods=['GET','OPTIONS'])
 def get_stats():        
     #check means, medians, and modes for each column
-    summary = dataframe_summary(db_file, LOGGER_=LOGGER)
+    summary = dataframe_summary(db_file, LOGGER_=LOGGER, feature_store=feature_store)
     # return summary
     summary_dict = {'key statistics': {c:{'mean':summary[i],
                                   'median':summary[i+4],
@@ -126,7 +136,7 @@ def get_stats():
 @app.route("/diagnostics", methods=['GET','OPTIONS'])
 def get_diagnostics():        
     #check timing and percent NA values
-    missing_data_rep = missing_data(db_file, LOGGER_=LOGGER)
+    missing_data_rep = missing_data(db_file, LOGGER_=LOGGER, feature_store=feature_store)
     timing = execution_time()
     dependency_check = outdated_packages_list()
     return {'execution time': {step:duration 
@@ -0,0 +1,227 @@
+"""
+Model artifact
+
+Compact binary format of the linear models, loaded without unpickling
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+import json
+import logging as log
+import mmap as mm
+import os
+import pickle
+import struct
+
+# Data Science Imports
+import numpy as np
+
+# File layout: magic, version and header length, a json header padded to
+# DATA_ALIGNMENT bytes and the float64 little endian arrays, so the arrays
+# can be memory mapped directly
+MAGIC = b'RSKM'
+# version 2 adds the decision threshold to the header
+VERSION = 2
+PREFIX = struct.Struct('<4sII')
+DATA_ALIGNMENT = 64
+ARTIFACT_EXTENSION = '.bin'
+# artifacts smaller than this are read, mapping them costs more than reading
+MMAP_MIN_BYTES = 2**20
+# positive class probability threshold of sklearn's predict
+DEFAULT_THRESHOLD = 0.5
+
+
+class LinearModel:
+    """
+    Binary linear classifier evaluated with numpy
+
+    Predicts as sklearn's LogisticRegression and SGDClassifier, with the
+    optional standardization of a StandardScaler applied first. A threshold
+    other than 0.5 moves the decision boundary to its log-odds.
+    """
+
+    def __init__(self, coef, intercept, classes, mean=None, scale=None, features=None,
+                 threshold=DEFAULT_THRESHOLD):
+        """
+        :param coef: (array) coefficients, one per feature
+        :param intercept: (float) intercept
+        :param classes: (array) labels of the negative and positive classes
+        :param mean: (array) features mean subtracted before the coefficients, None skips it
+        :param scale: (array) features scale dividing before the coefficients, None skips it
+        :param features: (list) features' names
+        :param threshold: (float) positive class probability threshold
+        """
+
+        self.coef = coef
+        self.intercept = intercept
+        self.classes = classes
+        self.mean = mean
+        self.scale = scale
+        self.features = features or []
+        self.threshold = threshold
+        # log-odds of the threshold, 0 for 0.5 as on sklearn
+        self.boundary = float(np.log(threshold) - np.log1p(-threshold))
+
+    def decision_function(self, X):
+        """
+        Distance of the samples to the decision boundary
+
+        :param X: (array or DataFrame) samples
+        :return: array with a score per sample
+        """
+
+        X = np.asarray(X, dtype=np.float64)
+        if self.mean is not None:
+            X = (X - self.mean) / self.scale
+
+        return X @ self.coef + self.intercept
+
+    def predict_proba(self, X):
+        """
+        Probability of each class
+
+        :param X: (array or DataFrame) samples
+        :return: array with the negative and positive probabilities per sample
+        """
+
+        positive = 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, X):
+        """
+        Predicted class of each sample
+
+        :param X: (array or DataFrame) samples
+        :return: array with the class label per sample
+        """
+
+        return self.classes[(self.decision_function(X) > self.boundary).astype(np.intp)]
+
+
+def artifact_file(model_file):
+    """
+    Compact artifact saved beside a pickled model
+
+    :param model_file: (str) pickled model file
+    :return: (str) artifact file
+    """
+
+    return os.path.splitext(model_file)[0] + ARTIFACT_EXTENSION
+
+
+def save_artifact(model, filename, threshold=DEFAULT_THRESHOLD):
+    """
+    Save a fitted sklearn's binary linear model on the compact format
+
+    :param model: LogisticRegression, SGDClassifier, or a pipeline of a
+                  StandardScaler and one of them
+    :param filename: (str) artifact file
+    :param threshold: (float) positive class probability threshold of the predictions
+    :return: (str) artifact file
+    """
+
+    scaler = None
+    classifier = model
+    if hasattr(model, 'steps'):
+        scaler = model.steps[0][1] if len(model.steps) > 1 else None
+        classifier = model.steps[-1][1]
+    if classifier.coef_.shape[0] != 1:
+        raise ValueError("Only binary linear models can be saved as a compact artifact")
+
+    arrays = []
+    if scaler is not None:
+        arrays += [scaler.mean_, scaler.scale_]
+    arrays += [classifier.coef_.ravel(), classifier.intercept_, classifier.classes_]
+    header = json.dumps({'model': type(model).__name__,
+                         'features': [str(col) for col in getattr(model, 'feature_names_in_', [])],
+                         'n_features': int(classifier.coef_.shape[1]),
+                         'scaler': scaler is not None,
+                         'threshold': float(threshold)}).encode()
+    data_offset = -(-(PREFIX.size + len(header)) // DATA_ALIGNMENT) * DATA_ALIGNMENT
+
+    # written to a temporary name first, so a reader never gets a partial file
+    with open(filename + '.tmp', 'wb') as file:
+        file.write(PREFIX.pack(MAGIC, VERSION, len(header)))
+        file.write(header.ljust(data_offset - PREFIX.size, b' '))
+        file.write(np.concatenate([np.asarray(array, dtype='<f8') for array in arrays]).tobytes())
+    os.replace(filename + '.tmp', filename)
+
+    return filename
+
+
+def load_artifact(filename, mmap=True):
+    """
+    Load a compact model artifact
+
+    :param filename: (str) artifact file
+    :param mmap: (bool) memory map the arrays instead of reading them
+    :return: LinearModel
+    """
+
+    with open(filename, 'rb') as file:
+        # the mapping stays alive while the arrays reference it
+        buffer = mm.mmap(file.fileno(), 0, access=mm.ACCESS_READ) if mmap else file.read()
+    magic, version, header_size = PREFIX.unpack_from(buffer)
+    if magic != MAGIC or version > VERSION:
+        raise ValueError(f"{filename} is not a compact model artifact of version {VERSION}")
+    header = json.loads(buffer[PREFIX.size:PREFIX.size + header_size])
+    data_offset = -(-(PREFIX.size + header_size) // DATA_ALIGNMENT) * DATA_ALIGNMENT
+    data = np.frombuffer(buffer, dtype='<f8', offset=data_offset)
+
+    n_features = header['n_features']
+    mean = scale = None
+    if header['scaler']:
+        mean, scale, data = data[:n_features], data[n_features:2 * n_features], data[2 * n_features:]
+    classes = np.asarray(data[n_features + 1:n_features + 3])
+    classes = classes.astype(np.int64) if np.all(classes == np.round(classes)) else classes
+
+    return LinearModel(data[:n_features], float(data[n_features]), classes,
+                       mean, scale, header['features'],
+                       header.get('threshold', DEFAULT_THRESHOLD))
+
+
+def model_source(model_file):
+    """
+    File load_model reads for a model, its compact artifact when it isn't
+    older than the pickled model, otherwise the pickled model
+
+    The artifact also carries the decision threshold, so a model whose
+    threshold changed is identified by the artifact and not by the pickle.
+
+    :param model_file: (str) pickled model file
+    :return: (str) file loaded
+    """
+
+    compact_file = artifact_file(model_file)
+    if os.path.isfile(compact_file) and (not os.path.isfile(model_file)
+                                         or os.path.getmtime(compact_file) >= os.path.getmtime(model_file)):
+        return compact_file
+
+    return model_file
+
+
+def load_model(model_file, LOGGER_=log.getLogger("artifact")):
+    """
+    Load a model from its compact artifact, or unpickle it if there isn't one
+
+    The artifact is used only when it isn't older than the pickled model,
+    so a model replaced without its artifact is not shadowed by a stale one.
+    Large artifacts are memory mapped. Unpickling imports the model's
+    library, sklearn, so the fallback is logged.
+
+    :param model_file: (str) pickled model file
+    :param LOGGER_: System Log manager
+    :return: LinearModel or the unpickled model
+    """
+
+    source = model_source(model_file)
+    if source != model_file:
+        return load_artifact(source, mmap=os.path.getsize(source) >= MMAP_MIN_BYTES)
+    LOGGER_.warning(f"No current compact artifact for {model_file}, unpickling it (001)")
+    with open(model_file, 'rb') as file:
+        return pickle.load(file)
@@ -0,0 +1,185 @@
+"""
+Artifact benchmark
+
+Load time of the pickled model and of its compact artifact
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import pickle
+import subprocess
+import tempfile
+import timeit
+from functools import partial
+
+# Data Science Imports
+from sklearn.linear_model import LogisticRegression
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding training and artifact directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../training'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../artifact'))
+
+# Imports from other libraries
+from training import segregate_dataset
+from artifact import load_artifact, save_artifact
+from synthetic import make_dataset
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+# Statements loading each format on a new interpreter
+COLD_LOADS = {
+    'pickle': "import pickle\nwith open({file!r}, 'rb') as f: pickle.load(f)",
+    'compact': "import sys\nsys.path.insert(0, {path!r})\n"
+               "from artifact import load_artifact\nload_artifact({file!r}, mmap=False)",
+    'compact mmap': "import sys\nsys.path.insert(0, {path!r})\n"
+                    "from artifact import load_artifact\nload_artifact({file!r}, mmap=True)",
+}
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="artifact_benchmark",
+                            description="Artifact benchmark")
+
+    parser.add_argument("-n",
+        "--repeats", 
+        type=int,
+        help="Loads timed per format",
+        default=1000,
+        required=False
+    )
+
+    parser.add_argument("-c",
+        "--cold_repeats", 
+        type=int,
+        help="Loads timed per format on a new interpreter, imports included",
+        default=10,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def load_pickle(filename):
+    """
+    Unpickle a model
+
+    :param filename: (str) pickled model file
+    :return: model
+    """
+
+    with open(filename, 'rb') as file:
+        return pickle.load(file)
+
+
+def cold_load(statement, repeats):
+    """
+    Mean time of a new interpreter running a statement
+
+    :param statement: (str) python code
+    :param repeats: (int) interpreters started
+    :return: mean seconds
+    """
+
+    start_time = timeit.default_timer()
+    for _ in range(repeats):
+        subprocess.run([sys.executable, "-c", statement], check=True)
+
+    return (timeit.default_timer() - start_time) / repeats
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    X,y = segregate_dataset(make_dataset(10000))
+    model = LogisticRegression(C=1.0, penalty='l2', random_state=0, solver='liblinear').fit(X,y)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files = {'pickle': os.path.join(tmp_dir, 'trainedmodel.pkl'),
+                 'compact': os.path.join(tmp_dir, 'trainedmodel.bin'),
+                 'compact mmap': os.path.join(tmp_dir, 'trainedmodel.bin')}
+        with open(files['pickle'], 'wb') as file:
+            pickle.dump(model, file)
+        save_artifact(model, files['compact'])
+        # baseline of an interpreter doing nothing
+        empty = cold_load("pass", args.cold_repeats)
+
+        for label, loader in [('pickle', load_pickle),
+                              ('compact', partial(load_artifact, mmap=False)),
+                              ('compact mmap', partial(load_artifact, mmap=True))]:
+            warm = timeit.timeit(lambda: loader(files[label]), number=args.repeats) / args.repeats
+            cold = cold_load(COLD_LOADS[label].format(file=files[label],
+                                                     path=os.path.join(RUNNING_PATH, '../artifact')),
+                             args.cold_repeats) - empty
+            LOGGER.info(f"{label}: warm {warm * 1e6:.1f} us cold {cold * 1e3:.1f} ms (001)")
+            results.append((label, os.path.getsize(files[label]), warm, cold))
+
+    print(f"{'format':>12} {'bytes':>8} {'warm us':>10} {'cold ms':>10}")
+    for label, size, warm, cold in results:
+        print(f"{label:>12} {size:>8} {warm * 1e6:>10.1f} {cold * 1e3:>10.1f}")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "artifact_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
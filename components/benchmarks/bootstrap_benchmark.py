@@ -0,0 +1,194 @@
+"""
+Bootstrap benchmark
+
+Time of the F1 bootstrap resamples drawn on a python loop, on a resample
+index matrix and as a multinomial over the confusion matrix cells
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import timeit
+
+# Data Science Imports
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding training and inference directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../training'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../inference'))
+
+# Imports from other libraries
+from training import segregate_dataset
+from inference import bootstrap_f1, confidence_interval, confusion_matrix
+from synthetic import make_dataset
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="bootstrap_benchmark",
+                            description="Bootstrap benchmark")
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Scored rows resampled",
+        default=1000000,
+        required=False
+    )
+
+    parser.add_argument("-b",
+        "--resamples", 
+        type=int,
+        help="Bootstrap resamples",
+        default=10000,
+        required=False
+    )
+
+    parser.add_argument("-s",
+        "--sample", 
+        type=int,
+        help="Resamples timed on the row resampling methods, their time is extrapolated",
+        default=20,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def f1_from_counts(counts):
+    """
+    F1 of confusion matrix cell counts
+
+    :param counts: (array) tn, fp, fn and tp counts on the last axis
+    :return: F1 per row of counts
+    """
+
+    _, fp, fn, tp = np.moveaxis(counts, -1, 0)
+
+    return 2 * tp / np.maximum(2 * tp + fp + fn, 1)
+
+
+def loop_f1(cells, resamples, rng):
+    """
+    F1 of resamples drawn one at a time on a python loop
+
+    :param cells: (array) confusion matrix cell of each row, 2 * y + yhat
+    :param resamples: (int) number of resamples
+    :param rng: random generator
+    :return: array with the F1 of each resample
+    """
+
+    return np.array([f1_from_counts(np.bincount(cells[rng.integers(0, len(cells), len(cells))],
+                                                minlength=4))
+                     for _ in range(resamples)])
+
+
+def matrix_f1(cells, resamples, rng):
+    """
+    F1 of resamples drawn at once on a (resamples, rows) index matrix
+
+    :param cells: (array) confusion matrix cell of each row, 2 * y + yhat
+    :param resamples: (int) number of resamples
+    :param rng: random generator
+    :return: array with the F1 of each resample
+    """
+
+    indexes = rng.integers(0, len(cells), size=(resamples, len(cells)))
+    # each resample counts its cells on its own 4 bins
+    bins = cells[indexes] + 4 * np.arange(resamples)[:, np.newaxis]
+
+    return f1_from_counts(np.bincount(bins.ravel(), minlength=4 * resamples).reshape(resamples, 4))
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    X, y = segregate_dataset(make_dataset(args.rows))
+    yhat = LogisticRegression(solver='liblinear').fit(X, y).predict(X)
+    cells = (2 * y.to_numpy() + yhat).astype(np.intp)
+    confusion = confusion_matrix(y, yhat)
+    rng = np.random.default_rng(0)
+
+    results = []
+    for label, method, timed in [('python loop', lambda n: loop_f1(cells, n, rng), args.sample),
+                                 ('index matrix', lambda n: matrix_f1(cells, n, rng), args.sample),
+                                 ('multinomial', lambda n: bootstrap_f1(confusion, n), args.resamples)]:
+        start_time = timeit.default_timer()
+        f1 = method(timed)
+        seconds = (timeit.default_timer() - start_time) * args.resamples / timed
+        LOGGER.info(f"{label}: {seconds:.3f} s for {args.resamples} resamples (001)")
+        results.append((label, timed, seconds, f1.mean(), f1.std()))
+
+    low, high = confidence_interval(bootstrap_f1(confusion, args.resamples))
+    print(f"{args.rows} rows, {args.resamples} resamples, 95% F1 interval [{low:.4f}, {high:.4f}]")
+    print(f"{'method':>14} {'timed':>7} {'seconds':>10} {'f1 mean':>9} {'f1 std':>9}")
+    for label, timed, seconds, mean, std in results:
+        print(f"{label:>14} {timed:>7} {seconds:>10.3f} {mean:>9.4f} {std:>9.5f}")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "bootstrap_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
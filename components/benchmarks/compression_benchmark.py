@@ -0,0 +1,147 @@
+"""
+Compression benchmark
+
+Throughput of the chunked csv parser reading plain and compressed files
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import tempfile
+import timeit
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding ingestion and schema directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../ingestion'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../schema'))
+
+# Imports from other libraries
+from ingestion import SOURCE_EXTENSIONS, compression_available
+from schema import load_csv
+from synthetic import write_files
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="compression_benchmark",
+                            description="Compression benchmark")
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Rows of the synthetic csv file",
+        default=2000000,
+        required=False
+    )
+
+    parser.add_argument("-c",
+        "--chunksize", 
+        type=int,
+        help="Rows per chunk read by the parser",
+        default=100000,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def read_chunks(filename, chunksize):
+    """
+    Read a file by chunks as the streaming ingestion does
+
+    :param filename: (str) plain or compressed csv file
+    :param chunksize: (int) rows per chunk
+    :return: rows read
+    """
+
+    return sum(len(chunk) for chunk in load_csv(filename, chunksize=chunksize))
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for extension, compression in SOURCE_EXTENSIONS.items():
+            if not compression_available(compression):
+                LOGGER.warning(f"{extension} skipped, decompressor not installed (001)")
+                continue
+            filename = write_files(tmp_dir, 1, args.rows, extension=extension)[0]
+            size = os.path.getsize(filename) / 2**20
+            start_time = timeit.default_timer()
+            rows = read_chunks(filename, args.chunksize)
+            elapsed = timeit.default_timer() - start_time
+            LOGGER.info(f"{extension}: {rows} rows {elapsed:.3f} s {size:.1f} MB (001)")
+            results.append((extension, size, elapsed, rows / elapsed))
+            os.remove(filename)
+
+    plain_seconds = results[0][2]
+    print(f"{'file':>10} {'MB':>9} {'seconds':>9} {'rows/s':>12} {'vs plain':>9}")
+    for extension, size, elapsed, rate in results:
+        print(f"{extension:>10} {size:>9.1f} {elapsed:>9.3f} {rate:>12.0f} {plain_seconds / elapsed:>8.2f}x")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "compression_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
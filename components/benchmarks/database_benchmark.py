@@ -0,0 +1,155 @@
+"""
+Database benchmark
+
+Compare the rows per second written by DataFrame.to_sql and the bulk writer
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import tempfile
+import timeit
+
+# Data Base Imports
+import sqlite3 as db
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding database directory to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../database'))
+
+# Imports from other libraries
+from database import connect, write_table
+from synthetic import make_dataset
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="database_benchmark",
+                            description="Database benchmark")
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Rows of the synthetic dataset",
+        default=1000000,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def time_to_sql(db_file, dataset):
+    """
+    Time the current write path, DataFrame.to_sql on a default connection
+
+    :param db_file: (str) database file
+    :param dataset: (DataFrame) rows to write
+    :return: seconds of the write
+    """
+
+    start_time = timeit.default_timer()
+    conn = db.connect(db_file)
+    dataset.to_sql("ingested_data", conn, if_exists="replace", index=False)
+    conn.commit()
+    conn.close()
+    return timeit.default_timer() - start_time
+
+
+def time_write_table(db_file, dataset):
+    """
+    Time the bulk writer on a tuned connection
+
+    :param db_file: (str) database file
+    :param dataset: (DataFrame) rows to write
+    :return: seconds of the write
+    """
+
+    start_time = timeit.default_timer()
+    conn = connect(db_file)
+    write_table(conn, "ingested_data", dataset, if_exists="replace")
+    conn.commit()
+    conn.close()
+    return timeit.default_timer() - start_time
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    dataset = make_dataset(args.rows)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, writer in [("to_sql", time_to_sql), ("write_table", time_write_table)]:
+            duration = writer(os.path.join(tmp_dir, f"{label}.sqlite"), dataset)
+            results.append((label, duration))
+            LOGGER.info(f"{label}: {args.rows / duration:.0f} rows/s (001)")
+
+    print(f"{'writer':>12} {'seconds':>10} {'rows/s':>12} {'speedup':>8}")
+    for label, duration in results:
+        print(f"{label:>12} {duration:>10.3f} {args.rows / duration:>12.0f} "
+              f"{results[0][1] / duration:>7.2f}x")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "database_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
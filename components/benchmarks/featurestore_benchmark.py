@@ -0,0 +1,157 @@
+"""
+Feature store benchmark
+
+Compare the ingested data load time from the database and the feature store
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import tempfile
+import timeit
+
+# Data Base Imports
+import sqlite3 as db
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding featurestore directory to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../featurestore'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../training'))
+
+# Imports from other libraries
+from featurestore import load_ingested_data, write_partition
+from training import FEATURES
+from synthetic import make_dataset
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="featurestore_benchmark",
+                            description="Feature store benchmark")
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Rows of the synthetic dataset",
+        default=10000000,
+        required=False
+    )
+
+    parser.add_argument("-p",
+        "--partition_rows", 
+        type=int,
+        help="Rows per feature store partition",
+        default=1000000,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def time_load(db_file, store_path, columns):
+    """
+    Time a load of the ingested data
+
+    :param db_file: (str) database file
+    :param store_path: (str) feature store directory, None reads the database
+    :param columns: (list) columns to read, None reads all
+    :return: seconds of the load
+    """
+
+    start_time = timeit.default_timer()
+    _ = load_ingested_data(db_file, store_path, columns, LOGGER)
+    return timeit.default_timer() - start_time
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_file = os.path.join(tmp_dir, "pipeline_data.sqlite")
+        store_path = os.path.join(tmp_dir, "feature_store")
+        LOGGER.info(f"Generating {args.rows} rows (001)")
+        conn = db.connect(db_file)
+        for part, start in enumerate(range(0, args.rows, args.partition_rows)):
+            dataset = make_dataset(min(args.partition_rows, args.rows - start), seed=part)
+            dataset.to_sql("ingested_data", conn, if_exists="append", index=False)
+            write_partition(store_path, dataset, f"{part:06d}")
+        conn.commit()
+        conn.close()
+
+        for source, path in [("sqlite", None), ("parquet", store_path)]:
+            for label, columns in [("all columns", None), ("training columns", FEATURES)]:
+                duration = time_load(db_file, path, columns)
+                results.append((source, label, duration))
+                LOGGER.info(f"{source} {label}: {duration:.3f} s (002)")
+
+    baseline = results[0][2]
+    print(f"{'source':>8} {'columns':>18} {'seconds':>10} {'speedup':>8}")
+    for source, label, duration in results:
+        print(f"{source:>8} {label:>18} {duration:>10.3f} {baseline / duration:>7.1f}x")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "featurestore_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
@@ -0,0 +1,163 @@
+"""
+Inference benchmark
+
+Latency and throughput of the inference engine against sklearn's predict
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import tempfile
+import timeit
+
+# Data Science Imports
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding training, artifact and inference directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../training'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../artifact'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../inference'))
+
+# Imports from other libraries
+from training import segregate_dataset, build_incremental_model, partial_fit_model
+from artifact import load_artifact, save_artifact
+from inference import InferenceEngine
+from synthetic import make_dataset
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="inference_benchmark",
+                            description="Inference benchmark")
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Largest batch, the batches grow by 10 from a single row",
+        default=10000000,
+        required=False
+    )
+
+    parser.add_argument("-n",
+        "--repeats", 
+        type=int,
+        help="Most predictions timed per batch size",
+        default=1000,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def time_predict(predict, X, repeats):
+    """
+    Mean time of a predict call
+
+    :param predict: (callable) predict function
+    :param X: (DataFrame) batch
+    :param repeats: (int) calls timed
+    :return: mean seconds
+    """
+
+    return timeit.timeit(lambda: predict(X), number=repeats) / repeats
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    X_train, y_train = segregate_dataset(make_dataset(100000))
+    models = {'logistic': LogisticRegression(C=1.0, penalty='l2', random_state=0,
+                                             solver='liblinear').fit(X_train, y_train),
+              'scaled sgd': partial_fit_model(build_incremental_model(), X_train, y_train)}
+    X, _ = segregate_dataset(make_dataset(args.rows, seed=1))
+    sizes = [10**i for i in range(len(str(args.rows))) if 10**i <= args.rows]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, model in models.items():
+            filename = save_artifact(model, os.path.join(tmp_dir, 'trainedmodel.bin'))
+            engine = InferenceEngine(load_artifact(filename))
+            for size in sizes:
+                batch = X.iloc[:size]
+                # repeats shrink with the batch, so each size runs a similar time
+                repeats = max(1, min(args.repeats, 10**6 // size))
+                match = np.array_equal(engine.predict(batch), model.predict(batch))
+                sklearn = time_predict(model.predict, batch, repeats)
+                numpy = time_predict(engine.predict, batch, repeats)
+                LOGGER.info(f"{label} {size} rows: sklearn {sklearn * 1e6:.1f} us "
+                            f"engine {numpy * 1e6:.1f} us match {match} (001)")
+                results.append((label, size, sklearn, numpy, match))
+
+    print(f"{'model':>10} {'rows':>9} {'sklearn us':>12} {'engine us':>12} "
+          f"{'sklearn rows/s':>15} {'engine rows/s':>15} {'speedup':>8} {'match':>6}")
+    for label, size, sklearn, numpy, match in results:
+        print(f"{label:>10} {size:>9} {sklearn * 1e6:>12.1f} {numpy * 1e6:>12.1f} "
+              f"{size / sklearn:>15.0f} {size / numpy:>15.0f} {sklearn / numpy:>8.2f} {str(match):>6}")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "inference_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
@@ -0,0 +1,155 @@
+"""
+Ingestion benchmark
+
+Measure how the parallel ingestion parsing scales with the cores
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import tempfile
+import timeit
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding ingestion directory to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../ingestion'))
+
+# Imports from other libraries
+from ingestion import read_multiple_csv
+from synthetic import write_files
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="ingestion_benchmark",
+                            description="Ingestion benchmark")
+
+    parser.add_argument("-f",
+        "--files", 
+        type=int,
+        help="Synthetic files generated",
+        default=64,
+        required=False
+    )
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Rows per synthetic file",
+        default=100000,
+        required=False
+    )
+
+    parser.add_argument("-w",
+        "--max_workers", 
+        type=int,
+        help="Maximum processes benchmarked, 0 uses all the cores",
+        default=0,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def benchmark_workers(files, max_workers):
+    """
+    Time the parsing of the files with 1 to max_workers processes
+
+    :param files: (list) csv files to parse
+    :param max_workers: (int) maximum number of processes
+    :return: list of (workers, seconds, speedup) tuples
+    """
+
+    results = []
+    workers = 1
+    while workers <= max_workers:
+        start_time = timeit.default_timer()
+        _ = read_multiple_csv(files, workers)
+        duration = timeit.default_timer() - start_time
+        speedup = results[0][1] / duration if results else 1.0
+        results.append((workers, duration, speedup))
+        LOGGER.info(f"Workers: {workers} Time: {duration:.3f} s Speedup: {speedup:.2f}x (001)")
+        # benchmark powers of two and the maximum
+        workers = max_workers if workers < max_workers < workers * 2 else workers * 2
+
+    return results
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    max_workers = args.max_workers if args.max_workers > 0 else os.cpu_count()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        LOGGER.info(f"Generating {args.files} files of {args.rows} rows (002)")
+        files = write_files(tmp_dir, args.files, args.rows)
+        results = benchmark_workers(files, max_workers)
+
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    for workers, duration, speedup in results:
+        print(f"{workers:>8} {duration:>10.3f} {speedup:>7.2f}x")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "ingestion_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
@@ -0,0 +1,227 @@
+"""
+Out-of-core benchmark
+
+Peak memory, time and F1 of the in-memory and the out-of-core training
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ProcessPoolExecutor
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import pickle
+import tempfile
+import timeit
+
+# Data Science Imports
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import f1_score
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding training, featurestore and schema directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../training'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../featurestore'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../schema'))
+
+# Imports from other libraries
+import training
+from training import FEATURES, peak_memory_mb, segregate_dataset, train_out_of_core
+from featurestore import load_ingested_data, write_partition
+from schema import load_csv
+from synthetic import make_dataset
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="outofcore_benchmark",
+                            description="Out-of-core benchmark")
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Rows of the synthetic feature store",
+        default=20000000,
+        required=False
+    )
+
+    parser.add_argument("-p",
+        "--partition_rows", 
+        type=int,
+        help="Rows per feature store partition",
+        default=1000000,
+        required=False
+    )
+
+    parser.add_argument("-n",
+        "--chunksize", 
+        type=int,
+        help="Rows per chunk on out-of-core training",
+        default=100000,
+        required=False
+    )
+
+    parser.add_argument("-e",
+        "--epochs", 
+        type=int,
+        help="Passes over the data on out-of-core training",
+        default=5,
+        required=False
+    )
+
+    parser.add_argument("-t",
+        "--test_file", 
+        type=str,
+        help="Test data file where the trained models are scored",
+        default=os.path.join(RUNNING_PATH, '../../testdata/testdata.csv'),
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def train_in_memory(store_path, model_path, chunksize, epochs):
+    """
+    Load all the features and fit the training step logistic regression
+
+    :param store_path: (str) feature store directory
+    :param model_path: (str) unused, same signature than train_on_chunks
+    :param chunksize: (int) unused
+    :param epochs: (int) unused
+    :return: fitted model
+    """
+
+    X,y = segregate_dataset(load_ingested_data(None, store_path, FEATURES))
+    model = LogisticRegression(C=1.0, penalty='l2', random_state=0, solver='liblinear')
+
+    return model.fit(X,y)
+
+
+def train_on_chunks(store_path, model_path, chunksize, epochs):
+    """
+    Fit the model with the out-of-core training step
+
+    :param store_path: (str) feature store directory
+    :param model_path: (str) directory where the model is saved
+    :param chunksize: (int) rows per chunk
+    :param epochs: (int) passes over the data
+    :return: fitted model
+    """
+
+    training.LOGGER = log.getLogger("outofcore_benchmark")
+    train_out_of_core(Namespace(db_file=None, feature_store=store_path, model_path=model_path,
+                                chunksize=chunksize, epochs=epochs, threshold='f1'))
+    with open(os.path.join(model_path, 'trainedmodel.pkl'), 'rb') as file:
+        return pickle.load(file)
+
+
+def run_training(trainer, store_path, model_path, test_file, chunksize, epochs):
+    """
+    Train a model and score it, run on its own process to measure its peak memory
+
+    :param trainer: (callable) train_in_memory or train_on_chunks
+    :param store_path: (str) feature store directory
+    :param model_path: (str) directory where the model is saved
+    :param test_file: (str) csv test file
+    :param chunksize: (int) rows per chunk
+    :param epochs: (int) passes over the data
+    :return: (seconds, peak memory MB over the process baseline, F1 score)
+    """
+
+    baseline = peak_memory_mb()
+    start_time = timeit.default_timer()
+    model = trainer(store_path, model_path, chunksize, epochs)
+    duration = timeit.default_timer() - start_time
+    peak = peak_memory_mb()
+    X_test, y_test = segregate_dataset(load_csv(test_file, FEATURES))
+
+    return duration, peak - baseline, f1_score(y_test, model.predict(X_test))
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store_path = os.path.join(tmp_dir, 'feature_store')
+        for number, start in enumerate(range(0, args.rows, args.partition_rows)):
+            rows = min(args.partition_rows, args.rows - start)
+            write_partition(store_path, make_dataset(rows, seed=number), f"{number:06d}")
+        LOGGER.info(f"Feature store of {args.rows} rows generated (001)")
+
+        for label, trainer in [("in-memory", train_in_memory), ("out-of-core", train_on_chunks)]:
+            # a new process per training, so the peak memory of one doesn't hide the other
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                duration, peak, f1 = executor.submit(run_training, trainer, store_path, tmp_dir,
+                                                     args.test_file, args.chunksize,
+                                                     args.epochs).result()
+            LOGGER.info(f"{label}: {duration:.3f} s {peak:.1f} MB F1 {f1:.4f} (002)")
+            results.append((label, duration, peak, f1))
+
+    print(f"{'training':>12} {'seconds':>10} {'peak MB':>10} {'F1':>8}")
+    for label, duration, peak, f1 in results:
+        print(f"{label:>12} {duration:>10.3f} {peak:>10.1f} {f1:>8.4f}")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "outofcore_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
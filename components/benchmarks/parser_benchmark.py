@@ -0,0 +1,159 @@
+"""
+Parser benchmark
+
+Throughput of the single thread and blocks csv parsers on a large file
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import tempfile
+import timeit
+
+# Data Science Imports
+import pandas as pd
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding ingestion directory to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../ingestion'))
+
+# Imports from other libraries
+from ingestion import read_csv
+from synthetic import write_large_file
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="parser_benchmark",
+                            description="Parser benchmark")
+
+    parser.add_argument("-s",
+        "--size", 
+        type=int,
+        help="Size in MB of the synthetic csv file",
+        default=4096,
+        required=False
+    )
+
+    parser.add_argument("-b",
+        "--block_size", 
+        type=int,
+        help="Block size in MB of the blocks parser",
+        default=64,
+        required=False
+    )
+
+    parser.add_argument("-w",
+        "--max_workers", 
+        type=int,
+        help="Maximum threads benchmarked, 0 uses all the cores",
+        default=0,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def time_parser(label, reader):
+    """
+    Time a csv parser
+
+    :param label: (str) parser name
+    :param reader: (callable) function returning the parsed dataframe
+    :return: (label, seconds, rows)
+    """
+
+    start_time = timeit.default_timer()
+    dataset = reader()
+    duration = timeit.default_timer() - start_time
+    LOGGER.info(f"{label}: {len(dataset)} rows {duration:.3f} s (001)")
+
+    return label, duration, len(dataset)
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    max_workers = args.max_workers if args.max_workers > 0 else os.cpu_count()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, "dataset.csv")
+        LOGGER.info(f"Generating a file of {args.size} MB (002)")
+        write_large_file(filename, args.size)
+        size = os.path.getsize(filename) / 2**20
+        results = [time_parser("pd.read_csv", lambda: pd.read_csv(filename)),
+                   time_parser("pandas", lambda: read_csv(filename))]
+        # 1, 2, 4, ... threads up to max_workers
+        for workers in sorted({min(2**i, max_workers) for i in range(max_workers.bit_length() + 1)}):
+            results.append(time_parser(f"blocks x{workers}",
+                                       lambda: read_csv(filename, 'blocks', workers, args.block_size)))
+
+    baseline = results[0][1]
+    print(f"{'parser':>12} {'seconds':>10} {'MB/s':>9} {'speedup':>8}")
+    for label, duration, _ in results:
+        print(f"{label:>12} {duration:>10.3f} {size / duration:>9.1f} {baseline / duration:>7.2f}x")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "parser_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
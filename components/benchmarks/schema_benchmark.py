@@ -0,0 +1,142 @@
+"""
+Schema benchmark
+
+Memory report and parse time of the csv files with inferred and declared types
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import tempfile
+import timeit
+
+# Data Science Imports
+import pandas as pd
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding schema directory to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../schema'))
+
+# Imports from other libraries
+from schema import load_csv
+from synthetic import write_files
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="schema_benchmark",
+                            description="Schema benchmark")
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Rows of the synthetic csv file",
+        default=5000000,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def memory_report(dataset):
+    """
+    Memory used by every column of a dataset
+
+    :param dataset: (DataFrame) dataset to measure
+    :return: dict with the dtype and MB of every column and the total
+    """
+
+    usage = dataset.memory_usage(index=False, deep=True) / 2**20
+    report = {col: (str(dataset[col].dtype), usage[col]) for col in dataset.columns}
+    report['total'] = ('', usage.sum())
+
+    return report
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    reports = {}
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = write_files(tmp_dir, 1, args.rows)[0]
+        for label, reader in [("inferred", pd.read_csv), ("declared", load_csv)]:
+            start_time = timeit.default_timer()
+            dataset = reader(filename)
+            timings[label] = timeit.default_timer() - start_time
+            reports[label] = memory_report(dataset)
+            LOGGER.info(f"{label}: {timings[label]:.3f} s {reports[label]['total'][1]:.1f} MB (001)")
+            del dataset
+
+    print(f"{'column':>20} {'inferred':>16} {'MB':>9} {'declared':>10} {'MB':>9}")
+    for col in reports['inferred']:
+        inferred_type, inferred_mb = reports['inferred'][col]
+        declared_type, declared_mb = reports['declared'][col]
+        print(f"{col:>20} {inferred_type:>16} {inferred_mb:>9.1f} {declared_type:>10} {declared_mb:>9.1f}")
+    print(f"{'parse seconds':>20} {'':>16} {timings['inferred']:>9.3f} {'':>10} {timings['declared']:>9.3f}")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "schema_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
@@ -0,0 +1,138 @@
+"""
+Search benchmark
+
+Wall-clock of the hyperparameter search from one process to all the cores
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import timeit
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding training directory to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../training'))
+
+# Imports from other libraries
+from training import cross_validate, search_candidates, segregate_dataset
+from synthetic import make_dataset
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="search_benchmark",
+                            description="Search benchmark")
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Rows of the synthetic dataset",
+        default=500000,
+        required=False
+    )
+
+    parser.add_argument("-k",
+        "--folds", 
+        type=int,
+        help="Cross validation folds",
+        default=5,
+        required=False
+    )
+
+    parser.add_argument("-w",
+        "--max_workers", 
+        type=int,
+        help="Maximum processes benchmarked, 0 uses all the cores",
+        default=0,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    max_workers = args.max_workers if args.max_workers > 0 else os.cpu_count()
+    X,y = segregate_dataset(make_dataset(args.rows))
+    candidates = search_candidates(-1)
+    results = []
+    # 1, 2, 4, ... processes up to max_workers
+    for workers in sorted({min(2**i, max_workers) for i in range(max_workers.bit_length() + 1)}):
+        start_time = timeit.default_timer()
+        cross_validate(X, y, candidates, args.folds, workers)
+        duration = timeit.default_timer() - start_time
+        LOGGER.info(f"{workers} workers: {duration:.3f} s (001)")
+        results.append((workers, duration))
+
+    print(f"{len(candidates)} candidates x {args.folds} folds on {args.rows} rows")
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8} {'efficiency':>11}")
+    for workers, duration in results:
+        speedup = results[0][1] / duration
+        print(f"{workers:>8} {duration:>10.3f} {speedup:>7.2f}x {speedup / workers:>10.0%}")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "search_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
@@ -0,0 +1,88 @@
+"""
+Synthetic data
+
+Generate synthetic churn datasets for the benchmarks
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+import os
+import string
+
+# Data Science Imports
+import numpy as np
+import pandas as pd
+
+
+def make_dataset(rows, seed=0, corporations=2000):
+    """
+    Generate a synthetic dataset with the churn data columns
+
+    :param rows: (int) number of rows
+    :param seed: (int) random generator seed
+    :param corporations: (int) distinct corporation codes
+    :return: pandas' dataframe
+    """
+
+    rng = np.random.default_rng(seed)
+    letters = np.array(list(string.ascii_lowercase))
+    codes = np.array(["".join(chars) for chars in
+                      np.random.default_rng(0).choice(letters, size=(corporations, 4))])
+    corporation = codes[rng.integers(0, corporations, size=rows)]
+    lastmonth_activity = rng.integers(0, 2000, size=rows)
+    lastyear_activity = rng.integers(0, 5000, size=rows)
+    number_of_employees = rng.integers(1, 1000, size=rows)
+    # churn probability decreasing with the activity
+    logit = 1.5 - 0.004 * lastmonth_activity - 0.0003 * lastyear_activity
+    exited = (rng.random(rows) < 1 / (1 + np.exp(-logit))).astype(int)
+
+    return pd.DataFrame({'corporation': corporation,
+                         'lastmonth_activity': lastmonth_activity,
+                         'lastyear_activity': lastyear_activity,
+                         'number_of_employees': number_of_employees,
+                         'exited': exited})
+
+
+def write_files(path, files, rows, seed=0, extension=".csv"):
+    """
+    Write synthetic csv files
+
+    :param path: (str) directory where the files are written
+    :param files: (int) number of files
+    :param rows: (int) rows per file
+    :param seed: (int) random generator seed
+    :param extension: (str) file extension, compressed when it is .csv.gz, .csv.zst, etc.
+    :return: list with the files written
+    """
+
+    filenames = []
+    for i in range(files):
+        filename = os.path.join(path, f"dataset{i:05d}{extension}")
+        make_dataset(rows, seed + i).to_csv(filename, index=False)
+        filenames.append(filename)
+
+    return filenames
+
+
+def write_large_file(filename, size_mb, seed=0, rows_per_write=1000000):
+    """
+    Write a synthetic csv file of a given size, appending the rows by pieces
+
+    :param filename: (str) csv file written
+    :param size_mb: (int) minimum file size in MB
+    :param seed: (int) random generator seed
+    :param rows_per_write: (int) rows generated and appended per piece
+    :return: rows written
+    """
+
+    rows = 0
+    with open(filename, 'w', newline='') as file:
+        while file.tell() < size_mb * 2**20:
+            make_dataset(rows_per_write, seed + rows).to_csv(file, header=rows == 0, index=False)
+            rows += rows_per_write
+
+    return rows
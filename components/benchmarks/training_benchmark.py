@@ -0,0 +1,177 @@
+"""
+Training benchmark
+
+Retrain time and F1 of the full refit and the incremental training
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import ArgumentParser
+import logging as log
+import logging.handlers
+import sys
+import os
+import platform
+import timeit
+
+# Data Science Imports
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import f1_score
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding training directory to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../training'))
+
+# Imports from other libraries
+from training import build_incremental_model, partial_fit_model, segregate_dataset
+from synthetic import make_dataset
+
+# Main Logger
+LOGHANDLER = None
+LOGGER = None
+LOGLEVEL_ = logging.INFO
+
+
+def build_argparser():
+    """
+    Parse command line arguments.
+
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(prog="training_benchmark",
+                            description="Training benchmark")
+
+    parser.add_argument("-r",
+        "--rows", 
+        type=int,
+        help="Rows of the initial synthetic dataset",
+        default=1000000,
+        required=False
+    )
+
+    parser.add_argument("-b",
+        "--batches", 
+        type=int,
+        help="New batches ingested after the initial dataset",
+        default=5,
+        required=False
+    )
+
+    parser.add_argument("-n",
+        "--batch_rows", 
+        type=int,
+        help="Rows per new batch",
+        default=100000,
+        required=False
+    )
+
+    parser.add_argument("-e",
+        "--epochs", 
+        type=int,
+        help="Passes over the new rows on incremental training",
+        default=5,
+        required=False
+    )
+
+    return parser.parse_args()
+
+
+def full_refit(dataset):
+    """
+    Refit the training step logistic regression on all the rows
+
+    :param dataset: (DataFrame) all the ingested rows
+    :return: fitted model
+    """
+
+    X,y = segregate_dataset(dataset)
+    model = LogisticRegression(C=1.0, penalty='l2', random_state=0, solver='liblinear')
+
+    return model.fit(X,y)
+
+
+def main(args):
+    """
+    Run the main function
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    X_test, y_test = segregate_dataset(make_dataset(args.batch_rows, seed=args.batches + 1))
+    dataset = make_dataset(args.rows, seed=0)
+    model = partial_fit_model(build_incremental_model(), *segregate_dataset(dataset), args.epochs)
+
+    results = []
+    for batch in range(1, args.batches + 1):
+        new_rows = make_dataset(args.batch_rows, seed=batch)
+        dataset = pd.concat([dataset, new_rows], ignore_index=True)
+
+        start_time = timeit.default_timer()
+        full_model = full_refit(dataset)
+        full_time = timeit.default_timer() - start_time
+
+        start_time = timeit.default_timer()
+        partial_fit_model(model, *segregate_dataset(new_rows), args.epochs)
+        incremental_time = timeit.default_timer() - start_time
+
+        full_f1 = f1_score(y_test, full_model.predict(X_test))
+        incremental_f1 = f1_score(y_test, model.predict(X_test))
+        LOGGER.info(f"batch {batch}: full {full_time:.3f} s F1 {full_f1:.4f}, "
+                    f"incremental {incremental_time:.3f} s F1 {incremental_f1:.4f} (001)")
+        results.append((batch, len(dataset), full_time, incremental_time, full_f1, incremental_f1))
+
+    print(f"{'batch':>6} {'rows':>10} {'full s':>9} {'incr s':>9} {'speedup':>8} "
+          f"{'full F1':>8} {'incr F1':>8} {'F1 gap':>8}")
+    for batch, rows, full_time, incremental_time, full_f1, incremental_f1 in results:
+        print(f"{batch:>6} {rows:>10} {full_time:>9.3f} {incremental_time:>9.3f} "
+              f"{full_time / incremental_time:>7.1f}x {full_f1:>8.4f} {incremental_f1:>8.4f} "
+              f"{full_f1 - incremental_f1:>8.4f}")
+
+
+if __name__ == '__main__':
+
+    computer_name = platform.node()
+    SCRIPT_NAME = "training_benchmark"
+    loggPath = os.path.join(".","log")
+    if not os.path.isdir(loggPath):
+        try:
+            # mode forced due security
+            MODE = 0o770
+            os.mkdir(loggPath, mode=MODE)
+        except OSError as error:
+            print(error)
+            sys.exit(-1)
+    LogFileName = os.path.join(loggPath,
+                               computer_name + '-' + SCRIPT_NAME + '.log')
+    # Configure the logger
+    LOGGER = log.getLogger(SCRIPT_NAME)  # Get Logger
+    # Add the log message file handler to the logger
+    LOGHANDLER = log.handlers.RotatingFileHandler(LogFileName,
+                                                  maxBytes=10485760,
+                                                  backupCount=10)
+    # Logger Formater
+    logFormatter = log.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s: %(message)s',
+                                datefmt='%Y/%m/%d %H:%M:%S')
+    LOGHANDLER.setFormatter(logFormatter)
+    # Add handler to logger
+    if 'LOGHANDLER' in globals():
+        LOGGER.addHandler(LOGHANDLER)
+    else:
+        LOGGER.debug("logHandler NOT defined (001)")
+    # Set Logger Lever
+    LOGGER.setLevel(LOGLEVEL_)
+    # Start Running
+    LOGGER.debug("Running... (001)")
+    args = build_argparser()
+    main(args)
+    LOGGER.debug("Finished. (001)")
@@ -0,0 +1,162 @@
+"""
+Artifact cache
+
+Local content addressed cache of the pipeline artifacts with LRU eviction
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+import hashlib
+import json
+import os
+import shutil
+
+# Data Science Imports
+import pandas as pd
+
+# Cache file extension
+ENTRY_EXTENSION = ".pkl"
+# Digests computed by this process, keyed on the file path, size and mtime
+DIGESTS = {}
+
+
+def fingerprint(dataset, config):
+    """
+    Fingerprint of a dataset and the configuration applied to it
+
+    The rows are hashed with their values and order, the column names
+    and types are part of the configuration hashed.
+
+    :param dataset: (DataFrame) dataset
+    :param config: (dict) json serializable configuration
+    :return: (str) hexadecimal SHA-256 digest
+    """
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps({'config': config,
+                              'columns': [[col, str(dtype)] for col, dtype in dataset.dtypes.items()]},
+                             sort_keys=True, default=str).encode())
+    digest.update(pd.util.hash_pandas_object(dataset, index=False).to_numpy().tobytes())
+
+    return digest.hexdigest()
+
+
+def file_digest(filename, block_size=2**20):
+    """
+    Compute the SHA-256 digest of the file content
+
+    The compressed files are hashed as they are stored, so the digest is
+    the identity of the file received.
+
+    :param filename: (str) file to hash
+    :param block_size: (int) bytes read per block
+    :return: (str) hexadecimal digest
+    """
+
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def cached_digest(filename):
+    """
+    Digest of a file, hashed again only when its size or mtime change
+
+    :param filename: (str) file to hash
+    :return: (str) hexadecimal digest
+    """
+
+    stat = os.stat(filename)
+    key = (os.path.realpath(filename), stat.st_size, stat.st_mtime_ns)
+    if key not in DIGESTS:
+        DIGESTS[key] = file_digest(filename)
+
+    return DIGESTS[key]
+
+
+def entry_file(cache_path, key):
+    """
+    File of a cache entry
+
+    :param cache_path: (str) cache directory
+    :param key: (str) entry fingerprint
+    :return: (str) entry file
+    """
+
+    return os.path.join(cache_path, key + ENTRY_EXTENSION)
+
+
+def get_entry(cache_path, key, target_file):
+    """
+    Copy a cached artifact to the target file
+
+    The entry mtime is updated on every hit, so the eviction removes the
+    least recently used entries first.
+
+    :param cache_path: (str) cache directory
+    :param key: (str) entry fingerprint
+    :param target_file: (str) file where the artifact is copied
+    :return: True on a hit, False on a miss
+    """
+
+    source = entry_file(cache_path, key)
+    if not cache_path or not os.path.isfile(source):
+        return False
+    shutil.copyfile(source, target_file)
+    os.utime(source)
+
+    return True
+
+
+def put_entry(cache_path, key, source_file, max_size_mb):
+    """
+    Store an artifact on the cache and evict the entries over the size limit
+
+    :param cache_path: (str) cache directory
+    :param key: (str) entry fingerprint
+    :param source_file: (str) artifact file
+    :param max_size_mb: (int) cache size limit in MB
+    :return: list of the evicted entries
+    """
+
+    os.makedirs(cache_path, exist_ok=True)
+    # copied to a temporary name first, so a partial entry is never a hit
+    target = entry_file(cache_path, key)
+    shutil.copyfile(source_file, target + ".tmp")
+    os.replace(target + ".tmp", target)
+
+    return evict(cache_path, max_size_mb)
+
+
+def evict(cache_path, max_size_mb):
+    """
+    Remove the least recently used entries until the cache fits its size limit
+
+    :param cache_path: (str) cache directory
+    :param max_size_mb: (int) cache size limit in MB
+    :return: list of the evicted entries
+    """
+
+    entries = []
+    for name in os.listdir(cache_path):
+        if name.endswith(ENTRY_EXTENSION):
+            stat = os.stat(os.path.join(cache_path, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+    entries.sort()
+    size = sum(entry[1] for entry in entries)
+    evicted = []
+    for _, entry_size, name in entries:
+        if size <= max_size_mb * 2**20:
+            break
+        os.remove(os.path.join(cache_path, name))
+        size -= entry_size
+        evicted.append(name[:-len(ENTRY_EXTENSION)])
+
+    return evicted
@@ -0,0 +1,237 @@
+"""
+Database
+
+Shared SQLite access layer of the pipeline steps
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Data Science Imports
+import pandas as pd
+
+# Data Base Imports
+import sqlite3 as db
+
+# Connection tuning
+CACHE_SIZE_MB = 64
+MMAP_SIZE_MB = 256
+# Rows inserted per executemany call
+BATCH_SIZE = 50000
+
+# Indexes of the columns the pipeline filters and sorts on
+INDEXES = {
+    'model_score': ['date'],
+    'model_test_score': ['date'],
+    'ingested_files': ['file'],
+    'training_leaderboard': ['date'],
+    'score_cache': ['model_digest'],
+    'model_comparison': ['date'],
+    'ingested_batches': ['batch'],
+    'batch_score': ['batch'],
+}
+
+# Comparison operators accepted on the query filters
+OPERATORS = {'=', '!=', '<', '<=', '>', '>=', 'IN'}
+
+
+def connect(db_file, cache_size_mb=CACHE_SIZE_MB, mmap_size_mb=MMAP_SIZE_MB):
+    """
+    Open a connection to the database tuned for bulk loads
+
+    The database is switched to WAL journaling, so readers don't block the
+    writer, and with synchronous NORMAL the commits don't wait for a disk
+    flush, only the checkpoints do.
+
+    :param db_file: (str) database file, created if it doesn't exist
+    :param cache_size_mb: (int) page cache size in MB
+    :param mmap_size_mb: (int) memory mapped I/O size in MB
+    :return: database connection
+    """
+
+    conn = db.connect(db_file)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{cache_size_mb * 1024}")
+    conn.execute(f"PRAGMA mmap_size = {mmap_size_mb * 2**20}")
+
+    return conn
+
+
+def table_exists(conn, table):
+    """
+    Check if a table exists on the database
+
+    :param conn: database connection
+    :param table: (str) table's name
+    :return: True if the table exists
+    """
+
+    cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                          (table,))
+    return cursor.fetchone() is not None
+
+
+def sql_type(dtype):
+    """
+    SQLite column type of a pandas' dtype, as DataFrame.to_sql maps them
+
+    :param dtype: pandas' dtype
+    :return: (str) SQLite type
+    """
+
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "TIMESTAMP"
+    return "TEXT"
+
+
+def column_values(column):
+    """
+    Convert a column to a list of python values that SQLite can bind
+
+    Missing values are converted to None.
+
+    :param column: (Series) column to convert
+    :return: list of values
+    """
+
+    if pd.api.types.is_datetime64_any_dtype(column.dtype):
+        column = column.map(lambda value: value.isoformat(sep=' ') if pd.notna(value) else None)
+    elif column.hasnans:
+        column = column.astype(object).where(column.notna(), None)
+
+    return column.tolist()
+
+
+def create_table(conn, table, dataset, if_exists="append"):
+    """
+    Create a table with the columns of a dataset
+
+    :param conn: database connection
+    :param table: (str) table's name
+    :param dataset: (DataFrame) dataset whose columns are created
+    :param if_exists: (str) 'replace' drops the current table, 'append' keeps it
+    :return: None
+    """
+
+    if if_exists == "replace":
+        conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    columns = ", ".join(f'"{col}" {sql_type(dtype)}'
+                        for col, dtype in dataset.dtypes.items())
+    conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({columns})')
+
+
+def write_table(conn, table, dataset, if_exists="append", batch_size=BATCH_SIZE):
+    """
+    Write a dataset into a table with bulk inserts
+
+    The rows are inserted with executemany on batches of batch_size rows
+    inside the connection's transaction, the caller commits it. The
+    indexes declared on INDEXES for the table are created if missing.
+
+    :param conn: database connection
+    :param table: (str) table's name
+    :param dataset: (DataFrame) rows to write
+    :param if_exists: (str) 'replace' recreates the table, 'append' adds the rows
+    :param batch_size: (int) rows per executemany call
+    :return: rows written
+    """
+
+    create_table(conn, table, dataset, if_exists)
+    create_indexes(conn, table)
+    columns = ", ".join(f'"{col}"' for col in dataset.columns)
+    placeholders = ", ".join("?" * len(dataset.columns))
+    statement = f'INSERT INTO "{table}" ({columns}) VALUES ({placeholders})'
+    for start in range(0, len(dataset), batch_size):
+        batch = dataset.iloc[start:start + batch_size]
+        conn.executemany(statement,
+                         zip(*[column_values(batch[col]) for col in batch.columns]))
+
+    return len(dataset)
+
+
+def create_indexes(conn, table):
+    """
+    Create the indexes declared on INDEXES for a table
+
+    :param conn: database connection
+    :param table: (str) table's name
+    :return: None
+    """
+
+    for col in INDEXES.get(table, []):
+        conn.execute(f'CREATE INDEX IF NOT EXISTS "{table}_{col}" ON "{table}" ("{col}")')
+
+
+def build_query(table, columns=None, filters=None, order_by=None, limit=None):
+    """
+    Build a SELECT statement reading only the columns and rows required
+
+    :param table: (str) table's name
+    :param columns: (list) columns to read, None reads all
+    :param filters: (list) (column, operator, value) conditions joined with AND,
+                    the 'IN' operator takes a list of values
+    :param order_by: (list) (column, 'ASC' or 'DESC') sort keys
+    :param limit: (int) maximum rows returned
+    :return: (str, list) SQL statement and its parameters
+    """
+
+    projection = ", ".join(f'"{col}"' for col in columns) if columns else "*"
+    statement = f'SELECT {projection} FROM "{table}"'
+    params = []
+    if filters:
+        conditions = []
+        for col, operator, value in filters:
+            operator = operator.upper()
+            if operator not in OPERATORS:
+                raise ValueError(f"Operator {operator} not supported")
+            if operator == 'IN':
+                conditions.append(f'"{col}" IN ({", ".join("?" * len(value))})')
+                params.extend(value)
+            else:
+                conditions.append(f'"{col}" {operator} ?')
+                params.append(value)
+        statement += " WHERE " + " AND ".join(conditions)
+    if order_by:
+        keys = []
+        for col, direction in order_by:
+            direction = direction.upper()
+            if direction not in ('ASC', 'DESC'):
+                raise ValueError(f"Sort direction {direction} not supported")
+            keys.append(f'"{col}" {direction}')
+        statement += " ORDER BY " + ", ".join(keys)
+    if limit is not None:
+        statement += " LIMIT ?"
+        params.append(int(limit))
+
+    return statement, params
+
+
+def read_query(conn, table, columns=None, filters=None, order_by=None, limit=None,
+               chunksize=None):
+    """
+    Read the columns and rows required from a table
+
+    The projection, filters, sorting and limit are pushed down to SQLite,
+    so the rows read depend on the query and not on the table size when
+    the filtered and sorted columns are indexed.
+
+    :param conn: database connection
+    :param table: (str) table's name
+    :param columns: (list) columns to read, None reads all
+    :param filters: (list) (column, operator, value) conditions joined with AND
+    :param order_by: (list) (column, 'ASC' or 'DESC') sort keys
+    :param limit: (int) maximum rows returned
+    :param chunksize: (int) rows per chunk, None reads all at once
+    :return: pandas' dataframe or iterator of dataframes when chunksize is given
+    """
+
+    statement, params = build_query(table, columns, filters, order_by, limit)
+
+    return pd.read_sql_query(statement, conn, params=params, chunksize=chunksize)
@@ -4,9 +4,10 @@ Model Deployment
 MLFlow model deployment step
 
 By: Julian Bolivar
-Version: 1.0.0
+Version: 1.1.0
 Date:  2023-06-14
 Revision 1.0.0 (2023-06-14): Initial Release
+Revision 1.1.0 (2026-10-17): Deploys the compact model artifact
 """
 
 # Main System Imports
@@ -74,7 +75,7 @@ def main(args):
     files = os.listdir(args.model_path)
     files = [os.path.join(args.model_path, f) for f in os.listdir(args.model_path)
             if os.path.isfile(os.path.join(args.model_path, f))
-            and (f.endswith(".txt") or f.endswith(".pkl") )  ]
+            and (f.endswith(".txt") or f.endswith(".pkl") or f.endswith(".bin"))  ]
     files.append(args.ingested_files)
     # Clean deploy path
     if os.path.exists(args.deploy_path):
@@ -83,7 +84,11 @@ def main(args):
     # Move files ot deploy path
     for file in files:
         try:
-            shutil.move(file, args.deploy_path)
+            if os.path.basename(file) == 'trainingstate.pkl':
+                # the incremental training checkpoint stays on the model path
+                shutil.copy(file, args.deploy_path)
+            else:
+                shutil.move(file, args.deploy_path)
         except Exception as err:
                 LOGGER.error(f"Coping File {file} error (001)\n{err}")
         else:
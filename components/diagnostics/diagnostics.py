@@ -4,9 +4,10 @@ Model and data diagnostics
 Perform the model and the data diagnostics and generate reports
 
 By: Julian Bolivar
-Version: 1.0.0
+Version: 1.1.0
 Date:  2023/06/18
 Revision 1.0.0 (2023/06/18): Initial Release
+Revision 1.1.0 (2026/10/17): Inference engine, chunked predictions, feature store and schema loads
 """
 
 # Main System Imports
@@ -16,7 +17,6 @@ import logging.handlers
 import sys
 import os
 import platform
-import pickle
 from io import StringIO
 import subprocess
 import timeit
@@ -28,16 +28,21 @@ import sqlite3 as db
 # Machine learning imports
 import pandas as pd
 import numpy as np
-from sklearn import metrics
 
 # Get the running script path
 RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
 
-# adding training directory to the system path
-sys.path.insert(0, os.path.join(RUNNING_PATH, '../training'))
+# adding featurestore, database, schema and inference directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../featurestore'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../database'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../schema'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../inference'))
 
 # Imports from other libraries
-from training import segregate_dataset
+from featurestore import load_ingested_data, read_columns, store_available
+from database import connect, write_table
+from schema import FEATURES, load_csv, segregate_dataset
+from inference import confusion_matrix, confusion_scores, load_engine
 
 # Main Logger
 LOGHANDLER = None
@@ -88,45 +93,78 @@ def build_argparser():
         required=False
     )
 
+    parser.add_argument("-f",
+        "--feature_store", 
+        type=str,
+        help="Columnar feature store, used instead of the database when available",
+        default=os.path.join(RUNNING_PATH,'../../ingesteddata/feature_store'),
+        required=False
+    )
+
+    parser.add_argument("-n",
+        "--chunksize", 
+        type=int,
+        help="Test rows predicted per chunk, streaming the test data, 0 loads all at once",
+        default=0,
+        required=False
+    )
+
     return parser.parse_args()
 
 
-def model_predictions(model_path, test_data_path, db_path, LOGGER_=LOGGER):
+def model_predictions(model_path, test_data_path, db_path, LOGGER_=LOGGER, chunksize=0):
     """
     read the deployed model and a test dataset, calculate predictions F1 Score
     and estor it on the database
+
+    With a chunksize the test data is streamed, each chunk's predictions
+    are only added to a confusion matrix, so the memory doesn't grow with
+    the test data, and the score is returned instead of the predictions.
     
     :param model_path: (str) Model to be tested
     :param test_data_path: (str) Add noise using the epsilon-greedy policy
     :param db_path: (str) Add noise using the epsilon-greedy policy
     :param LOGGER_: System Log manager
-    :return: list of predictions from deployed model
+    :param chunksize: (int) test rows predicted per chunk, 0 loads them all at once
+    :return: list of predictions from deployed model, the F1 score with a chunksize
     """
 
-    # load test dataset
-    dataset = pd.read_csv(test_data_path)
+    # collect deployed model, evaluated by the inference engine when it
+    # has a compact artifact
+    model = load_engine(model_path)
+
+    if chunksize > 0:
+        # stream the test dataset, only the model features
+        confusion = np.zeros((2, 2), dtype=np.int64)
+        for chunk in load_csv(test_data_path, FEATURES, chunksize=chunksize):
+            X, y = segregate_dataset(chunk)
+            chunk_yhat = model.predict(X)
+            # Verify data input and output length
+            assert len(chunk_yhat) == len(y), "length for input and output must be the same"
+            confusion += confusion_matrix(y, chunk_yhat)
+        score = confusion_scores(confusion)['f1']
+        LOGGER_.info(f"{confusion.sum()} test rows predicted by chunks of {chunksize} (001)")
+    else:
+        # load test dataset, only the model features
+        dataset = load_csv(test_data_path, FEATURES)
 
-    # collect deployed model
-    with open(model_path, 'rb') as file:
-        model = pickle.load(file)
+        # segregate test dataset
+        X, y = segregate_dataset(dataset)
 
-    # segregate test dataset
-    X, y = segregate_dataset(dataset)
+        # evaluate model on test set
+        yhat = model.predict(X)
 
-    # evaluate model on test set
-    yhat = model.predict(X)
+        # Verify data input and output length
+        if len(yhat) != len(y):
+            LOGGER_.error(f"length for input ({len(y)}) and output ({len(yhat)}) must be the same (001)")
+        assert len(yhat) == len(y), "length for input and output must be the same"
 
-    # Verify data input and output length
-    if len(yhat) != len(y):
-        LOGGER_.error(f"length for input ({len(y)}) and output ({len(yhat)}) must be the same (001)")
-    assert len(yhat) == len(y), "length for input and output must be the same"
-    
-    # Score model on test set
-    score = metrics.f1_score(y, yhat)
+        # Score model on test set
+        score = confusion_scores(confusion_matrix(y, yhat))['f1']
 
     # upate score table
     #connect to a database, creating it if it doesn't exist 
-    conn = db.connect(db_path)
+    conn = connect(db_path)
     LOGGER_.info(f"Database Data File: {db_path} (001)")
     if conn is not None:
         try: 
@@ -136,9 +174,9 @@ def model_predictions(model_path, test_data_path, db_path, LOGGER_=LOGGER):
             score_reg = {'date': [now,], 'score': [score,]}
             scores_df = pd.DataFrame(score_reg)
             # Save score record into database
-            scores_df.to_sql("model_test_score", conn, if_exists='append', index=False)
+            write_table(conn, "model_test_score", scores_df, if_exists='append')
             LOGGER_.info(f"Score recorded in 'model_score' table into {db_path} (001)")
-        except ValueError as err:
+        except (ValueError, db.Error) as err:
             # if exception occour Rollback
             conn.rollback()
             LOGGER_.error(f"Can't update table 'model_test_score' in {db_path} (001)\n{err}")
@@ -153,40 +191,28 @@ def model_predictions(model_path, test_data_path, db_path, LOGGER_=LOGGER):
     else:
         LOGGER_.error(f"Can't connect with {db_path} (001)")
 
-    return yhat
+    return score if chunksize > 0 else yhat
 
 
-def dataframe_summary(db_path, LOGGER_=LOGGER):
+def dataframe_summary(db_path, LOGGER_=LOGGER, feature_store=None):
     """
     Calculate summary statistics on the dataset columns
 
     :param db_path: (str) Add noise using the epsilon-greedy policy
     :param LOGGER_: System Log manager
+    :param feature_store: (str) columnar feature store, used when available
     :return: list with dataframe's means, medians and stddevs 
     """
 
-    #connect to a database, creating it if it doesn't exist 
-    conn = db.connect(db_path)
-    LOGGER_.info(f"Database Data File: {db_path} (002)")
-
-    if conn is not None:
-        try: 
-            dataset = pd.read_sql_query("select * from ingested_data",conn)
-            LOGGER_.info(f"Ingested Data table loaded from {db_path} (003)")  
-        except ValueError:
-            # if exception occour Rollback
-            conn.rollback()
-            LOGGER_.error(f"Can't read table 'ingested_data' in {db_path} (005)")
-        finally:
-            # close out the connection
-            conn.close()
-            LOGGER_.debug(f"Connection Closed (007)")
-    else:
-        LOGGER_.error(f"Can't connect with {db_path} (008)")
+    # only the numeric columns are read from the feature store
+    columns = None
+    if store_available(feature_store):
+        columns = [col for col, dtype in read_columns(feature_store).items()
+                   if pd.api.types.is_numeric_dtype(dtype)]
+    dataset = load_ingested_data(db_path, feature_store, columns, LOGGER_)
 
     # Select numeric columns
-    numeric_col_index = np.where(dataset.dtypes != object)[0]
-    numeric_col = dataset.columns[numeric_col_index].tolist()
+    numeric_col = dataset.select_dtypes(include='number').columns.tolist()
 
     # compute statistics per numeric column
     means = dataset[numeric_col].mean(axis=0).tolist()
@@ -200,34 +226,18 @@ def dataframe_summary(db_path, LOGGER_=LOGGER):
     return statistics
 
 
-def missing_data(db_path, LOGGER_=LOGGER):
+def missing_data(db_path, LOGGER_=LOGGER, feature_store=None):
     """
     calculate missing data on the dataset
     return % of missing data per column
 
     :param db_path: (str) Add noise using the epsilon-greedy policy
     :param LOGGER_: System Log manager
+    :param feature_store: (str) columnar feature store, used when available
     :return: list with dataframe's % missing data per column 
     """
 
-    #connect to a database, creating it if it doesn't exist 
-    conn = db.connect(db_path)
-    LOGGER_.info(f"Database Data File: {db_path} (002)")
-
-    if conn is not None:
-        try: 
-            dataset = pd.read_sql_query("select * from ingested_data",conn)
-            LOGGER_.info(f"Ingested Data table loaded from {db_path} (003)")  
-        except ValueError:
-            # if exception occour Rollback
-            conn.rollback()
-            LOGGER_.error(f"Can't read table 'ingested_data' in {db_path} (005)")
-        finally:
-            # close out the connection
-            conn.close()
-            LOGGER_.debug(f"Connection Closed (007)")
-    else:
-        LOGGER_.error(f"Can't connect with {db_path} (008)")
+    dataset = load_ingested_data(db_path, feature_store, None, LOGGER_)
 
     # compute missing data % per column
     missing_data = dataset.isna().sum(axis=0)
@@ -323,9 +333,9 @@ def main(args):
 
     global LOGGER
 
-    _ = model_predictions(args.model_path, args.test_data_file, args.db_path, LOGGER)
-    _ = dataframe_summary(args.db_path, LOGGER)
-    _ = missing_data(args.db_path, LOGGER)
+    _ = model_predictions(args.model_path, args.test_data_file, args.db_path, LOGGER, args.chunksize)
+    _ = dataframe_summary(args.db_path, LOGGER, args.feature_store)
+    _ = missing_data(args.db_path, LOGGER, args.feature_store)
     _ = execution_time()
     _ = outdated_packages_list()
 
@@ -0,0 +1,223 @@
+"""
+Feature store
+
+Columnar feature store of the ingested data on Parquet files
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+import logging as log
+import sys
+import os
+import shutil
+
+# Columnar storage imports, the store is disabled when not installed
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# True when the columnar store can be used
+ARROW_AVAILABLE = pa is not None
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
+
+# adding database and schema directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../database'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../schema'))
+
+# Imports from other libraries
+from database import connect, read_query
+from schema import apply_schema
+
+
+def store_available(store_path):
+    """
+    Check if the feature store can be read
+
+    :param store_path: (str) feature store directory
+    :return: True if pyarrow is installed and the store has partitions
+    """
+
+    return (ARROW_AVAILABLE and bool(store_path) and os.path.isdir(store_path)
+            and any(f.endswith(".parquet") for f in os.listdir(store_path)))
+
+
+def clear_store(store_path):
+    """
+    Remove all the partitions of the feature store
+
+    :param store_path: (str) feature store directory
+    :return: None
+    """
+
+    if os.path.isdir(store_path):
+        shutil.rmtree(store_path)
+
+
+def write_partition(store_path, dataset, partition):
+    """
+    Write a dataset as a new partition of the feature store
+
+    The partitions are read back on name order, so the names must sort on
+    the ingestion order.
+
+    :param store_path: (str) feature store directory
+    :param dataset: (DataFrame) rows of the partition
+    :param partition: (str) partition name
+    :return: partition file or None if pyarrow is not installed
+    """
+
+    if not ARROW_AVAILABLE or not store_path:
+        return None
+    os.makedirs(store_path, exist_ok=True)
+    filename = os.path.join(store_path, f"part-{partition}.parquet")
+    table = pa.Table.from_pandas(dataset, preserve_index=False)
+    pq.write_table(table, filename)
+
+    return filename
+
+
+def list_partitions(store_path):
+    """
+    List the partitions of the feature store on ingestion order
+
+    :param store_path: (str) feature store directory
+    :return: list of partition files
+    """
+
+    return sorted(os.path.join(store_path, f) for f in os.listdir(store_path)
+                  if f.endswith(".parquet"))
+
+
+def read_columns(store_path):
+    """
+    Read the columns and their pandas' dtype from the feature store metadata
+
+    :param store_path: (str) feature store directory
+    :return: dict with the dtype of each column
+    """
+
+    schema = pq.read_schema(list_partitions(store_path)[0])
+    return {field.name: 'category' if pa.types.is_dictionary(field.type)
+            else field.type.to_pandas_dtype() for field in schema}
+
+
+def read_features(store_path, columns=None, start=0):
+    """
+    Load the feature store reading only the requested columns
+
+    The arrow buffers are handed to pandas without copying them when the
+    column type allows it, and released while converting so the peak
+    memory is not doubled. The partitions holding only rows before start
+    are skipped using their metadata, without reading them.
+
+    :param store_path: (str) feature store directory
+    :param columns: (list) columns to read, None reads all
+    :param start: (int) rows skipped, on ingestion order
+    :return: pandas' dataframe
+    """
+
+    partitions = list_partitions(store_path)
+    while partitions and start > 0:
+        rows = pq.ParquetFile(partitions[0]).metadata.num_rows
+        if rows > start:
+            break
+        start -= rows
+        partitions.pop(0)
+    if not partitions:
+        table = pq.read_schema(list_partitions(store_path)[0]).empty_table()
+        table = table.select(columns) if columns else table
+    else:
+        table = pq.ParquetDataset(partitions).read(columns=columns).slice(start)
+
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def load_ingested_data(db_file, store_path=None, columns=None, LOGGER_=log.getLogger("featurestore"),
+                       start=0):
+    """
+    Load the ingested data from the feature store or from the database
+
+    The columnar feature store is used when it is available, otherwise
+    the 'ingested_data' table is read. Only the requested columns are
+    loaded on both cases. The rows are kept on ingestion order on both
+    stores, so start skips the rows ingested before a given point.
+
+    :param db_file: (str) database file
+    :param store_path: (str) feature store directory
+    :param columns: (list) columns to read, None reads all
+    :param LOGGER_: System Log manager
+    :param start: (int) rows skipped, on ingestion order
+    :return: pandas' dataframe
+    """
+
+    if store_available(store_path):
+        dataset = read_features(store_path, columns, start)
+        LOGGER_.info(f"Ingested Data loaded from feature store {store_path} (001)")
+        return dataset
+
+    dataset = None
+    #connect to a database, creating it if it doesn't exist 
+    conn = connect(db_file)
+    LOGGER_.info(f"Database Data File: {db_file} (002)")
+    if conn is not None:
+        try: 
+            dataset = apply_schema(read_query(conn, "ingested_data", columns,
+                                               filters=[('rowid', '>', start)] if start else None))
+            LOGGER_.info(f"Ingested Data table loaded from {db_file} (003)")  
+        except ValueError:
+            # if exception occour Rollback
+            conn.rollback()
+            LOGGER_.error(f"Can't read table 'ingested_data' in {db_file} (004)")
+        finally:
+            # close out the connection
+            conn.close()
+            LOGGER_.debug(f"Connection Closed (005)")
+    else:
+        LOGGER_.error(f"Can't connect with {db_file} (006)")
+
+    return dataset
+
+
+def iter_ingested_data(db_file, store_path=None, columns=None, chunksize=100000,
+                       LOGGER_=log.getLogger("featurestore")):
+    """
+    Read the ingested data by chunks from the feature store or from the database
+
+    Only a chunk is held in memory at a time, the feature store is read
+    by record batches of every partition and the 'ingested_data' table by
+    a cursor. The chunks are yielded on ingestion order with the declared
+    schema.
+
+    :param db_file: (str) database file
+    :param store_path: (str) feature store directory
+    :param columns: (list) columns to read, None reads all
+    :param chunksize: (int) rows per chunk
+    :param LOGGER_: System Log manager
+    :return: iterator of pandas' dataframes
+    """
+
+    if store_available(store_path):
+        LOGGER_.debug(f"Ingested Data read by chunks from feature store {store_path} (007)")
+        for partition in list_partitions(store_path):
+            for batch in pq.ParquetFile(partition).iter_batches(batch_size=chunksize,
+                                                                columns=columns):
+                yield apply_schema(batch.to_pandas())
+        return
+
+    conn = connect(db_file)
+    LOGGER_.debug(f"Ingested Data table read by chunks from {db_file} (008)")
+    try:
+        for chunk in read_query(conn, "ingested_data", columns, order_by=[('rowid', 'ASC')],
+                                chunksize=chunksize):
+            yield apply_schema(chunk)
+    finally:
+        conn.close()
@@ -0,0 +1,440 @@
+"""
+Inference engine
+
+Vectorized numpy evaluation of the compact linear models
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+import sys
+import os
+import threading
+
+# Data Science Imports
+import numpy as np
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__))
+
+# adding artifact directory to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../artifact'))
+
+# Imports from other libraries
+from artifact import LinearModel, load_model
+
+# Rows evaluated per chunk, bounds the buffers size
+CHUNK_ROWS = 65536
+# Scores closer to the decision boundary are evaluated again as sklearn
+# does, so the rounding of the fast path never changes a prediction
+BOUNDARY_TOLERANCE = 1e-9
+# Pseudo-counts of each outcome added to the sampled rates of the strata,
+# the Agresti-Coull adjustment of a 95% interval
+AGRESTI_COULL = 2
+
+
+def feature_columns(X):
+    """
+    Features of the samples as a sequence of 1-D columns
+
+    A dataframe's columns are read without building a 2-D copy of the frame.
+
+    :param X: (array or DataFrame) samples, one row or a batch
+    :return: (columns, rows) columns on their original dtype and number of samples
+    """
+
+    if hasattr(X, 'columns'):
+        return [X[column].to_numpy() for column in X.columns], len(X)
+
+    X = np.asarray(X)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+
+    return X.T, len(X)
+
+
+class InferenceEngine:
+    """
+    Evaluates sigmoid(X @ coef + intercept) of a LinearModel
+
+    The standardization is folded into the coefficients, and the features
+    are copied by chunks into preallocated float64 buffers, one column at a
+    time, so a large batch doesn't allocate temporaries of its size. A single
+    row skips the buffers. The buffers are per thread, so an engine can be
+    shared by the API threads.
+    """
+
+    def __init__(self, model, chunk_rows=CHUNK_ROWS):
+        """
+        :param model: (LinearModel) compact model
+        :param chunk_rows: (int) rows evaluated per chunk
+        """
+
+        self.model = model
+        self.chunk_rows = chunk_rows
+        self.coef = np.asarray(model.coef, dtype=np.float64)
+        self.intercept = float(model.intercept)
+        if model.mean is not None:
+            # (x - mean) / scale @ coef == x @ (coef / scale) - mean @ (coef / scale)
+            self.coef = self.coef / model.scale
+            self.intercept -= float(model.mean @ self.coef)
+        self.coef = self.coef.reshape(1, -1)
+        self.classes = np.asarray(model.classes)
+        # decision score of the model's probability threshold
+        self.boundary = model.boundary
+        self.buffers = threading.local()
+
+    def get_buffers(self):
+        """
+        Buffers of the calling thread, allocated on its first call
+
+        :return: (inputs, scores) arrays of chunk_rows columns, the inputs
+                 with a row per feature
+        """
+
+        if not hasattr(self.buffers, 'inputs'):
+            self.buffers.inputs = np.empty((self.coef.shape[1], self.chunk_rows), dtype=np.float64)
+            self.buffers.scores = np.empty((1, self.chunk_rows), dtype=np.float64)
+
+        return self.buffers.inputs, self.buffers.scores
+
+    def reference_scores(self, columns):
+        """
+        Scores computed with the same operations than sklearn
+
+        :param columns: (list) features columns, on their original dtype
+        :return: array with a score per sample
+        """
+
+        model = self.model
+        X = np.column_stack(columns)
+        if model.mean is not None:
+            X = (np.asarray(X, dtype=np.float64) - model.mean) / model.scale
+
+        return (X @ model.coef.reshape(-1, 1) + model.intercept).ravel()
+
+    def iter_scores(self, columns, rows):
+        """
+        Scores of the samples by chunks
+
+        The chunks are views of the thread buffers, overwritten by the next one.
+
+        :param columns: (list) features columns, as returned by feature_columns
+        :param rows: (int) number of samples
+        :return: generator of (start, stop, scores) per chunk
+        """
+
+        if rows == 1:
+            score = self.intercept + sum(float(column[0]) * coef
+                                         for column, coef in zip(columns, self.coef[0]))
+            if abs(score - self.boundary) <= BOUNDARY_TOLERANCE:
+                score = self.reference_scores(columns)[0]
+            yield 0, 1, np.array([score])
+            return
+
+        inputs, scores = self.get_buffers()
+        for start in range(0, rows, self.chunk_rows):
+            stop = min(start + self.chunk_rows, rows)
+            chunk = inputs[:, :stop - start]
+            for row, column in zip(chunk, columns):
+                row[...] = column[start:stop]
+            chunk_scores = scores[:, :stop - start]
+            np.matmul(self.coef, chunk, out=chunk_scores)
+            chunk_scores += self.intercept
+
+            # the rows near the boundary are evaluated again as sklearn
+            # does, the fast path rounds differently and may flip their class
+            near = np.flatnonzero(np.abs(chunk_scores[0] - self.boundary) <= BOUNDARY_TOLERANCE)
+            if len(near) > 0:
+                chunk_scores[0, near] = self.reference_scores(
+                    [column[start:stop][near] for column in columns])
+
+            yield start, stop, chunk_scores[0]
+
+    def decision_function(self, X):
+        """
+        Distance of the samples to the decision boundary
+
+        :param X: (array or DataFrame) samples, one row or a batch
+        :return: array with a score per sample
+        """
+
+        columns, rows = feature_columns(X)
+        scores = np.empty(rows, dtype=np.float64)
+        for start, stop, chunk_scores in self.iter_scores(columns, rows):
+            scores[start:stop] = chunk_scores
+
+        return scores
+
+    def predict_proba(self, X):
+        """
+        Probability of each class
+
+        :param X: (array or DataFrame) samples, one row or a batch
+        :return: array with the negative and positive probabilities per sample
+        """
+
+        columns, rows = feature_columns(X)
+        proba = np.empty((rows, 2), dtype=np.float64)
+        for start, stop, chunk_scores in self.iter_scores(columns, rows):
+            # sigmoid computed in place over the chunk scores
+            np.negative(chunk_scores, out=chunk_scores)
+            np.exp(chunk_scores, out=chunk_scores)
+            chunk_scores += 1.0
+            np.reciprocal(chunk_scores, out=proba[start:stop, 1])
+        np.subtract(1.0, proba[:, 1], out=proba[:, 0])
+
+        return proba
+
+    def predict(self, X):
+        """
+        Predicted class of each sample
+
+        :param X: (array or DataFrame) samples, one row or a batch
+        :return: array with the class label per sample
+        """
+
+        columns, rows = feature_columns(X)
+        labels = np.empty(rows, dtype=self.classes.dtype)
+        for start, stop, chunk_scores in self.iter_scores(columns, rows):
+            labels[start:stop] = np.where(chunk_scores > self.boundary, self.classes[1], self.classes[0])
+
+        return labels
+
+
+class StackedEngine:
+    """
+    Evaluates several LinearModels in a single pass over the samples
+
+    The folded coefficients of the models are stacked on a matrix, so each
+    chunk of samples is copied once and scored for all the models with one
+    matrix multiply.
+    """
+
+    def __init__(self, models, chunk_rows=CHUNK_ROWS):
+        """
+        :param models: (list) compact models, all of them with the same features
+        :param chunk_rows: (int) rows evaluated per chunk
+        """
+
+        self.engines = [InferenceEngine(model, chunk_rows) for model in models]
+        self.chunk_rows = chunk_rows
+        self.coef = np.vstack([engine.coef for engine in self.engines])
+        self.intercept = np.array([engine.intercept for engine in self.engines]).reshape(-1, 1)
+        self.inputs = None
+
+    def decision_function(self, X):
+        """
+        Distance of the samples to the decision boundary of every model
+
+        :param X: (array or DataFrame) samples
+        :return: array with a row per model and a score per sample
+        """
+
+        columns, rows = feature_columns(X)
+        scores = np.empty((len(self.engines), rows), dtype=np.float64)
+        if self.inputs is None:
+            self.inputs = np.empty((self.coef.shape[1], self.chunk_rows), dtype=np.float64)
+        for start in range(0, rows, self.chunk_rows):
+            stop = min(start + self.chunk_rows, rows)
+            chunk = self.inputs[:, :stop - start]
+            for row, column in zip(chunk, columns):
+                row[...] = column[start:stop]
+            np.matmul(self.coef, chunk, out=scores[:, start:stop])
+        scores += self.intercept
+
+        # the rows near the boundary of a model are evaluated again as sklearn does
+        for engine, model_scores in zip(self.engines, scores):
+            near = np.flatnonzero(np.abs(model_scores - engine.boundary) <= BOUNDARY_TOLERANCE)
+            if len(near) > 0:
+                model_scores[near] = engine.reference_scores([column[near] for column in columns])
+
+        return scores
+
+    def predict(self, X):
+        """
+        Predicted class of each sample by every model
+
+        :param X: (array or DataFrame) samples
+        :return: array with a row per model and the class label per sample
+        """
+
+        scores = self.decision_function(X)
+
+        return np.vstack([np.where(model_scores > engine.boundary, engine.classes[1], engine.classes[0])
+                          for engine, model_scores in zip(self.engines, scores)])
+
+
+def confusion_matrix(y, yhat, positive=1):
+    """
+    Confusion matrix of a binary classification
+
+    :param y: (array) true labels
+    :param yhat: (array) predicted labels
+    :param positive: label of the positive class
+    :return: array [[tn, fp], [fn, tp]]
+    """
+
+    cells = 2 * (np.asarray(y) == positive) + (np.asarray(yhat) == positive)
+
+    return np.bincount(cells, minlength=4).reshape(2, 2)
+
+
+def evaluate_chunks(model, chunks, positive=1):
+    """
+    Accumulate the confusion matrix of a model over chunks of samples
+
+    Only a chunk and its predictions are held in memory at a time.
+
+    :param model: model or InferenceEngine with a predict method
+    :param chunks: iterable of (X, y) chunks
+    :param positive: label of the positive class
+    :return: array [[tn, fp], [fn, tp]]
+    """
+
+    confusion = np.zeros((2, 2), dtype=np.int64)
+    for X, y in chunks:
+        confusion += confusion_matrix(y, model.predict(X), positive)
+
+    return confusion
+
+
+def confusion_scores(confusion):
+    """
+    F1, precision and recall derived from a confusion matrix, they are 0
+    when undefined as on sklearn
+
+    :param confusion: (array) [[tn, fp], [fn, tp]]
+    :return: (dict) f1, precision and recall
+    """
+
+    (_, fp), (fn, tp) = confusion.tolist()
+
+    return {'f1': 2 * tp / (2 * tp + fp + fn) if tp + fp + fn > 0 else 0.0,
+            'precision': tp / (tp + fp) if tp + fp > 0 else 0.0,
+            'recall': tp / (tp + fn) if tp + fn > 0 else 0.0}
+
+
+def roc_auc(y, scores, positive=1):
+    """
+    Area under the ROC curve from the ranks of the scores
+
+    The AUC is the probability that a positive sample scores over a
+    negative one, the Mann-Whitney statistic, tied scores get their
+    average rank as on sklearn.
+
+    :param y: (array) true labels
+    :param scores: (array) decision scores, higher for the positive class
+    :param positive: label of the positive class
+    :return: (float) AUC, nan when there is a single class
+    """
+
+    positives = np.asarray(y) == positive
+    n_positive = int(positives.sum())
+    n_negative = len(positives) - n_positive
+    if n_positive == 0 or n_negative == 0:
+        return np.nan
+    _, inverse, counts = np.unique(np.asarray(scores), return_inverse=True, return_counts=True)
+    # average rank, 1 based, of each distinct score
+    ranks = np.cumsum(counts) - (counts - 1) / 2
+
+    return float((ranks[inverse][positives].sum() - n_positive * (n_positive + 1) / 2)
+                 / (n_positive * n_negative))
+
+
+def bootstrap_f1(confusion, resamples=10000, seed=0):
+    """
+    F1 of bootstrap resamples of the scored rows
+
+    Resampling the n rows with replacement only changes how many of them
+    fall on each confusion matrix cell, so all the resamples are drawn at
+    once as a multinomial over the 4 cells, a (resamples, 4) matrix of
+    counts instead of a (resamples, n) matrix of row indexes, with the same
+    distribution whatever the number of rows.
+
+    :param confusion: (array) [[tn, fp], [fn, tp]]
+    :param resamples: (int) number of resamples
+    :param seed: (int) random generator seed
+    :return: array with the F1 of each resample
+    """
+
+    cells = np.asarray(confusion).ravel()
+    rows = int(cells.sum())
+    if rows == 0:
+        return np.zeros(resamples)
+    counts = np.random.default_rng(seed).multinomial(rows, cells / rows, size=resamples)
+    _, fp, fn, tp = counts.T
+    denominator = 2 * tp + fp + fn
+
+    return np.divide(2 * tp, denominator, out=np.zeros(resamples), where=denominator > 0)
+
+
+def stratified_f1(totals, sizes, positives, resamples=10000, seed=0):
+    """
+    F1 estimated on a sample stratified by the true class, and its bootstrap
+
+    The recall comes from the positive stratum and the false positive rate
+    from the negative one, each of them weighted by the stratum rows on the
+    whole data, so the strata can be sampled at any rate. The resamples
+    draw the predicted positives of each stratum from a binomial, all of
+    them at once. The binomials are drawn at the Agresti-Coull rates, two
+    pseudo-counts of each outcome, so a stratum observed all or none
+    predicted positive still varies on the resamples.
+
+    :param totals: (array) rows of the negative and positive strata on the whole data
+    :param sizes: (array) sampled rows of the negative and positive strata
+    :param positives: (array) sampled rows of each stratum predicted positive
+    :param resamples: (int) number of resamples
+    :param seed: (int) random generator seed
+    :return: (f1, resampled) estimated F1 and array with the F1 of each resample
+    """
+
+    totals = np.asarray(totals, dtype=np.float64)
+    sizes = np.asarray(sizes, dtype=np.int64)
+    rates = np.divide(positives, sizes, out=np.zeros(2), where=sizes > 0)
+    adjusted = (np.asarray(positives, dtype=np.float64) + AGRESTI_COULL) / (sizes + 2 * AGRESTI_COULL)
+    draws = np.random.default_rng(seed).binomial(sizes, adjusted, size=(resamples, 2))
+    draws = draws / np.maximum(sizes, 1)
+
+    def estimate(false_positive_rate, recall):
+        # 2 tp / (2 tp + fp + fn) with tp, fp and fn scaled to the whole data
+        numerator = 2 * totals[1] * recall
+        denominator = totals[1] * (1 + recall) + totals[0] * false_positive_rate
+        return np.divide(numerator, denominator, out=np.zeros(np.shape(numerator)),
+                         where=denominator > 0)
+
+    return float(estimate(rates[0], rates[1])), estimate(draws[:, 0], draws[:, 1])
+
+
+def confidence_interval(values, confidence=0.95):
+    """
+    Percentile interval of the bootstrap values
+
+    :param values: (array) statistic of each resample
+    :param confidence: (float) interval coverage
+    :return: (low, high) interval bounds
+    """
+
+    low, high = np.quantile(values, [(1 - confidence) / 2, (1 + confidence) / 2])
+
+    return float(low), float(high)
+
+
+def load_engine(model_file, chunk_rows=CHUNK_ROWS):
+    """
+    Load a model ready to predict, wrapped on an InferenceEngine when it has
+    a compact artifact
+
+    :param model_file: (str) pickled model file
+    :param chunk_rows: (int) rows evaluated per chunk
+    :return: InferenceEngine or the unpickled model
+    """
+
+    model = load_model(model_file)
+    if isinstance(model, LinearModel):
+        return InferenceEngine(model, chunk_rows)
+
+    return model
@@ -4,9 +4,11 @@ ML ingestion
 Process raw data into the pipeline
 
 By: Julian Bolivar
-Version: 1.0.0
+Version: 1.1.0
 Date:  2023/06/12
 Revision 1.0.0 ( 2023/06/12 ): Initial Release
+Revision 1.1.0 (2026/10/17): Incremental, streaming and parallel ingestion, file manifest, row hash
+                             deduplication, compressed sources, feature store and batch records
 """
 
 # Main System Imports
@@ -16,9 +18,14 @@ import logging.handlers
 import sys
 import os
 import platform
+import importlib.util
+import io
+import mmap
 from datetime import datetime as dt
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Data Science Imports
+import numpy as np
 import pandas as pd
 
 # Data Base Imports
@@ -27,11 +34,39 @@ import sqlite3 as db
 # Get the running script path
 RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
 
+# adding featurestore, database, schema and cache directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../featurestore'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../database'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../schema'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../cache'))
+
+# Imports from other libraries
+from database import connect, create_indexes, read_query, table_exists, write_table
+from schema import apply_schema, column_types, load_csv
+from featurestore import ARROW_AVAILABLE, clear_store, store_available, write_partition
+from cache import file_digest
+
 # Main Logger
 LOGHANDLER = None
 LOGGER = None
 LOGLEVEL_ = logging.INFO
 
+# Source file extensions and the compression pandas decompresses while parsing
+SOURCE_EXTENSIONS = {
+    '.csv': None,
+    '.csv.gz': 'gzip',
+    '.csv.bz2': 'bz2',
+    '.csv.xz': 'xz',
+    '.csv.zst': 'zstd',
+}
+
+# Modules required by the compressions not included on the standard library
+COMPRESSION_MODULES = {
+    'zstd': 'zstandard',
+}
+# Source files skipped by a missing decompressor, already warned on this process
+SKIPPED_FILES = set()
+
 
 def build_argparser():
     """
@@ -71,70 +106,753 @@ def build_argparser():
                         default=os.path.join(RUNNING_PATH,'../../db/pipeline_data.sqlite'),
                         required=False
                         )
+    parser.add_argument("-m",
+                        "--mode",
+                        type=str,
+                        help="Ingestion mode, 'full' rebuilds the master dataset "
+                             "and 'incremental' only appends the not ingested files",
+                        choices=['full', 'incremental'],
+                        default='full',
+                        required=False
+                        )
+    parser.add_argument("-c",
+                        "--chunksize",
+                        type=int,
+                        help="Rows read per chunk on streaming ingestion, "
+                             "0 derives it from max_memory",
+                        default=0,
+                        required=False
+                        )
+    parser.add_argument("-x",
+                        "--max_memory",
+                        type=int,
+                        help="Peak memory ceiling in MB for streaming ingestion, "
+                             "0 with chunksize 0 loads all the data in memory",
+                        default=0,
+                        required=False
+                        )
+    parser.add_argument("-f",
+                        "--feature_store",
+                        type=str,
+                        help="Directory of the columnar feature store, empty disables it",
+                        default=os.path.join(RUNNING_PATH,'../../ingesteddata/feature_store'),
+                        required=False
+                        )
+    parser.add_argument("-w",
+                        "--workers",
+                        type=int,
+                        help="Processes used to parse the files concurrently, "
+                             "threads used to parse the blocks of a file on 'blocks' parser",
+                        default=1,
+                        required=False
+                        )
+    parser.add_argument("-p",
+                        "--parser",
+                        type=str,
+                        help="Csv parser, 'pandas' reads each file on one thread and "
+                             "'blocks' splits each file on blocks parsed by the workers",
+                        choices=['pandas', 'blocks'],
+                        default='pandas',
+                        required=False
+                        )
+    parser.add_argument("-b",
+                        "--block_size",
+                        type=int,
+                        help="Block size in MB of the 'blocks' parser",
+                        default=64,
+                        required=False
+                        )
 
     return parser.parse_args()
 
 
-def read_csv(filename):
+def read_csv(filename, parser='pandas', workers=1, block_size=64):
+    """
+    read a csv file into a pandas' data frame with the declared schema
+
+    inputs:
+        filename: cvs filename to read
+        parser: 'pandas' parses the file on one thread, 'blocks' parses
+                it by blocks on a thread pool
+        workers: number of threads used by the 'blocks' parser
+        block_size: block size in MB of the 'blocks' parser
+    output: pandas'dataframe
+    """
+
+    if parser == 'blocks':
+        return read_csv_blocks(filename, workers, block_size * 2**20)
+
+    return load_csv(filename)
+
+
+def block_offsets(buffer, block_size):
+    """
+    Split a csv file on blocks ending on line boundaries
+
+    inputs:
+        buffer: memory mapped csv file
+        block_size: approximated bytes per block
+    output: end of the header and list with the (start, end) of the blocks
     """
-    read a csv file into a pandas' data frame
 
-    input: cvs filenames to read
+    header_end = buffer.find(b'\n') + 1 or len(buffer)
+    offsets = []
+    start = header_end
+    while start < len(buffer):
+        end = buffer.find(b'\n', start + block_size)
+        end = len(buffer) if end == -1 else end + 1
+        offsets.append((start, end))
+        start = end
 
+    return header_end, offsets
+
+
+def read_csv_blocks(filename, workers=1, block_size=2**26):
+    """
+    read a csv file memory mapped, parsing its blocks concurrently
+
+    The file is split on blocks ending on line boundaries, every block is
+    parsed with the declared schema on a thread pool, the parser releases
+    the GIL while tokenizing, and the blocks are concatenated on the file
+    order. The quoted fields can't have line breaks. The compressed files
+    can't be memory mapped and are parsed on one thread.
+
+    inputs:
+        filename: cvs filename to read
+        workers: number of threads used to parse the blocks
+        block_size: approximated bytes per block
     output: pandas'dataframe
     """
-    return pd.read_csv(filename)
 
+    if not filename.endswith(".csv") or os.path.getsize(filename) == 0:
+        return load_csv(filename)
 
-def merge_multiple_dataframe(files_to_ingest, args):
+    with open(filename, 'rb') as file, \
+         mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        header_end, offsets = block_offsets(buffer, block_size)
+        if len(offsets) < 2:
+            return load_csv(filename)
+        names = list(pd.read_csv(io.BytesIO(buffer[:header_end]), nrows=0).columns)
+
+        def parse_block(offset):
+            start, end = offset
+            return load_csv(io.BytesIO(buffer[start:end]), header=None, names=names)
+
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            blocks = list(executor.map(parse_block, offsets))
+
+    # the schema is applied again to merge the blocks categories
+    return apply_schema(pd.concat(blocks, axis=0, ignore_index=True))
+
+
+def read_multiple_csv(files_to_read, workers=1, parser='pandas', block_size=64):
     """
-    Merge multiple csv datasets into one master file
+    read multiple csv files, parsing them concurrently on a process pool
+
+    The data frames are returned on the same order of the files, so the
+    result doesn't depend on the order the workers finish. With the
+    'blocks' parser the files are read one after the other, and the
+    workers parse the blocks of each file.
+
+    inputs:
+        files_to_read: list of csv files to read
+        workers: number of processes used to parse the files
+        parser: 'pandas' or 'blocks' csv parser
+        block_size: block size in MB of the 'blocks' parser
+    output: list of pandas' dataframes
+    """
+
+    if parser == 'blocks':
+        return [read_csv(file, parser, workers, block_size) for file in files_to_read]
+
+    if workers > 1 and len(files_to_read) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(files_to_read))) as executor:
+            return list(executor.map(read_csv, files_to_read))
+
+    return [read_csv(file) for file in files_to_read]
+
+
+def compression_available(compression):
+    """
+    Check if the module required to decompress a file is installed
+
+    input: compression name used by pandas, None for plain files
+    output: True if the files can be decompressed
+    """
+
+    module = COMPRESSION_MODULES.get(compression)
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def is_source_file(filename):
+    """
+    Check if a file is a plain or compressed csv file that can be ingested
+
+    input: file name
+    output: True if the file has a source extension and its decompressor
+            is installed
+    """
+
+    for extension, compression in SOURCE_EXTENSIONS.items():
+        if filename.endswith(extension):
+            return compression_available(compression)
+
+    return False
+
+
+def list_source_files(input_path, LOGGER_=log.getLogger("ingestion")):
+    """
+    List the source data files on the input path
+
+    The compressed csv files are listed with the plain ones, they are
+    decompressed by the csv parser while reading them, without writing the
+    decompressed data to disk. The compressed files whose decompressor
+    isn't installed are skipped with a warning, once per file.
+
+    inputs:
+        input_path: path where the source files are searched
+        LOGGER_: System Log manager
+    output: list with the source files sorted by name
+    """
+
+    # get files on input_path, sorted to keep the ingestion order stable
+    files = sorted(os.listdir(input_path))
+    # Filtering only the plain and compressed csv files.
+    sources = []
+    for f in files:
+        path = os.path.join(input_path, f)
+        if not os.path.isfile(path):
+            continue
+        if is_source_file(f):
+            sources.append(path)
+        elif any(f.endswith(extension) for extension in SOURCE_EXTENSIONS) \
+                and path not in SKIPPED_FILES:
+            SKIPPED_FILES.add(path)
+            LOGGER_.warning(f"Skipping {path}, its decompressor is not installed (023)")
+
+    return sources
+
+
+def create_manifest(conn, replace=False):
+    """
+    Create the 'ingested_files' manifest table and its indexes
+
+    Every ingested file is recorded with its content digest, size, mtime
+    and row count. The digest has a unique index, so the same content is
+    ingested only once whatever its name. A table from the previous
+    format, without digests, is replaced.
+
+    inputs:
+        conn: database connection
+        replace: drop the current manifest
+    output: None
+    """
+
+    if table_exists(conn, "ingested_files"):
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(ingested_files)")]
+        if replace or 'digest' not in columns:
+            conn.execute("DROP TABLE ingested_files")
+    conn.execute("CREATE TABLE IF NOT EXISTS ingested_files "
+                 "(date TEXT, file TEXT, digest TEXT NOT NULL, size INTEGER, "
+                 "mtime REAL, rows INTEGER)")
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS ingested_files_digest "
+                 "ON ingested_files (digest)")
+    create_indexes(conn, "ingested_files")
+
+
+def load_manifest(db_file):
+    """
+    Read the manifest of the files already ingested
+
+    input: database file
+    output: dict with the (size, mtime, digest) of each ingested file
+            and dict with the position of each ingested digest on the
+            ingestion order
+    """
+
+    known_files = {}
+    known_digests = {}
+    conn = connect(db_file)
+    try:
+        if table_exists(conn, "ingested_files"):
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(ingested_files)")]
+            if 'digest' in columns:
+                cursor = conn.execute("SELECT file, size, mtime, digest FROM ingested_files "
+                                      "ORDER BY rowid")
+                for file, size, mtime, digest in cursor:
+                    known_files[file] = (size, mtime, digest)
+                    known_digests.setdefault(digest, len(known_digests))
+    finally:
+        conn.close()
+
+    return known_files, known_digests
+
+
+def find_new_files(files, manifest=({}, {})):
+    """
+    Find the files whose content is not on the manifest
+
+    Files with the same path, size and mtime than a manifest entry are
+    skipped without reading them, the others are hashed and kept only if
+    their digest is not ingested yet, neither by a previous file on the
+    list.
+
+    inputs:
+        files: list of candidate files
+        manifest: manifest returned by load_manifest
+    output: dict with the (digest, size, mtime) of each new file, on the
+            files' order
+    """
+
+    known_files, known_digests = manifest
+    new_digests = set()
+    new_files = {}
+    for file in files:
+        path = os.path.realpath(file)
+        stat = os.stat(path)
+        known = known_files.get(path)
+        if known is not None and known[0] == stat.st_size and known[1] == stat.st_mtime:
+            continue
+        digest = file_digest(path)
+        if digest in known_digests or digest in new_digests:
+            continue
+        new_digests.add(digest)
+        new_files[path] = (digest, stat.st_size, stat.st_mtime)
+
+    return new_files
+
+
+def order_by_manifest(files_to_ingest, manifest):
+    """
+    Sort the files on the order their content was first ingested
+
+    A full rebuild reads the files on the order of the incremental runs
+    that ingested them, so it keeps the same rows in the same order. The
+    files not on the manifest go last, on their names' order.
+
+    inputs:
+        files_to_ingest: dict with the (digest, size, mtime) of the files,
+                         on their names' order
+        manifest: manifest returned by load_manifest
+    output: dict with the (digest, size, mtime) of each file, on the
+            ingestion order
+    """
+
+    _, known_digests = manifest
+    # sorted is stable, the new files keep their names' order
+    order = sorted(files_to_ingest,
+                   key=lambda file: known_digests.get(files_to_ingest[file][0], len(known_digests)))
+
+    return {file: files_to_ingest[file] for file in order}
+
+
+def estimate_chunksize(files_to_ingest, max_memory, sample_rows=1000):
+    """
+    Estimate the rows per chunk that keep the ingestion under a memory ceiling
+
+    The in memory size of a row is measured on a sample of the first file,
+    a chunk gets a quarter of the ceiling to leave room for the parser
+    buffers, the row hashes and the database writes.
 
     inputs:
         files_to_ingest: List with the files to be ingested
+        max_memory: memory ceiling in MB
+        sample_rows: rows sampled to measure the row size
+    output: rows per chunk
+    """
+
+    if not files_to_ingest:
+        return 1
+    sample = load_csv(files_to_ingest[0], nrows=sample_rows)
+    row_bytes = max(sample.memory_usage(index=False, deep=True).sum() / max(len(sample), 1), 1)
+
+    return max(int(max_memory * 2**20 / 4 / row_bytes), 1)
+
+
+def row_hashes(dataset):
+    """
+    Compute a 64 bits hash of every row of the dataset
+
+    The numeric columns are hashed as float64 and the others as python
+    objects, so a row gets the same hash whether it was parsed from a csv
+    file or read back from the database, and rows equal for pandas'
+    drop_duplicates get equal hashes.
+
+    input: pandas' dataframe
+    output: numpy array with the row hashes as int64
+    """
+
+    columns = {}
+    for col in dataset.columns:
+        column = dataset[col]
+        if pd.api.types.is_numeric_dtype(column.dtype) or pd.api.types.is_bool_dtype(column.dtype):
+            columns[col] = column.astype(np.float64)
+        else:
+            columns[col] = column.astype(object).where(column.notna(), None)
+
+    return pd.util.hash_pandas_object(pd.DataFrame(columns), index=False).values.view(np.int64)
+
+
+def create_row_index(conn, append):
+    """
+    Create the persistent row deduplication index
+
+    The 'ingested_hashes' table keeps the hash of every row stored on
+    'ingested_data' as its primary key. When appending to a dataset
+    ingested before the index existed it is built from the stored rows.
+
+    inputs:
+        conn: database connection
+        append: rows are appended to the current dataset
+    output: None
+    """
+
+    global LOGGER
+
+    exists = table_exists(conn, "ingested_hashes")
+    if not append and exists:
+        conn.execute("DROP TABLE ingested_hashes")
+    conn.execute("CREATE TABLE IF NOT EXISTS ingested_hashes (hash INTEGER PRIMARY KEY)")
+    # scratch table where the hashes of a batch are staged
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS ingested_chunk (hash INTEGER)")
+    if append and not exists:
+        LOGGER.info(f"Building the rows deduplication index (021)")
+        for chunk in pd.read_sql_query("SELECT * FROM ingested_data", conn, chunksize=100000):
+            conn.executemany("INSERT OR IGNORE INTO ingested_hashes VALUES (?)",
+                             ((int(h),) for h in row_hashes(chunk)))
+
+
+def drop_seen_rows(conn, chunk):
+    """
+    Remove from chunk the duplicated rows and the rows already ingested
+
+    The chunk hashes are staged on a temporary table and joined with the
+    'ingested_hashes' primary key, so the cost depends on the chunk size
+    and not on the rows already ingested. The hashes of the kept rows are
+    added to the index.
+
+    inputs:
+        conn: database connection with the row index created
+        chunk: chunk of rows read
+    output: chunk without duplicates, duplicates inside the chunk and
+            duplicates of rows already ingested
+    """
+
+    hashes = row_hashes(chunk)
+    # drop duplicates inside the chunk
+    keep = ~pd.Series(hashes).duplicated().values
+    within = len(chunk) - int(keep.sum())
+    # drop rows already ingested
+    conn.execute("DELETE FROM ingested_chunk")
+    conn.executemany("INSERT INTO ingested_chunk VALUES (?)",
+                     ((int(h),) for h in hashes[keep]))
+    cursor = conn.execute("SELECT c.hash FROM ingested_chunk c "
+                          "JOIN ingested_hashes h ON h.hash = c.hash")
+    seen = np.array([row[0] for row in cursor.fetchall()], dtype=np.int64)
+    seen_mask = keep & np.isin(hashes, seen)
+    keep &= ~seen_mask
+    conn.executemany("INSERT INTO ingested_hashes VALUES (?)",
+                     ((int(h),) for h in hashes[keep]))
+
+    return chunk[keep], within, int(seen_mask.sum())
+
+
+def export_feature_store(conn, store_path, chunksize=100000):
+    """
+    Export the stored 'ingested_data' table to the feature store
+
+    Used when appending to a dataset ingested before the feature store
+    was enabled, the partitions are named to sort before the new ones.
+
+    inputs:
+        conn: database connection
+        store_path: feature store directory
+        chunksize: rows exported per partition
+    output: None
+    """
+
+    if not ARROW_AVAILABLE or not store_path or store_available(store_path):
+        return
+    clear_store(store_path)
+    chunks = pd.read_sql_query("SELECT * FROM ingested_data ORDER BY rowid", conn,
+                               chunksize=chunksize)
+    for part, chunk in enumerate(chunks):
+        write_partition(store_path, apply_schema(chunk), f"{0:020d}-{part:06d}")
+
+
+def save_ingested_files(conn, files_to_ingest, rows, append):
+    """
+    Record the ingested files on the 'ingested_files' manifest table
+
+    inputs:
+        conn: database connection
+        files_to_ingest: dict with the (digest, size, mtime) of the files
+        rows: dict with the rows read from each file
+        append: append to the table instead of replacing it
+    output: None
+    """
+
+    create_manifest(conn, replace=not append)
+    # get current time
+    now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Save ingested files to database
+    conn.executemany("INSERT INTO ingested_files (date, file, digest, size, mtime, rows) "
+                     "VALUES (?, ?, ?, ?, ?, ?)",
+                     [(now, file, digest, size, mtime, rows[file])
+                      for file, (digest, size, mtime) in files_to_ingest.items()])
+
+
+def last_rowid(conn):
+    """
+    Rowid of the last row on the 'ingested_data' table
+
+    inputs:
+        conn: database connection
+    output: last rowid, 0 when the table doesn't exist or is empty
+    """
+
+    if not table_exists(conn, "ingested_data"):
+        return 0
+    return conn.execute('SELECT MAX(rowid) FROM "ingested_data"').fetchone()[0] or 0
+
+
+def save_ingested_batch(conn, batch, first_row, append):
+    """
+    Record the 'ingested_data' rows written by an ingestion run on the
+    'ingested_batches' table
+
+    The rows are appended on ingestion order, so every batch is a rowid
+    range and its rows are read later without scanning the whole table.
+    A full ingestion rebuilds the dataset and the table is restarted.
+
+    inputs:
+        conn: database connection
+        batch: batch ID of the ingestion run
+        first_row: rowid of the first row written by the run
+        append: append to the table instead of replacing it
+    output: rows written by the run
+    """
+
+    last_row = last_rowid(conn)
+    rows = max(last_row - first_row + 1, 0)
+    # get current time
+    now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+    batch_df = pd.DataFrame({'date': [now,], 'batch': [batch,], 'first_row': [first_row,],
+                             'last_row': [last_row,], 'rows': [rows,]})
+    write_table(conn, "ingested_batches", batch_df, if_exists="append" if append else "replace")
+
+    return rows
+
+
+def load_batch(db_file, batch=None):
+    """
+    Read the rowid range of an ingestion batch
+
+    input: database file and batch ID, None reads the latest batch
+    output: dict with the batch, first_row, last_row and rows, None if not found
+    """
+
+    conn = connect(db_file)
+    try:
+        if not table_exists(conn, "ingested_batches"):
+            return None
+        found = read_query(conn, "ingested_batches", ['batch', 'first_row', 'last_row', 'rows'],
+                           filters=[('batch', '=', batch)] if batch is not None else None,
+                           order_by=[('rowid', 'DESC')], limit=1)
+    finally:
+        conn.close()
+
+    if found.empty:
+        return None
+    found = found.iloc[0]
+    return {'batch': str(found['batch']), 'first_row': int(found['first_row']),
+            'last_row': int(found['last_row']), 'rows': int(found['rows'])}
+
+
+def save_record_file(conn, record_file):
+    """
+    Save the list of files on the manifest into the record file
+
+    inputs:
+        conn: database connection
+        record_file: plain text file where the files are listed
+    output: None
+    """
+
+    cursor = conn.execute("SELECT file FROM ingested_files ORDER BY rowid")
+    with open(record_file, 'w') as file:
+        file.write(str([row[0] for row in cursor.fetchall()]))
+
+
+def stream_multiple_dataframe(files_to_ingest, args):
+    """
+    Merge multiple csv datasets into one master file reading them by chunks
+
+    Each chunk is deduplicated against the rows already seen and written to
+    the database and the csv file before reading the next one, so the peak
+    memory is bounded by the chunk size and not by the dataset size.
+
+    inputs:
+        files_to_ingest: dict with the (digest, size, mtime) of the files
+                         to be ingested
         args: command line arguments
     output: Master dataset and list of ingested files saved to disk
     """
 
     global LOGGER
 
-    # master dataset placeholder
-    finaldata = pd.DataFrame()
-    # ingested files placeholder
-    ingestedfiles = []
+    # rows per chunk
+    chunksize = args.chunksize
+    if chunksize <= 0:
+        chunksize = estimate_chunksize(list(files_to_ingest), args.max_memory)
+    LOGGER.info(f"Streaming ingestion with {chunksize} rows per chunk (018)")
 
-    # compile datasets together and store ingested file names
-    for file in files_to_ingest:
-        temp = read_csv(file)
-        finaldata = pd.concat([finaldata, temp], axis=0)
-        ingestedfiles.append(file)
+    # rows read per file
+    rows = {}
+
+    #connect to a database, creating it if it doesn't exist 
+    conn = connect(args.db_file)
+    LOGGER.info(f"Database Data File: {args.db_file} (002)")
+    append = args.mode == 'incremental' and table_exists(conn, "ingested_data")
+    if args.max_memory > 0:
+        # keep the database page cache under the memory ceiling
+        conn.execute(f"PRAGMA cache_size = -{args.max_memory * 1024 // 4}")
+    # staged hashes are spilled to a temporary file instead of memory
+    conn.execute("PRAGMA temp_store = FILE")
+    create_row_index(conn, append)
+    # rows written by this run start after the stored ones
+    first_row = last_rowid(conn) + 1 if append else 1
+
+    # batch ID of this run, names its feature store partitions
+    batch = dt.now().strftime("%Y%m%d%H%M%S%f")
+    if append:
+        export_feature_store(conn, args.feature_store)
+    elif args.feature_store:
+        clear_store(args.feature_store)
+
+    within_dups = 0
+    cross_dups = 0
+    part = 0
+    first_chunk = not append
+    csv_mode = 'a' if append and os.path.isfile(args.output_file) else 'w'
+    # a new csv file gets the header on the first chunk written to it
+    header_written = csv_mode == 'a'
+    try:
+        with open(args.output_file, csv_mode, newline='') as csv_file:
+            for file in files_to_ingest:
+                rows[file] = 0
+                for chunk in load_csv(file, chunksize=chunksize):
+                    rows[file] += len(chunk)
+                    chunk, within, cross = drop_seen_rows(conn, chunk)
+                    within_dups += within
+                    cross_dups += cross
+                    # write chunk to the database and csv files
+                    write_table(conn, "ingested_data", chunk,
+                                if_exists="replace" if first_chunk else "append")
+                    chunk.to_csv(csv_file, header=not header_written, index=False)
+                    header_written = True
+                    write_partition(args.feature_store, chunk, f"{batch}-{part:06d}")
+                    part += 1
+                    first_chunk = False
+                    # commit every chunk to keep the write-ahead log small
+                    conn.commit()
+            if first_chunk:
+                # a full ingestion without rows still replaces the previous dataset
+                empty = pd.DataFrame({col: pd.Series(dtype=dtype)
+                                      for col, dtype in column_types().items()})
+                write_table(conn, "ingested_data", empty, if_exists="replace")
+                empty.to_csv(csv_file, header=not header_written, index=False)
+            save_ingested_files(conn, files_to_ingest, rows, append)
+            written = save_ingested_batch(conn, batch, first_row, append)
+            LOGGER.info(f"Ingested Data and Files tables updated into {args.db_file} (019)")
+            LOGGER.info(f"Batch {batch} ingested with {written} new rows (022)")
+            # save ingested files on plain text file
+            save_record_file(conn, args.record_file)
+    except (ValueError, db.Error):
+        # if exception occour Rollback
+        conn.rollback()
+        LOGGER.error(f"Can't create table 'ingested_data' in {args.db_file} (005)")
+    else:
+        # commit the transaction
+        conn.commit()
+        LOGGER.debug(f"Transactions commited (006)")
+    finally:
+        # close out the connection
+        conn.close()
+        LOGGER.debug(f"Connection Closed (007)")
+
+    LOGGER.info(f"Duplicated Removed: {within_dups} (001)")
+    LOGGER.info(f"Cross-batch Duplicates Removed: {cross_dups} (015)")
+    LOGGER.info(f"Cleaned Data File: {args.output_file} (009)")
+
+    files_list = "\n".join(files_to_ingest)
+    LOGGER.info(f"Ingested Files: (003)\n {files_list}")
+
+
+def merge_multiple_dataframe(files_to_ingest, args):
+    """
+    Merge multiple csv datasets into one master file
 
-    # drop duplicates
-    org_length = len(finaldata)
-    finaldata.drop_duplicates(inplace=True)
-    after_length = len(finaldata)
+    On 'incremental' mode the new rows are appended to the stored master
+    dataset, if it doesn't exist yet a full rebuild is done.
 
-    LOGGER.info(f"Duplicated Removed: {org_length-after_length} (001)")
+    inputs:
+        files_to_ingest: dict with the (digest, size, mtime) of the files
+                         to be ingested
+        args: command line arguments
+    output: Master dataset and list of ingested files saved to disk
+    """
+
+    global LOGGER
+
+    # compile datasets together and store ingested file names
+    datasets = read_multiple_csv(list(files_to_ingest), args.workers,
+                                 args.parser, args.block_size)
+    rows = {file: len(dataset) for file, dataset in zip(files_to_ingest, datasets)}
+    # master dataset, concatenated once to avoid copying it on every file,
+    # the schema is applied again to merge the files categories
+    finaldata = apply_schema(pd.concat(datasets, axis=0)) if datasets else pd.DataFrame()
+
+    # rows are appended only on incremental mode over an existing dataset
+    append = False
 
     #connect to a database, creating it if it doesn't exist 
-    conn = db.connect(args.db_file)
+    conn = connect(args.db_file)
     LOGGER.info(f"Database Data File: {args.db_file} (002)")
 
     if conn is not None:
         try: 
-            # write dataset to the database file
-            finaldata.to_sql("ingested_data", conn, if_exists="replace", index=False)
-            LOGGER.info(f"Ingested Data table created into {args.db_file} (003)")
-            # get current time
-            now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
-            # Create Ingested Files Data Frame
-            ingestedfiles_df = pd.DataFrame(list(zip([now]*len(ingestedfiles),ingestedfiles)))
-            ingestedfiles_df.columns = ['date', 'file']
-            # Save ingested files to database
-            ingestedfiles_df.to_sql("ingested_files", conn, if_exists="replace", index=False)
+            append = args.mode == 'incremental' and table_exists(conn, "ingested_data")
+            # drop duplicates and the rows ingested on previous runs
+            create_row_index(conn, append)
+            finaldata, within, cross = drop_seen_rows(conn, finaldata)
+            # batch ID of this run, its rows start after the stored ones
+            batch = dt.now().strftime("%Y%m%d%H%M%S%f")
+            first_row = last_rowid(conn) + 1 if append else 1
+            LOGGER.info(f"Duplicated Removed: {within} (001)")
+            LOGGER.info(f"Cross-batch Duplicates Removed: {cross} (015)")
+            if append:
+                export_feature_store(conn, args.feature_store)
+                # append dataset to the database file
+                write_table(conn, "ingested_data", finaldata, if_exists="append")
+                LOGGER.info(f"Ingested Data table updated into {args.db_file} (016)")
+            else:
+                # write dataset to the database file
+                write_table(conn, "ingested_data", finaldata, if_exists="replace")
+                LOGGER.info(f"Ingested Data table created into {args.db_file} (003)")
+                if args.feature_store:
+                    clear_store(args.feature_store)
+            # write dataset to the columnar feature store
+            if write_partition(args.feature_store, finaldata, f"{batch}-{0:06d}"):
+                LOGGER.info(f"Feature store partition {batch} written into {args.feature_store} (020)")
+            save_ingested_files(conn, files_to_ingest, rows, append)
             LOGGER.info(f"Ingested Files table created into {args.db_file} (004)")
+            written = save_ingested_batch(conn, batch, first_row, append)
+            LOGGER.info(f"Batch {batch} ingested with {written} new rows (022)")
+            # save ingested files on plain text file
+            save_record_file(conn, args.record_file)
     
-        except ValueError:
+        except (ValueError, db.Error):
             # if exception occour Rollback
             conn.rollback()
             LOGGER.error(f"Can't create table 'ingested_data' in {args.db_file} (005)")
@@ -154,14 +872,13 @@ def merge_multiple_dataframe(files_to_ingest, args):
     # file_name = file_name + '.csv' 
     # file_path = os.path.dirname(args.output_file)
     # file_csv = os.path.join(file_path, file_name)
-    finaldata.to_csv(args.output_file, index=False)
+    if append and os.path.isfile(args.output_file):
+        finaldata.to_csv(args.output_file, mode='a', header=False, index=False)
+    else:
+        finaldata.to_csv(args.output_file, index=False)
     LOGGER.info(f"Cleaned Data File: {args.output_file} (009)")
 
-    # save ingested files on plain text file
-    with open(args.record_file, 'w') as file:
-        file.write(str(ingestedfiles))
-
-    files_list = "\n".join(ingestedfiles)
+    files_list = "\n".join(files_to_ingest)
     LOGGER.info(f"Ingested Files: (003)\n {files_list}")
 
 
@@ -175,15 +892,24 @@ def main(args):
     global LOGGER
 
     # get files on input_path
-    files = os.listdir(args.input_path)
-    # Filtering only the .csv files.
-    files = [os.path.join(args.input_path, f) for f in files
-             if os.path.isfile(os.path.join(args.input_path, f))
-             and f.endswith(".csv")]
+    files = list_source_files(args.input_path, LOGGER)
     files_list = "\n".join(files)
     LOGGER.info(f"Files Found In: {args.input_path} (010)\n{files_list}")
+    if args.mode == 'incremental':
+        # keep only the files whose content is not ingested yet
+        files = find_new_files(files, load_manifest(args.db_file))
+        if not files:
+            LOGGER.info(f"No new files to ingest (017)")
+            return
+    else:
+        # identify the files, skipping the ones with repeated content, on
+        # the order they were ingested before
+        files = order_by_manifest(find_new_files(files), load_manifest(args.db_file))
     # Ingest the files
-    merge_multiple_dataframe(files, args)
+    if args.chunksize > 0 or args.max_memory > 0:
+        stream_multiple_dataframe(files, args)
+    else:
+        merge_multiple_dataframe(files, args)
 
 
 if __name__ == '__main__':
@@ -4,9 +4,10 @@ Main Pipeline
 Main Pipeline Script
 
 By: Julian Bolivar
-Version: 1.0.0
+Version: 1.1.0
 Date:  2023/06/19
 Revision 1.0.0 (2023/06/19): Initial Release
+Revision 1.1.0 (2026/10/17): Ingestion, training and scoring options
 """
 
 # Main System Imports
@@ -67,7 +68,14 @@ def main(config: DictConfig):
                     "input_path": os.path.join(hydra_root_path, config["ingestion"]["input_folder_path"]),
                     "out_file": os.path.join(hydra_root_path, config["ingestion"]["output_folder_path"], "finaldata.csv"),
                     "record_file": os.path.join(hydra_root_path, config["ingestion"]["output_folder_path"], "ingestedfiles.txt"),
-                    "db_file": os.path.join(hydra_root_path, config["database"]["database_folder_path"], "pipeline_data.sqlite")
+                    "db_file": os.path.join(hydra_root_path, config["database"]["database_folder_path"], "pipeline_data.sqlite"),
+                    "mode": config["ingestion"]["mode"],
+                    "chunksize": config["ingestion"]["chunksize"],
+                    "max_memory": config["ingestion"]["max_memory"],
+                    "workers": config["ingestion"]["workers"],
+                    "parser": config["ingestion"]["parser"],
+                    "block_size": config["ingestion"]["block_size"],
+                    "feature_store": os.path.join(hydra_root_path, config["ingestion"]["feature_store_path"])
                 }
             )
         if "training" in active_steps:
@@ -77,7 +85,17 @@ def main(config: DictConfig):
                 "main",
                 parameters={
                     "model_path": os.path.join(hydra_root_path, config["training"]["output_model_path"]),
-                    "db_file": os.path.join(hydra_root_path, config["database"]["database_folder_path"], "pipeline_data.sqlite")
+                    "db_file": os.path.join(hydra_root_path, config["database"]["database_folder_path"], "pipeline_data.sqlite"),
+                    "feature_store": os.path.join(hydra_root_path, config["ingestion"]["feature_store_path"]),
+                    "mode": config["training"]["mode"],
+                    "epochs": config["training"]["epochs"],
+                    "chunksize": config["training"]["chunksize"],
+                    "search": config["training"]["search"],
+                    "folds": config["training"]["folds"],
+                    "workers": config["training"]["workers"],
+                    "cache_path": os.path.join(hydra_root_path, config["training"]["cache_path"]),
+                    "cache_size": config["training"]["cache_size"],
+                    "threshold": config["training"]["threshold"]
                 }
             )
         if "scoring" in active_steps:
@@ -88,7 +106,12 @@ def main(config: DictConfig):
                 parameters={
                     "model_file": os.path.join(hydra_root_path, config["training"]["output_model_path"], "trainedmodel.pkl"),
                     "data_test_file": os.path.join(hydra_root_path, config["diagnostics"]["test_data_path"], "testdata.csv"),
-                    "db_file": os.path.join(hydra_root_path, config["database"]["database_folder_path"], "pipeline_data.sqlite")
+                    "db_file": os.path.join(hydra_root_path, config["database"]["database_folder_path"], "pipeline_data.sqlite"),
+                    "force": config["scoring"]["force"],
+                    "chunksize": config["scoring"]["chunksize"],
+                    "resamples": config["scoring"]["resamples"],
+                    "confidence": config["scoring"]["confidence"],
+                    "sample": config["scoring"]["sample"]
                 }
             )
         if "deployment" in active_steps:
@@ -110,7 +133,8 @@ def main(config: DictConfig):
                 parameters={
                     "model_file": os.path.join(hydra_root_path, config["production"]["prod_deployment_path"], "trainedmodel.pkl"),
                     "test_data_file": os.path.join(hydra_root_path, config["diagnostics"]["test_data_path"], "testdata.csv"),
-                    "db_file": os.path.join(hydra_root_path, config["database"]["database_folder_path"], "pipeline_data.sqlite")
+                    "db_file": os.path.join(hydra_root_path, config["database"]["database_folder_path"], "pipeline_data.sqlite"),
+                    "feature_store": os.path.join(hydra_root_path, config["ingestion"]["feature_store_path"])
                 }
             )
 
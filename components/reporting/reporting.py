@@ -4,9 +4,10 @@ Pipeline report generator
 Generate the ML pipeline performance report
 
 By: Julian Bolivar
-Version: 1.0.0
+Version: 1.1.0
 Date:  2023/06/18
 Revision 1.0.0 (2023/06/18): Initial Release
+Revision 1.1.0 (2026/10/17): Feature store, schema and pushed down SQL loads
 """
 
 # Main System Imports
@@ -32,11 +33,15 @@ import sqlite3 as db
 # Get the running script's path
 RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
 
-# adding training directory to the system path
+# adding diagnostics and schema directories to the system path
 sys.path.insert(0, os.path.join(RUNNING_PATH, '../diagnostics'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../schema'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../database'))
 
 from diagnostics import (model_predictions, dataframe_summary, missing_data, 
                         execution_time, outdated_packages_list)
+from schema import load_csv
+from database import connect, read_query
 
 
 # Main Logger
@@ -78,6 +83,13 @@ def build_argparser():
                         help="Database",
                         default=os.path.join(RUNNING_PATH,'../../db/pipeline_data.sqlite'), 
                         required=False)
+
+    parser.add_argument("-f",
+                        "--feature_store", 
+                        type=str,
+                        help="Columnar feature store, used instead of the database when available",
+                        default=os.path.join(RUNNING_PATH,'../../ingesteddata/feature_store'), 
+                        required=False)
     
     return parser.parse_args()
 
@@ -106,7 +118,7 @@ def score_model(args):
     """ 
         
     # collect test dataset
-    dataset = pd.read_csv(args.test_data_file)
+    dataset = load_csv(args.test_data_file)
     # perform prediction
     yhat = model_predictions(args.model_file, args.test_data_file, args.db_file, LOGGER)
     # calculate confusion matrix
@@ -132,18 +144,19 @@ def score_model(args):
     # compute classification report
     cr = metrics.classification_report(y, yhat, output_dict=True)
     # Collect statistics
-    statistics = dataframe_summary(args.db_file, LOGGER)
-    missingdata = missing_data(args.db_file, LOGGER)
+    statistics = dataframe_summary(args.db_file, LOGGER, args.feature_store)
+    missingdata = missing_data(args.db_file, LOGGER, args.feature_store)
     timings = execution_time()
     dependencies = outdated_packages_list()
     # collect ingested files
     #connect to a database, creating it if it doesn't exist 
-    conn = db.connect(args.db_file)
+    conn = connect(args.db_file)
     LOGGER.info(f"Database Data File: {args.db_file} (002)")
 
     if conn is not None:
         try: 
-            ingestedfiles = pd.read_sql_query("select * from ingested_files",conn)
+            ingestedfiles = read_query(conn, "ingested_files", ['date', 'file'],
+                                       order_by=[('date', 'ASC')])
             LOGGER.info(f"Ingested Files table loaded from {args.db_file} (003)")  
         except ValueError:
             # if exception occour Rollback
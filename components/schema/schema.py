@@ -0,0 +1,113 @@
+"""
+Schema registry
+
+Declared column types of the churn dataset
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Data Science Imports
+import pandas as pd
+
+# Churn dataset columns and their compact types
+CHURN_SCHEMA = {
+    'corporation': 'category',
+    'lastmonth_activity': 'int32',
+    'lastyear_activity': 'int32',
+    'number_of_employees': 'int32',
+    'exited': 'int8',
+}
+
+# features used for training, the last one is the target
+FEATURES = ['lastmonth_activity','lastyear_activity','number_of_employees','exited']
+
+# Nullable types used when a column has missing values
+NULLABLE_TYPES = {
+    'int32': 'Int32',
+    'int8': 'Int8',
+}
+
+
+def segregate_dataset(dataset):
+    """
+    Eliminate features not used and segregate the dataset into X and y
+
+    :param dataset: (DataFrame) dataset to segregate
+    :return: (X, y) predictors and target
+    """
+
+    # eliminate features not used for training
+    dataset = dataset[FEATURES]
+
+    # data segregation
+    predictors = FEATURES[:-1]
+    target_variable = 'exited'
+    X = dataset[predictors]
+    y = dataset[target_variable]
+
+    return X,y
+
+
+def column_types(columns=None, nullable=False):
+    """
+    Declared types of the requested columns
+
+    :param columns: (list) columns, None returns all the schema
+    :param nullable: (bool) use the nullable integer types
+    :return: dict with the type of each column on the schema
+    """
+
+    columns = CHURN_SCHEMA.keys() if columns is None else columns
+    types = {col: CHURN_SCHEMA[col] for col in columns if col in CHURN_SCHEMA}
+    if nullable:
+        types = {col: NULLABLE_TYPES.get(dtype, dtype) for col, dtype in types.items()}
+
+    return types
+
+
+def load_csv(filename, columns=None, **kwargs):
+    """
+    Read a csv file with the declared types, parsing only the requested columns
+
+    The integer columns are parsed with the nullable types when the file
+    has missing values. Chunked reads are parsed with the nullable types,
+    since a missing value can appear on any chunk, and every chunk is
+    converted to the compact types when it has no missing values.
+
+    :param filename: (str) csv file or file like object
+    :param columns: (list) columns to read, None reads all
+    :param kwargs: other pandas' read_csv arguments
+    :return: pandas' dataframe or iterator of dataframes when chunksize is given
+    """
+
+    if kwargs.get('chunksize'):
+        chunks = pd.read_csv(filename, usecols=columns,
+                             dtype=column_types(columns, nullable=True), **kwargs)
+        return (apply_schema(chunk) for chunk in chunks)
+    try:
+        return pd.read_csv(filename, usecols=columns, dtype=column_types(columns), **kwargs)
+    except ValueError:
+        # integer columns with missing values, a buffer is read again from the start
+        if hasattr(filename, 'seek'):
+            filename.seek(0)
+        return pd.read_csv(filename, usecols=columns,
+                           dtype=column_types(columns, nullable=True), **kwargs)
+
+
+def apply_schema(dataset):
+    """
+    Convert the dataset columns to the declared types
+
+    :param dataset: (DataFrame) dataset loaded without types, e.g. from SQL
+    :return: pandas' dataframe with the declared types
+    """
+
+    types = column_types(dataset.columns)
+    try:
+        return dataset.astype(types)
+    except (ValueError, TypeError):
+        # integer columns with missing values
+        return dataset.astype(column_types(dataset.columns, nullable=True))
@@ -4,9 +4,11 @@ Model Scoring
 MLFLow model scoring step
 
 By: Julian Bolivar
-Version: 1.0.0
+Version: 1.1.0
 Date:  2023-06-14
 Revision 1.0.0 (2023-06-14): Initial Release
+Revision 1.1.0 (2026-10-17): Inference engine, score cache, confidence interval, chunked,
+                             sampled, batch and model comparison scoring
 """
 
 # Main System Imports
@@ -19,8 +21,7 @@ import platform
 from datetime import datetime as dt
 
 # ML imports
-import pickle
-from sklearn import metrics
+import numpy as np
 import pandas as pd
 
 # Data Base Imports
@@ -29,11 +30,22 @@ import sqlite3 as db
 # Get the running script path
 RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
 
-# adding training directory to the system path
-sys.path.insert(0, os.path.join(RUNNING_PATH, '../training'))
+# adding database, schema, artifact, inference, cache and ingestion directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../database'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../schema'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../artifact'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../inference'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../cache'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../ingestion'))
 
 # Imports from other libraries
-from training import segregate_dataset
+from database import connect, read_query, table_exists, write_table
+from schema import FEATURES, apply_schema, load_csv, segregate_dataset
+from artifact import LinearModel, load_model, model_source
+from inference import (StackedEngine, bootstrap_f1, confidence_interval, confusion_matrix,
+                       confusion_scores, evaluate_chunks, load_engine, roc_auc, stratified_f1)
+from cache import cached_digest
+from ingestion import load_batch
 
 
 # Main Logger
@@ -41,6 +53,24 @@ LOGHANDLER = None
 LOGGER = None
 LOGLEVEL_ = logging.INFO
 
+# Metric recorded by the scoring
+METRIC = 'f1'
+# Bootstrap resamples and coverage of the score confidence interval
+RESAMPLES = 10000
+CONFIDENCE = 0.95
+# Columns of the 'score_cache' table identifying a score
+SCORE_KEY = ['model_digest', 'data_digest', 'metric', 'resamples', 'confidence']
+# Scores and intervals memoized by this process, keyed on SCORE_KEY values
+SCORES = {}
+# Latest score files written by this process, with the score and file mtime
+LATEST_SCORES = {}
+# Test rows read per chunk while sampling the test data
+SAMPLE_CHUNK_ROWS = 100000
+# Stratified samples drawn by this process, keyed on (data digest, size, seed)
+SAMPLES = {}
+# Ingested rows read per chunk while scoring an ingestion batch
+BATCH_CHUNK_ROWS = 100000
+
 
 def build_argparser():
     """
@@ -75,41 +105,240 @@ def build_argparser():
         required=False
     )
 
+    parser.add_argument("-f",
+        "--force", 
+        type=int,
+        nargs='?',
+        const=1,
+        help="Score the model again bypassing the score cache, given alone or as 1",
+        default=0,
+        required=False
+    )
+
+    parser.add_argument("-n",
+        "--chunksize", 
+        type=int,
+        help="Test rows scored per chunk, streaming the test data with constant memory, 0 loads all at once",
+        default=0,
+        required=False
+    )
+
+    parser.add_argument("-b",
+        "--resamples", 
+        type=int,
+        help="Bootstrap resamples of the F1 confidence interval",
+        default=RESAMPLES,
+        required=False
+    )
+
+    parser.add_argument("-l",
+        "--confidence", 
+        type=float,
+        help="Coverage of the F1 confidence interval",
+        default=CONFIDENCE,
+        required=False
+    )
+
+    parser.add_argument("-a",
+        "--sample", 
+        type=int,
+        help="Rows of a stratified sample scored for a quick estimate with error bound, nothing recorded, 0 scores all the rows",
+        default=0,
+        required=False
+    )
+
+    parser.add_argument("-c",
+        "--compare", 
+        type=str,
+        help="Comma separated model files compared in a single pass, instead of scoring the model file",
+        default="",
+        required=False
+    )
+
+    parser.add_argument("-s",
+        "--compare_data", 
+        type=str,
+        help="Comma separated data files where the models are compared, the data test file when empty",
+        default="",
+        required=False
+    )
 
     return parser.parse_args()
 
 
-def score_model(data_test_file, model_file, db_file, LOGGER_=LOGGER):
+def model_digest(model_file):
+    """
+    Digest identifying a model as it is scored, the one of its compact
+    artifact when it is the file loaded, so a threshold change is a new model
+
+    :param model_file: model file
+    :return: (str) digest of the file loaded for the model
+    """
+
+    return cached_digest(model_source(model_file))
+
+
+def score_key(model_file, data_test_file, resamples=RESAMPLES, confidence=CONFIDENCE):
+    """
+    Key of a score on the 'score_cache' table
+
+    :param model_file: model file
+    :param data_test_file: file with the test data set
+    :param resamples: (int) bootstrap resamples of the confidence interval
+    :param confidence: (float) coverage of the confidence interval
+    :return: (tuple) values of the SCORE_KEY columns
+    """
+
+    return (model_digest(model_file), cached_digest(data_test_file), METRIC,
+            resamples, confidence)
+
+
+def lookup_score(db_file, key, LOGGER_=LOGGER):
+    """
+    Score and confidence interval recorded on the 'score_cache' table
+
+    :param db_file: DB file
+    :param key: (tuple) values of the SCORE_KEY columns, or only the first
+                ones to get the latest score matching them
+    :param LOGGER_: System Log manager
+    :return: (tuple) latest score, interval low and high recorded, None when there isn't one
+    """
+
+    recorded = None
+    conn = connect(db_file)
+    if conn is not None:
+        try:
+            if table_exists(conn, "score_cache"):
+                cached = read_query(conn, "score_cache", ['score', 'low', 'high'],
+                                    filters=[(col, '=', value) for col, value in zip(SCORE_KEY, key)],
+                                    order_by=[('date', 'DESC')], limit=1)
+                if len(cached) > 0:
+                    recorded = tuple(float(value) for value in cached.iloc[0])
+        except (ValueError, db.Error, pd.errors.DatabaseError) as err:
+            LOGGER_.error(f"Can't read table 'score_cache' in {db_file} (002)\n{err}")
+        finally:
+            # close out the connection
+            conn.close()
+    else:
+        LOGGER_.error(f"Can't connect with {db_file} (002)")
+
+    return recorded
+
+
+def score_model(data_test_file, model_file, db_file, LOGGER_=LOGGER, force=False, chunksize=0,
+                resamples=RESAMPLES, confidence=CONFIDENCE):
     """
     Perform the F1 model scoring using the test data and save it on the db table
     'model_scores' and the last one is stored at the model's path in the
     'latestscore.txt' file.
 
+    The scores are memoized on the 'score_cache' table keyed on the digests
+    of the model and test data files, so scoring the same model on the same
+    data again returns the recorded score without predicting nor appending
+    another 'model_score' row. The table also records the bootstrap
+    confidence interval of the score.
+
     :param data_test_file: file with the test data set
     :param model_file: model file
     :param db_file: DB file
     :param LOGGER_: System Log manager
-    :return: none 
+    :param force: (bool) score the model again bypassing the score cache
+    :param chunksize: (int) test rows scored per chunk, 0 loads them all at once
+    :param resamples: (int) bootstrap resamples of the confidence interval
+    :param confidence: (float) coverage of the confidence interval
+    :return: (float) F1 score
+    """
+
+    key = score_key(model_file, data_test_file, resamples, confidence)
+    interval = None
+    if not force:
+        interval = SCORES.get(key)
+        if interval is None:
+            interval = lookup_score(db_file, key, LOGGER_)
+    if interval is not None:
+        LOGGER_.info(f"Score of {model_file} on {data_test_file} found on the score cache (003)")
+    else:
+        interval = compute_score(data_test_file, model_file, db_file, key, LOGGER_, chunksize,
+                                 resamples, confidence)
+    SCORES[key] = interval
+    score, low, high = interval
+    LOGGER_.info(f"F1 score {score:.4f}, {confidence:.0%} interval [{low:.4f}, {high:.4f}] (007)")
+
+    # save as latest score on file
+    save_latest_score(os.path.join(os.path.realpath(os.path.dirname(model_file)), 'latestscore.txt'),
+                      score)
+
+    return score
+
+
+def save_latest_score(scorespath, score):
+    """
+    Save the score on the 'latestscore.txt' file, skipping the write when
+    this process already saved the same score and the file is unchanged
+
+    :param scorespath: (str) latest score file
+    :param score: (float) score
+    :return: None
+    """
+
+    if os.path.isfile(scorespath) and \
+            LATEST_SCORES.get(scorespath) == (score, os.stat(scorespath).st_mtime_ns):
+        return
+    with open(scorespath, 'w') as file:
+        file.write(str(score))
+    LATEST_SCORES[scorespath] = (score, os.stat(scorespath).st_mtime_ns)
+
+
+def compute_score(data_test_file, model_file, db_file, key, LOGGER_=LOGGER, chunksize=0,
+                  resamples=RESAMPLES, confidence=CONFIDENCE):
     """
+    Score the model on the test data, with a bootstrap confidence interval,
+    and record it on the db tables 'model_score' and 'score_cache'
 
-    # import test dataset from csv file
-    testdata = pd.read_csv(data_test_file)
+    With a chunksize the test data is streamed, each chunk is predicted and
+    added to a confusion matrix, so the memory doesn't grow with the test
+    data size.
 
-    # load trained model    
-    with open(model_file, 'rb') as file:
-        model = pickle.load(file)
-        LOGGER_.info(f"Model {model_file} loaded (001)")
+    :param data_test_file: file with the test data set
+    :param model_file: model file
+    :param db_file: DB file
+    :param key: (tuple) values of the SCORE_KEY columns
+    :param LOGGER_: System Log manager
+    :param chunksize: (int) test rows scored per chunk, 0 loads them all at once
+    :param resamples: (int) bootstrap resamples of the confidence interval
+    :param confidence: (float) coverage of the confidence interval
+    :return: (tuple) F1 score, interval low and high
+    """
 
-    # segregate test dataset
-    X, y = segregate_dataset(testdata)
+    # load trained model, evaluated by the inference engine when it
+    # has a compact artifact
+    model = load_engine(model_file)
+    LOGGER_.info(f"Model {model_file} loaded (001)")
+
+    if chunksize > 0:
+        # stream the test dataset from the csv file, only the model features
+        chunks = (segregate_dataset(chunk)
+                  for chunk in load_csv(data_test_file, FEATURES, chunksize=chunksize))
+        confusion = evaluate_chunks(model, chunks)
+        LOGGER_.info(f"{confusion.sum()} test rows scored by chunks of {chunksize} (006)")
+        score = confusion_scores(confusion)['f1']
+    else:
+        # import test dataset from csv file, only the model features
+        testdata = load_csv(data_test_file, FEATURES)
+
+        # segregate test dataset
+        X, y = segregate_dataset(testdata)
 
-    # evaluate model on test set
-    yhat = model.predict(X)
-    score = metrics.f1_score(y, yhat)
+        # evaluate model on test set
+        yhat = model.predict(X)
+        confusion = confusion_matrix(y, yhat)
+        score = confusion_scores(confusion)['f1']
+    # all the bootstrap resamples are drawn on a single vectorized operation
+    low, high = confidence_interval(bootstrap_f1(confusion, resamples), confidence)
 
     # upate score table
     #connect to a database, creating it if it doesn't exist 
-    conn = db.connect(db_file)
+    conn = connect(db_file)
     LOGGER_.info(f"Database Data File: {db_file} (001)")
     if conn is not None:
         try: 
@@ -119,12 +348,17 @@ def score_model(data_test_file, model_file, db_file, LOGGER_=LOGGER):
             score_reg = {'date': [now,], 'score': [score,]}
             scores_df = pd.DataFrame(score_reg)
             # Save score record into database
-            scores_df.to_sql("model_score", conn, if_exists='append', index=False)
+            write_table(conn, "model_score", scores_df, if_exists='append')
             LOGGER_.info(f"Score recorded in 'model_score' table into {db_file} (001)")
-        except ValueError as err:
+            # memoize the score for the model and test data
+            cache_df = pd.DataFrame({**{col: [value,] for col, value in zip(SCORE_KEY, key)},
+                                     'score': [score,], 'low': [low,], 'high': [high,],
+                                     'date': [now,]})
+            write_table(conn, "score_cache", cache_df, if_exists='append')
+        except (ValueError, db.Error) as err:
             # if exception occour Rollback
             conn.rollback()
-            LOGGER_.error(f"Can't update table 'model_score' in {db_file} (001)\n{err}")
+            LOGGER_.error(f"Can't update tables 'model_score' and 'score_cache' in {db_file} (001)\n{err}")
         else:
             # commit the transaction
             conn.commit()
@@ -136,12 +370,226 @@ def score_model(data_test_file, model_file, db_file, LOGGER_=LOGGER):
     else:
         LOGGER_.error(f"Can't connect with {db_file} (001)")
 
-    # save as latest score on file
-    scorespath = os.path.join(os.path.realpath(os.path.dirname(model_file)), 'latestscore.txt')
-    with open(scorespath, 'w') as file:
-        file.write(str(score))
+    return score, low, high
 
-    return score
+
+def batch_score(db_file, model_file, batch=None, LOGGER_=LOGGER, chunksize=0,
+                resamples=RESAMPLES, confidence=CONFIDENCE):
+    """
+    Score the model only on the rows of an ingestion batch, with a bootstrap
+    confidence interval, and record it on the db table 'batch_score'
+
+    The batch rows are a rowid range of the 'ingested_data' table, they are
+    read by chunks through its primary key, so the cost is proportional to
+    the batch and not to the whole ingested data.
+
+    :param db_file: DB file
+    :param model_file: model file
+    :param batch: batch ID of the ingestion run, None scores the latest one
+    :param LOGGER_: System Log manager
+    :param chunksize: (int) batch rows scored per chunk, 0 uses BATCH_CHUNK_ROWS
+    :param resamples: (int) bootstrap resamples of the confidence interval
+    :param confidence: (float) coverage of the confidence interval
+    :return: (tuple) F1 score, interval low and high, None when the batch has no rows
+    """
+
+    found = load_batch(db_file, batch)
+    if found is None or found['rows'] == 0:
+        LOGGER_.info(f"Ingestion batch {batch or 'latest'} without new rows on {db_file} (009)")
+        return None
+
+    model = load_engine(model_file)
+    LOGGER_.info(f"Model {model_file} loaded (009)")
+
+    score = None
+    conn = connect(db_file)
+    if conn is not None:
+        try:
+            chunks = (segregate_dataset(apply_schema(chunk))
+                      for chunk in read_query(conn, "ingested_data", FEATURES,
+                                              filters=[('rowid', '>=', found['first_row']),
+                                                       ('rowid', '<=', found['last_row'])],
+                                              chunksize=chunksize or BATCH_CHUNK_ROWS))
+            confusion = evaluate_chunks(model, chunks)
+            score = confusion_scores(confusion)['f1']
+            low, high = confidence_interval(bootstrap_f1(confusion, resamples), confidence)
+            LOGGER_.info(f"F1 score {score:.4f}, {confidence:.0%} interval [{low:.4f}, {high:.4f}] "
+                         f"on {confusion.sum()} rows of batch {found['batch']} (009)")
+            # get current time
+            now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+            batch_df = pd.DataFrame({'date': [now,], 'batch': [found['batch'],],
+                                     'model_digest': [model_digest(model_file),],
+                                     'rows': [int(confusion.sum()),], 'score': [score,],
+                                     'low': [low,], 'high': [high,]})
+            write_table(conn, "batch_score", batch_df, if_exists='append')
+            LOGGER_.info(f"Score recorded in 'batch_score' table into {db_file} (009)")
+        except (ValueError, db.Error, pd.errors.DatabaseError) as err:
+            # if exception occour Rollback
+            conn.rollback()
+            score = None
+            LOGGER_.error(f"Can't score batch {found['batch']} in {db_file} (009)\n{err}")
+        else:
+            # commit the transaction
+            conn.commit()
+            LOGGER_.debug(f"Transactions commited (009)")
+        finally:
+            # close out the connection
+            conn.close()
+            LOGGER_.debug(f"Connection Closed (009)")
+    else:
+        LOGGER_.error(f"Can't connect with {db_file} (009)")
+
+    return None if score is None else (score, low, high)
+
+
+def stratified_sample(data_test_file, size, chunksize=SAMPLE_CHUNK_ROWS, seed=0):
+    """
+    Sample of the test data stratified by the target, drawn on a single
+    streaming pass
+
+    Every row gets a uniform random key and each stratum keeps, as its
+    reservoir, the rows with the smallest keys seen so far, so the memory
+    is bounded by the sample size. At the end the sample is split evenly
+    between the strata, a stratum with fewer rows gives its share to the
+    other one.
+
+    :param data_test_file: file with the test data set
+    :param size: (int) sampled rows
+    :param chunksize: (int) test rows read per chunk
+    :param seed: (int) random generator seed
+    :return: (sample, totals) sampled rows and dict with the rows of each stratum
+    """
+
+    target = FEATURES[-1]
+    rng = np.random.default_rng(seed)
+    reservoirs = {}
+    totals = {}
+    for chunk in load_csv(data_test_file, FEATURES, chunksize=chunksize):
+        chunk = chunk.assign(key=rng.random(len(chunk)))
+        for label, stratum in chunk.groupby(target):
+            totals[label] = totals.get(label, 0) + len(stratum)
+            if label in reservoirs:
+                stratum = pd.concat([reservoirs[label], stratum])
+            if len(stratum) > size:
+                stratum = stratum.iloc[np.argpartition(stratum['key'].to_numpy(), size)[:size]]
+            reservoirs[label] = stratum
+
+    sample = []
+    remaining = size
+    for left, label in enumerate(sorted(totals, key=totals.get), start=0):
+        share = min(totals[label], remaining // (len(totals) - left))
+        # the smallest keys of the reservoir are a uniform sample of any size
+        sample.append(reservoirs[label].nsmallest(share, 'key'))
+        remaining -= share
+    sample = pd.concat(sample).drop(columns='key') if sample else pd.DataFrame(columns=FEATURES)
+
+    return sample, totals
+
+
+def sample_score(data_test_file, model_file, sample_size, LOGGER_=LOGGER, chunksize=0,
+                 resamples=RESAMPLES, confidence=CONFIDENCE, seed=0):
+    """
+    Estimate the F1 score of the model on a stratified sample of the test data
+
+    A quick check that doesn't record anything, the sample is memoized per
+    test data, so checking other models on the same data doesn't read it
+    again. The error bound is a bootstrap confidence interval.
+
+    :param data_test_file: file with the test data set
+    :param model_file: model file
+    :param sample_size: (int) sampled rows
+    :param LOGGER_: System Log manager
+    :param chunksize: (int) test rows read per chunk, 0 uses SAMPLE_CHUNK_ROWS
+    :param resamples: (int) bootstrap resamples of the confidence interval
+    :param confidence: (float) coverage of the confidence interval
+    :param seed: (int) random generator seed
+    :return: (dict) estimated F1, interval low and high, sampled and total rows
+    """
+
+    key = (cached_digest(data_test_file), sample_size, seed)
+    if key not in SAMPLES:
+        SAMPLES[key] = stratified_sample(data_test_file, sample_size,
+                                         chunksize or SAMPLE_CHUNK_ROWS, seed)
+    sample, totals = SAMPLES[key]
+
+    model = load_engine(model_file)
+    X, y = segregate_dataset(sample)
+    positive = np.asarray(model.predict(X)) == 1
+    y = y.to_numpy()
+    sizes = [np.sum(y == label) for label in (0, 1)]
+    positives = [np.sum(positive[y == label]) for label in (0, 1)]
+    score, resampled = stratified_f1([totals.get(0, 0), totals.get(1, 0)], sizes, positives,
+                                     resamples, seed)
+    low, high = confidence_interval(resampled, confidence)
+    LOGGER_.info(f"Estimated F1 score {score:.4f}, {confidence:.0%} interval [{low:.4f}, {high:.4f}] "
+                 f"on {len(sample)} of {sum(totals.values())} rows (008)")
+
+    return {'f1': score, 'low': low, 'high': high,
+            'rows': len(sample), 'total_rows': sum(totals.values())}
+
+
+def compare_models(model_files, data_files, db_file, LOGGER_=LOGGER):
+    """
+    Score several models on several datasets, loading each dataset once and
+    evaluating all the compact models with a single stacked matrix multiply,
+    the comparison is recorded on the db table 'model_comparison'.
+
+    :param model_files: (list) model files
+    :param data_files: (list) files with the data sets
+    :param db_file: DB file
+    :param LOGGER_: System Log manager
+    :return: pandas' dataframe with the F1, precision, recall and AUC per model and dataset
+    """
+
+    models = [load_model(model_file) for model_file in model_files]
+    LOGGER_.info(f"Models {', '.join(model_files)} loaded (004)")
+    # the models without compact artifact are evaluated on their own
+    stacked = [i for i, model in enumerate(models) if isinstance(model, LinearModel)]
+    engine = StackedEngine([models[i] for i in stacked]) if stacked else None
+
+    results = []
+    for data_file in data_files:
+        X, y = segregate_dataset(load_csv(data_file, FEATURES))
+        scores = [None] * len(models)
+        if engine is not None:
+            for i, model_scores in zip(stacked, engine.decision_function(X)):
+                scores[i] = model_scores
+        for i, (model_file, model) in enumerate(zip(model_files, models)):
+            if scores[i] is None:
+                scores[i] = model.decision_function(X)
+            if isinstance(model, LinearModel):
+                classes, boundary = model.classes, model.boundary
+            else:
+                classes, boundary = model.classes_, 0.0
+            yhat = np.where(scores[i] > boundary, classes[1], classes[0])
+            results.append({'model': model_file, 'data': data_file,
+                            **confusion_scores(confusion_matrix(y, yhat, classes[1])),
+                            # AUC is undefined when the dataset has a single class
+                            'auc': roc_auc(y, scores[i], classes[1])})
+        LOGGER_.info(f"{len(models)} models scored on {data_file} (004)")
+    comparison = pd.DataFrame(results)
+
+    # record the comparison
+    conn = connect(db_file)
+    if conn is not None:
+        try:
+            comparison_df = comparison.assign(date=dt.now().strftime("%Y-%m-%d %H:%M:%S"))
+            write_table(conn, "model_comparison", comparison_df, if_exists='append')
+            LOGGER_.info(f"Comparison recorded in 'model_comparison' table into {db_file} (005)")
+        except (ValueError, db.Error) as err:
+            # if exception occour Rollback
+            conn.rollback()
+            LOGGER_.error(f"Can't update table 'model_comparison' in {db_file} (005)\n{err}")
+        else:
+            # commit the transaction
+            conn.commit()
+        finally:
+            # close out the connection
+            conn.close()
+    else:
+        LOGGER_.error(f"Can't connect with {db_file} (005)")
+
+    return comparison
 
 
 def main(args):
@@ -153,7 +601,20 @@ def main(args):
 
     global LOGGER
 
-    _ = score_model(args.data_test_file, args.model_file, args.db_file, LOGGER_=LOGGER)
+    if args.compare:
+        data_files = args.compare_data.split(",") if args.compare_data else [args.data_test_file]
+        comparison = compare_models(args.compare.split(","), data_files, args.db_file, LOGGER_=LOGGER)
+        print(comparison.to_string(index=False))
+    elif args.sample > 0:
+        estimate = sample_score(args.data_test_file, args.model_file, args.sample, LOGGER_=LOGGER,
+                                chunksize=args.chunksize, resamples=args.resamples,
+                                confidence=args.confidence)
+        print(f"F1 {estimate['f1']:.4f} [{estimate['low']:.4f}, {estimate['high']:.4f}] "
+              f"on {estimate['rows']} of {estimate['total_rows']} rows")
+    else:
+        _ = score_model(args.data_test_file, args.model_file, args.db_file, LOGGER_=LOGGER,
+                        force=bool(args.force), chunksize=args.chunksize,
+                        resamples=args.resamples, confidence=args.confidence)
 
 
 if __name__ == '__main__':
@@ -4,9 +4,11 @@ Model Training
 MLFlow model training step
 
 By: Julian Bolivar
-Version: 1.0.0
+Version: 1.1.0
 Date:  2023-06-14
 Revision 1.0.0 (2023-06-14): Initial Release
+Revision 1.1.0 (2026-10-17): Incremental, out-of-core and search training, model cache, compact
+                             artifact and F1-optimal threshold
 """
 
 # Main System Imports
@@ -16,11 +18,28 @@ import logging.handlers
 import sys
 import os
 import platform
+import tempfile
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime as dt
+from itertools import product
+
+# Process memory usage, not available on Windows
+try:
+    import resource
+except ImportError:
+    resource = None
 
 # ML imports
+import numpy as np
 import pandas as pd
 import pickle
-from sklearn.linear_model import LogisticRegression
+import sklearn
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.metrics import f1_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
 
 # Data Base Imports
 import sqlite3 as db
@@ -28,11 +47,42 @@ import sqlite3 as db
 # Get the running script's path
 RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
 
+# adding featurestore, database, schema, cache and artifact directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../featurestore'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../schema'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../database'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../cache'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../artifact'))
+
+# Imports from other libraries
+from featurestore import iter_ingested_data, load_ingested_data
+from cache import fingerprint, get_entry, put_entry
+from artifact import DEFAULT_THRESHOLD, artifact_file, save_artifact
+from database import connect, read_query, table_exists, write_table
+from schema import FEATURES, segregate_dataset
+
 # Main Logger
 LOGHANDLER = None
 LOGGER = None
 LOGLEVEL_ = logging.DEBUG # .INFO
 
+# target classes, given to partial_fit since a batch can miss one of them
+CLASSES = np.array([0, 1])
+# incremental training checkpoint, saved beside the model
+STATE_FILE = 'trainingstate.pkl'
+# hyperparameters evaluated by the search
+SEARCH_GRID = {
+    'C': [0.001, 0.01, 0.1, 1.0, 10.0, 100.0],
+    'penalty': ['l1', 'l2'],
+    'class_weight': [None, 'balanced'],
+}
+# probability bins of the threshold sweep on streamed rows
+THRESHOLD_BINS = 10000
+# margin keeping the thresholds inside (0, 1), where their log-odds are finite
+THRESHOLD_EPSILON = 1e-12
+# rows sampled on the incremental checkpoint where the threshold is tuned
+THRESHOLD_SAMPLE_ROWS = 10000
+
 
 def build_argparser():
     """
@@ -55,37 +105,609 @@ def build_argparser():
                         help="Model save path",
                         default=os.path.join(RUNNING_PATH,'../../practicemodels'),
                         required=False)
+    parser.add_argument("-f",
+                        "--feature_store", 
+                        type=str,
+                        help="Columnar feature store, used instead of the database when available",
+                        default=os.path.join(RUNNING_PATH,'../../ingesteddata/feature_store'),
+                        required=False)
+    parser.add_argument("-m",
+                        "--mode", 
+                        type=str,
+                        help="Training mode, 'full' refits the model on all the data, "
+                             "'incremental' updates it with the rows ingested since its checkpoint "
+                             "and 'outofcore' fits it streaming the data by chunks",
+                        choices=['full', 'incremental', 'outofcore'],
+                        default='full',
+                        required=False)
+    parser.add_argument("-e",
+                        "--epochs", 
+                        type=int,
+                        help="Passes over the new rows on incremental training, "
+                             "or over all the data on out-of-core training",
+                        default=5,
+                        required=False)
+    parser.add_argument("-n",
+                        "--chunksize", 
+                        type=int,
+                        help="Rows per chunk on out-of-core training",
+                        default=100000,
+                        required=False)
+    parser.add_argument("-s",
+                        "--search", 
+                        type=int,
+                        help="Hyperparameter candidates cross validated, sampled from the grid, "
+                             "0 trains the default model and -1 searches all the grid",
+                        default=0,
+                        required=False)
+    parser.add_argument("-k",
+                        "--folds", 
+                        type=int,
+                        help="Cross validation folds of the hyperparameter search",
+                        default=5,
+                        required=False)
+    parser.add_argument("-w",
+                        "--workers", 
+                        type=int,
+                        help="Processes used by the hyperparameter search, 0 uses all the cores",
+                        default=0,
+                        required=False)
+    parser.add_argument("-c",
+                        "--cache_path", 
+                        type=str,
+                        help="Trained models cache, keyed on the training data and configuration",
+                        default=os.path.join(RUNNING_PATH,'../../cache/training'),
+                        required=False)
+    parser.add_argument("-x",
+                        "--cache_size", 
+                        type=int,
+                        help="Trained models cache size limit in MB, 0 disables the cache",
+                        default=256,
+                        required=False)
+    parser.add_argument("-t",
+                        "--threshold", 
+                        type=str,
+                        choices=['fixed', 'f1'],
+                        help="Decision threshold, 'fixed' keeps 0.5, 'f1' picks the F1-optimal one on the training rows",
+                        default='f1',
+                        required=False)
 
     return parser.parse_args()
 
 
-def segregate_dataset(dataset):
+def save_model(model, model_path, threshold=DEFAULT_THRESHOLD):
+    """
+    Save the model as trainedmodel.pkl on the model path, and as the
+    trainedmodel.bin compact artifact loaded by scoring and diagnostics
+
+    :param model: trained model
+    :param model_path: (str) model save path
+    :param threshold: (float) decision threshold saved on the compact artifact
+    :return: None
+    """
+
+    savingpath = os.path.join(model_path,'trainedmodel.pkl')
+    LOGGER.debug(f"Model will be saved at {savingpath} (008)")
+    with open(savingpath, 'wb') as file:
+        pickle.dump(model, file)
+        LOGGER.info(f"Model saved on {savingpath} (008)")
+    save_artifact(model, artifact_file(savingpath), threshold)
+    LOGGER.info(f"Compact model saved on {artifact_file(savingpath)} with threshold {threshold:.4f} (008)")
+
+
+def threshold_sweep(y, proba):
+    """
+    Precision, recall and F1 of every decision threshold over the probabilities
+
+    The probabilities are sorted once, descending, then the true and false
+    positives of predicting positive the k most probable samples are
+    cumulative sums, so all the thresholds are evaluated in O(n log n)
+    instead of scoring the predictions once per threshold.
+
+    :param y: (array) True for the positive samples
+    :param proba: (array) positive class probabilities
+    :return: (thresholds, precision, recall, f1) arrays, a threshold predicts
+             positive the samples with a probability over it
+    """
+
+    order = np.argsort(proba, kind='stable')[::-1]
+    proba = np.asarray(proba)[order]
+    positive = np.asarray(y, dtype=bool)[order]
+    tp = np.cumsum(positive)
+    fp = np.arange(1, len(proba) + 1) - tp
+    # the thresholds fall between distinct probabilities, on the last sample of each tie
+    last = np.flatnonzero(np.r_[proba[1:] != proba[:-1], True])
+    tp, fp = tp[last], fp[last]
+    fn = positive.sum() - tp
+    # halfway to the next lower probability, the lowest one is predicted positive too,
+    # clamped since a probability of 0 would give a threshold of 0 and an infinite boundary
+    thresholds = np.clip((proba[last] + np.r_[proba[last[:-1] + 1], 0.0]) / 2,
+                         THRESHOLD_EPSILON, 1 - THRESHOLD_EPSILON)
+    precision = tp / (tp + fp)
+    recall = np.divide(tp, tp + fn, out=np.zeros(len(tp)), where=tp + fn > 0)
+    f1 = np.divide(2 * tp, 2 * tp + fp + fn, out=np.zeros(len(tp)), where=2 * tp + fp + fn > 0)
+
+    return thresholds, precision, recall, f1
+
+
+def threshold_histogram(y, proba, bins=THRESHOLD_BINS):
+    """
+    Negative and positive samples counted per probability bin
+
+    :param y: (array) True for the positive samples
+    :param proba: (array) positive class probabilities
+    :param bins: (int) bins of equal width between 0 and 1
+    :return: (array) (2, bins) counts of the negative and positive samples
+    """
+
+    positive = np.asarray(y, dtype=bool)
+    index = np.minimum((np.asarray(proba) * bins).astype(np.int64), bins - 1)
+
+    return np.stack([np.bincount(index[~positive], minlength=bins),
+                     np.bincount(index[positive], minlength=bins)])
+
+
+def histogram_sweep(histogram):
+    """
+    Precision, recall and F1 of the thresholds on the bin edges of a histogram
+
+    The same sweep as threshold_sweep over the binned probabilities, the
+    true and false positives of a threshold are the samples on the bins
+    over it, so the memory depends on the bins and not on the samples.
+
+    :param histogram: (array) (2, bins) counts returned by threshold_histogram
+    :return: (thresholds, precision, recall, f1) arrays
+    """
+
+    bins = histogram.shape[1]
+    # samples on the bins from each edge to the top, the first edge is 1 / bins
+    fp = np.cumsum(histogram[0, ::-1])[::-1][1:]
+    tp = np.cumsum(histogram[1, ::-1])[::-1][1:]
+    fn = histogram[1].sum() - tp
+    thresholds = np.arange(1, bins) / bins
+    precision = np.divide(tp, tp + fp, out=np.zeros(len(tp)), where=tp + fp > 0)
+    recall = np.divide(tp, tp + fn, out=np.zeros(len(tp)), where=tp + fn > 0)
+    f1 = np.divide(2 * tp, 2 * tp + fp + fn, out=np.zeros(len(tp)), where=2 * tp + fp + fn > 0)
+
+    return thresholds, precision, recall, f1
+
+
+def tune_threshold(args, model, chunks, bins=0):
+    """
+    Pick the decision threshold of the model maximizing the F1
+
+    With bins the probabilities of each chunk are counted on a histogram
+    and discarded, so the rows can be streamed with constant memory, the
+    threshold is then picked among the bin edges.
+
+    :param args: script arguments
+    :param model: fitted model
+    :param chunks: iterable of (X, y) chunks of the rows where the threshold is picked
+    :param bins: (int) probability bins of the sweep, 0 sweeps the exact probabilities
+    :return: (float) threshold, 0.5 with the fixed threshold or without rows
+    """
+
+    if args.threshold == 'fixed':
+        return DEFAULT_THRESHOLD
+    labels, probas = [], []
+    histogram = np.zeros((2, bins), dtype=np.int64)
+    for X, y in chunks:
+        label = np.asarray(y) == model.classes_[1]
+        proba = model.predict_proba(X)[:, 1]
+        if bins > 0:
+            histogram += threshold_histogram(label, proba, bins)
+        else:
+            labels.append(label)
+            probas.append(proba)
+    rows = int(histogram.sum()) if bins > 0 else sum(len(proba) for proba in probas)
+    if rows == 0:
+        return DEFAULT_THRESHOLD
+
+    if bins > 0:
+        thresholds, _, _, f1 = histogram_sweep(histogram)
+    else:
+        thresholds, _, _, f1 = threshold_sweep(np.concatenate(labels), np.concatenate(probas))
+    best = np.argmax(f1)
+    LOGGER.info(f"F1-optimal threshold {thresholds[best]:.4f}, F1 {f1[best]:.4f} on "
+                f"{rows} rows (024)")
+
+    return float(thresholds[best])
+
+
+def update_threshold_sample(sample, dataset, size=THRESHOLD_SAMPLE_ROWS, seed=0):
+    """
+    Uniform sample of all the rows trained incrementally
+
+    Every row gets a uniform random key and the rows with the smallest keys
+    are kept, so the sample spans all the batches and not only the latest.
+
+    :param sample: (DataFrame) current sample with its keys, None if there isn't one
+    :param dataset: (DataFrame) rows of the new batch
+    :param size: (int) sampled rows
+    :param seed: (int) random generator seed
+    :return: (DataFrame) updated sample, with the training features and the keys
+    """
+
+    dataset = dataset[FEATURES].assign(key=np.random.default_rng(seed).random(len(dataset)))
+    if sample is not None:
+        dataset = pd.concat([sample, dataset], ignore_index=True)
+    if len(dataset) > size:
+        dataset = dataset.iloc[np.argpartition(dataset['key'].to_numpy(), size)[:size]]
+
+    return dataset.reset_index(drop=True)
+
+
+def build_incremental_model():
+    """
+    Logistic regression fitted by averaged stochastic gradient descent
+
+    The features are standardized with the statistics of the first
+    training, they are kept fixed on the updates so the coefficients
+    learned keep the same scale.
+
+    :return: sklearn's pipeline
+    """
+
+    return Pipeline([('scaler', StandardScaler()),
+                     ('classifier', SGDClassifier(loss='log_loss', alpha=0.0001, average=True,
+                                                  random_state=0))])
+
+
+def partial_fit_model(model, X, y, epochs=5, random_state=0):
+    """
+    Update an incremental model with a batch of rows
+
+    :param model: pipeline returned by build_incremental_model
+    :param X: (DataFrame) predictors
+    :param y: (Series) target
+    :param epochs: (int) shuffled passes over the batch
+    :param random_state: (int or list of ints) shuffling seed
+    :return: updated model
+    """
+
+    scaler = model.named_steps['scaler']
+    classifier = model.named_steps['classifier']
+    if not hasattr(scaler, 'mean_'):
+        scaler.fit(X)
+    X = scaler.transform(X)
+    y = np.asarray(y)
+    rng = np.random.default_rng(random_state)
+    for _ in range(epochs):
+        order = rng.permutation(len(y))
+        classifier.partial_fit(X[order], y[order], classes=CLASSES)
+
+    return model
+
+
+def ingestion_generation(db_file):
+    """
+    Identify the master dataset build the rows belong to
+
+    A full ingestion rebuilds the master dataset and its manifest, the
+    first manifest entry identifies the build, while the incremental
+    ingestions only append entries.
+
+    :param db_file: (str) database file
+    :return: (str) date and digest of the first ingested file, None if there isn't a manifest
+    """
+
+    conn = connect(db_file)
+    try:
+        if not table_exists(conn, "ingested_files"):
+            return None
+        first = read_query(conn, "ingested_files", ['date', 'digest'],
+                           order_by=[('rowid', 'ASC')], limit=1)
+    finally:
+        conn.close()
+
+    return None if first.empty else f"{first['date'].iloc[0]}/{first['digest'].iloc[0]}"
+
+
+def load_training_state(model_path):
+    """
+    Load the incremental training checkpoint
+
+    :param model_path: (str) model save path
+    :return: dict with the model, the rows trained, the dataset generation, the
+             threshold and its sample of the rows trained, None if not found
+    """
+
+    state_file = os.path.join(model_path, STATE_FILE)
+    if not os.path.isfile(state_file):
+        return None
+    with open(state_file, 'rb') as file:
+        return pickle.load(file)
+
+
+def save_training_state(model_path, state):
+    """
+    Save the incremental training checkpoint beside the model
+
+    :param model_path: (str) model save path
+    :param state: (dict) model, rows trained and dataset generation
+    :return: None
+    """
+
+    state_file = os.path.join(model_path, STATE_FILE)
+    with open(state_file, 'wb') as file:
+        pickle.dump(state, file)
+    LOGGER.info(f"Training checkpoint saved on {state_file} (010)")
+
+
+def train_incremental(args):
+    """
+    Update the model with the rows ingested since its last checkpoint
+
+    The checkpoint keeps the model with its optimizer state, the rows
+    already trained and a sample of them where the threshold is tuned. When it doesn't exist, or the master dataset was
+    rebuilt by a full ingestion, the model is trained from scratch.
+
+    input: script arguments
+    output: updated model and checkpoint saved to disk
+    """
+
+    start_time = timeit.default_timer()
+    state = load_training_state(args.model_path)
+    generation = ingestion_generation(args.db_file)
+    if state is None or state['generation'] != generation:
+        LOGGER.info("Training checkpoint not found or dataset rebuilt, training from scratch (011)")
+        state = {'model': build_incremental_model(), 'rows': 0, 'generation': generation,
+                 'threshold': DEFAULT_THRESHOLD}
+
+    # load only the training features of the new rows
+    dataset = load_ingested_data(args.db_file, args.feature_store, FEATURES, LOGGER, state['rows'])
+    LOGGER.info(f"Rows since checkpoint: {len(dataset)} of {state['rows'] + len(dataset)} (012)")
+    if len(dataset) > 0:
+        X,y = segregate_dataset(dataset)
+        partial_fit_model(state['model'], X, y, args.epochs)
+        state['sample'] = update_threshold_sample(state.get('sample'), dataset, seed=state['rows'])
+        state['rows'] += len(dataset)
+        # the threshold is tuned on a sample of all the rows trained, not on
+        # the latest batch only, a sample with a single class keeps the previous one
+        X,y = segregate_dataset(state['sample'])
+        if y.nunique() > 1:
+            state['threshold'] = tune_threshold(args, state['model'], [(X, y)])
+
+    save_model(state['model'], args.model_path, state.get('threshold', DEFAULT_THRESHOLD))
+    save_training_state(args.model_path, state)
+    LOGGER.info(f"Incremental training time: {timeit.default_timer() - start_time:.3f} s (013)")
+
+
+def peak_memory_mb():
+    """
+    Peak resident memory of the process
+
+    :return: (float) peak memory in MB, None when it can't be measured
+    """
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes on Linux
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def train_out_of_core(args):
+    """
+    Fit the incremental model streaming the ingested data by chunks
+
+    A first pass over the chunks computes the features statistics, then
+    every epoch updates the model chunk by chunk, so the memory used is
+    bounded by the chunk size and not by the dataset size.
+
+    input: script arguments
+    output: trained model saved to disk
+    """
+
+    start_time = timeit.default_timer()
+    model = build_incremental_model()
+    scaler = model.named_steps['scaler']
+    rows = 0
+    for chunk in iter_ingested_data(args.db_file, args.feature_store, FEATURES,
+                                    args.chunksize, LOGGER):
+        X,_ = segregate_dataset(chunk)
+        scaler.partial_fit(X)
+        rows += len(chunk)
+    LOGGER.info(f"Features statistics of {rows} rows computed (021)")
+
+    for epoch in range(args.epochs):
+        epoch_time = timeit.default_timer()
+        for number, chunk in enumerate(iter_ingested_data(args.db_file, args.feature_store,
+                                                          FEATURES, args.chunksize, LOGGER)):
+            X,y = segregate_dataset(chunk)
+            partial_fit_model(model, X, y, epochs=1, random_state=[epoch, number])
+        peak = peak_memory_mb()
+        LOGGER.info(f"Epoch {epoch + 1}/{args.epochs}: {rows} rows in "
+                    f"{timeit.default_timer() - epoch_time:.3f} s, peak memory "
+                    f"{'n/a' if peak is None else f'{peak:.1f} MB'} (022)")
+
+    # the probabilities are counted on a histogram chunk by chunk, the
+    # memory stays bounded by the chunk size and the bins
+    threshold = tune_threshold(args, model, (segregate_dataset(chunk) for chunk in
+                                             iter_ingested_data(args.db_file, args.feature_store,
+                                                                FEATURES, args.chunksize, LOGGER)),
+                               THRESHOLD_BINS)
+    save_model(model, args.model_path, threshold)
+    LOGGER.info(f"Out-of-core training time: {timeit.default_timer() - start_time:.3f} s (023)")
+
+
+def search_candidates(size, seed=0):
+    """
+    Hyperparameter candidates of the search
+
+    :param size: (int) candidates sampled from SEARCH_GRID, -1 or more
+                 than the grid size returns all the grid
+    :param seed: (int) sampling seed
+    :return: list of dicts with the hyperparameters of each candidate
+    """
+
+    grid = [dict(zip(SEARCH_GRID, values)) for values in product(*SEARCH_GRID.values())]
+    if 0 < size < len(grid):
+        rng = np.random.default_rng(seed)
+        grid = [grid[i] for i in sorted(rng.choice(len(grid), size, replace=False))]
+
+    return grid
+
+
+def evaluate_fold(data_path, params, fold):
+    """
+    Fit a candidate on all the folds but one and score it on that fold
+
+    The dataset and the folds are read memory mapped, so the processes
+    share them through the page cache instead of receiving a copy.
+
+    :param data_path: (str) directory with the X, y and folds arrays
+    :param params: (dict) logistic regression hyperparameters
+    :param fold: (int) validation fold
+    :return: F1 score on the validation fold
+    """
+
+    X = np.load(os.path.join(data_path, 'X.npy'), mmap_mode='r')
+    y = np.load(os.path.join(data_path, 'y.npy'), mmap_mode='r')
+    folds = np.load(os.path.join(data_path, 'folds.npy'), mmap_mode='r')
+    validation = folds == fold
+    model = LogisticRegression(solver='liblinear', random_state=0, **params)
+    model.fit(X[~validation], y[~validation])
+
+    return f1_score(y[validation], model.predict(X[validation]))
+
+
+def cross_validate(X, y, candidates, n_folds=5, workers=1):
+    """
+    Cross validate the hyperparameter candidates on a process pool
+
+    Every (candidate, fold) fit is a task of the pool, the dataset and
+    the fold of each row are saved once as arrays that the processes
+    read memory mapped, so they aren't pickled to every task.
+
+    :param X: (DataFrame) predictors
+    :param y: (Series) target
+    :param candidates: (list) dicts with the hyperparameters of each candidate
+    :param n_folds: (int) stratified folds
+    :param workers: (int) processes of the pool
+    :return: array with the F1 score of every candidate (rows) on every fold (columns)
+    """
+
+    folds = np.empty(len(y), dtype=np.int8)
+    splitter = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=0)
+    for fold, (_, validation) in enumerate(splitter.split(X, y)):
+        folds[validation] = fold
+    with tempfile.TemporaryDirectory() as data_path:
+        np.save(os.path.join(data_path, 'X.npy'), X.to_numpy(dtype=np.float64))
+        np.save(os.path.join(data_path, 'y.npy'), y.to_numpy())
+        np.save(os.path.join(data_path, 'folds.npy'), folds)
+        tasks = [(params, fold) for params in candidates for fold in range(n_folds)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scores = list(executor.map(evaluate_fold, [data_path] * len(tasks),
+                                       *zip(*tasks)))
+
+    return np.array(scores).reshape(len(candidates), n_folds)
+
+
+def search_model(args, dataset):
     """
-    Eliminate features not used and segregate the dataset into X and y
+    Cross validate the hyperparameter candidates and train the best one
 
-    input (pandas dataframe): dataset to segregate
-    output (pandas dataframe): X and y
+    The leaderboard is appended to the 'training_leaderboard' table and
+    the best candidate is refitted on all the data.
+
+    :param args: script arguments
+    :param dataset: (DataFrame) training dataset
+    :return: best model fitted
+    """
+
+    X,y = segregate_dataset(dataset)
+    candidates = search_candidates(args.search)
+    workers = args.workers if args.workers > 0 else os.cpu_count()
+    LOGGER.info(f"Searching {len(candidates)} candidates with {args.folds} folds "
+                f"on {workers} processes (014)")
+    scores = cross_validate(X, y, candidates, args.folds, workers)
+
+    leaderboard = pd.DataFrame({'C': [params['C'] for params in candidates],
+                                'penalty': [params['penalty'] for params in candidates],
+                                'class_weight': [str(params['class_weight']) for params in candidates],
+                                'mean_f1': scores.mean(axis=1),
+                                'std_f1': scores.std(axis=1)})
+    leaderboard = leaderboard.sort_values('mean_f1', ascending=False, kind='stable')
+    leaderboard.insert(0, 'rank', np.arange(1, len(leaderboard) + 1))
+    leaderboard.insert(0, 'date', dt.now().strftime("%Y-%m-%d %H:%M:%S"))
+    save_leaderboard(args.db_file, leaderboard)
+
+    best = candidates[leaderboard.index[0]]
+    LOGGER.info(f"Best candidate {best} F1 {leaderboard['mean_f1'].iloc[0]:.4f} (015)")
+    model = LogisticRegression(solver='liblinear', random_state=0, **best)
+
+    return model.fit(X,y)
+
+
+def save_leaderboard(db_file, leaderboard):
+    """
+    Append the search leaderboard to the 'training_leaderboard' table
+
+    :param db_file: (str) database file
+    :param leaderboard: (DataFrame) candidates ranked by their mean F1
+    :return: None
+    """
+
+    #connect to a database, creating it if it doesn't exist 
+    conn = connect(db_file)
+    if conn is not None:
+        try: 
+            write_table(conn, "training_leaderboard", leaderboard, if_exists='append')
+            LOGGER.info(f"Leaderboard recorded in 'training_leaderboard' table into {db_file} (017)")
+        except (ValueError, db.Error) as err:
+            # if exception occour Rollback
+            conn.rollback()
+            LOGGER.error(f"Can't update table 'training_leaderboard' in {db_file} (017)\n{err}")
+        else:
+            # commit the transaction
+            conn.commit()
+            LOGGER.debug(f"Transactions commited (017)")
+        finally:
+            # close out the connection
+            conn.close()
+            LOGGER.debug(f"Connection Closed (017)")
+    else:
+        LOGGER.error(f"Can't connect with {db_file} (017)")
+
+
+def training_config(args, model):
     """
+    Configuration that determines the trained model besides the data
 
-    # eliminate features not used for training
-    features = ['lastmonth_activity','lastyear_activity','number_of_employees','exited']
-    dataset = dataset[features]
+    :param args: script arguments
+    :param model: estimator to fit, its hyperparameters are part of the configuration
+    :return: dict with the configuration
+    """
 
-    # data segregation
-    predictors = features[:-1]
-    target_variable = 'exited'
-    X = dataset[predictors]
-    y = dataset[target_variable]
+    config = {'model': type(model).__name__, 'params': model.get_params(),
+              'sklearn': sklearn.__version__}
+    if args.search != 0:
+        config.update({'search': args.search, 'folds': args.folds, 'grid': SEARCH_GRID})
 
-    return X,y
+    return config
 
 
 def train_model(args):
     """
     Train a logistic regression model for churn classification
+
+    The trained models are cached keyed on the fingerprint of the training
+    rows and the configuration, when the data and the configuration didn't
+    change the cached model is restored without fitting it again.
+
     input: script arguments
     output: trained model saved to disk
     """
+
+    if args.mode == 'incremental':
+        train_incremental(args)
+        return
+    if args.mode == 'outofcore':
+        train_out_of_core(args)
+        return
+
+    start_time = timeit.default_timer()
     
     #use this logistic regression for training
     model = LogisticRegression(C=1.0, class_weight=None, dual=False, fit_intercept=True,
@@ -94,36 +716,40 @@ def train_model(args):
                     random_state=0, solver='liblinear', tol=0.0001, verbose=0,
                     warm_start=False)
     
-    #connect to a database, creating it if it doesn't exist 
-    conn = db.connect(args.db_file)
-    LOGGER.info(f"Database Data File: {args.db_file} (002)")
+    # load only the training features
+    dataset = load_ingested_data(args.db_file, args.feature_store, FEATURES, LOGGER)
 
-    if conn is not None:
-        try: 
-            dataset = pd.read_sql_query("select * from ingested_data",conn)
-            LOGGER.info(f"Ingested Data table loaded from {args.db_file} (003)")  
-        except ValueError:
-            # if exception occour Rollback
-            conn.rollback()
-            LOGGER.error(f"Can't read table 'ingested_data' in {args.db_file} (005)")
-        finally:
-            # close out the connection
-            conn.close()
-            LOGGER.debug(f"Connection Closed (007)")
-    else:
-        LOGGER.error(f"Can't connect with {args.db_file} (008)")
+    savingpath = os.path.join(args.model_path,'trainedmodel.pkl')
+    if args.cache_size > 0:
+        key = fingerprint(dataset, training_config(args, model))
+        if get_entry(args.cache_path, key, savingpath):
+            LOGGER.info(f"Training cache hit {key}, model restored on {savingpath} (018)")
+            with open(savingpath, 'rb') as file:
+                model = pickle.load(file)
+            # the threshold isn't cached, sweeping it is cheaper than the fit
+            threshold = tune_threshold(args, model, [segregate_dataset(dataset)])
+            save_artifact(model, artifact_file(savingpath), threshold)
+            return
+        LOGGER.info(f"Training cache miss {key} (019)")
 
     X,y = segregate_dataset(dataset)
-    
-    # fit the logistic regression to your data
-    model.fit(X,y)
-    
+    if args.search != 0:
+        model = search_model(args, dataset)
+    else:
+        # fit the logistic regression to your data
+        model.fit(X,y)
+
+    # threshold optimization stage, on the training rows
+    threshold = tune_threshold(args, model, [(X, y)])
+
     # write the trained model to your workspace in a file called trainedmodel.pkl
-    savingpath = os.path.join(args.model_path,'trainedmodel.pkl')
-    LOGGER.debug(f"Model will be saved at {savingpath} (008)")
-    with open(savingpath, 'wb') as file:
-        pickle.dump(model, file)
-        LOGGER.info(f"Model saved on {savingpath} (008)")
+    save_model(model, args.model_path, threshold)
+    LOGGER.info(f"Full training time: {timeit.default_timer() - start_time:.3f} s (009)")
+
+    if args.cache_size > 0:
+        for evicted in put_entry(args.cache_path, key, savingpath, args.cache_size):
+            LOGGER.info(f"Training cache entry {evicted} evicted (020)")
+
 
 def main(args):
     """
@@ -4,9 +4,10 @@ ML monitoring
 Implementes the ML pipeline monitoring
 
 By: Julian Bolivar
-Version: 1.0.0
+Version: 1.1.0
 Date:  2023/06/20
 Revision 1.0.0 (2023/06/20): Initial Release
+Revision 1.1.0 (2026/10/17): Incremental ingestion, watch mode and in-process batch drift check
 """
 
 # Main System Imports
@@ -16,20 +17,31 @@ import logging.handlers
 import sys
 import os
 import platform
+import threading
+import time
 import mlflow
 
-# Machine Learning imports
-import pandas as pd
-
 # Yaml file manager
 import yaml
 
-# Data Base Imports
-import sqlite3 as db
+# File system events, the watch mode polls the input folder when not installed
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
 
 # Get the running script's path
 RUNNING_PATH = os.path.realpath(os.path.dirname(__file__)) 
 
+# adding ingestion, database and scoring directories to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, 'components', 'ingestion'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, 'components', 'database'))
+sys.path.insert(0, os.path.join(RUNNING_PATH, 'components', 'scoring'))
+
+# Imports from other libraries
+from ingestion import is_source_file, list_source_files, load_batch, load_manifest, find_new_files
+from scoring import batch_score, lookup_score, model_digest, score_key, score_model
+
 # Main Logger
 LOGHANDLER = None
 LOGGER = None
@@ -44,6 +56,7 @@ OUTPUT_FOLDER_PATH = os.path.join(RUNNING_PATH,'components',config['ingestion'][
 PROD_DEPLOYMENT_PATH = os.path.join(RUNNING_PATH,'components',config['production']['prod_deployment_path'])
 MODEL_PATH = os.path.join(RUNNING_PATH,'components',config['training']['output_model_path'])
 DB_FILE = os.path.join(RUNNING_PATH,'components',config['database']['database_folder_path'],'pipeline_data.sqlite')
+TEST_DATA_FILE = os.path.join(RUNNING_PATH,'components',config['diagnostics']['test_data_path'],'testdata.csv')
 
 
 def build_argparser():
@@ -63,8 +76,139 @@ def build_argparser():
         required=False
     )
 
+    parser.add_argument("-w",
+        "--watch", 
+        help="Stay resident and run the process when new data files arrive",
+        action="store_true",
+        required=False
+    )
+
+    parser.add_argument("-b",
+        "--debounce", 
+        type=float,
+        help="Seconds without file changes before running the process on watch mode",
+        default=5.0,
+        required=False
+    )
+
+    parser.add_argument("-p",
+        "--poll_interval", 
+        type=float,
+        help="Seconds between input folder scans when inotify is not available",
+        default=10.0,
+        required=False
+    )
+
     return parser.parse_args()
 
+
+class SourceEventHandler:
+    """
+    File system event handler flagging the changes of the source data files
+    """
+
+    def __init__(self, changed):
+        """
+        :param changed: (threading.Event) set when a source file changes
+        """
+
+        self.changed = changed
+
+    def dispatch(self, event):
+        """
+        Flag the events on plain and compressed csv files
+
+        :param event: watchdog file system event
+        """
+
+        paths = [getattr(event, 'src_path', ''), getattr(event, 'dest_path', '')]
+        if not event.is_directory and any(is_source_file(str(path)) for path in paths):
+            self.changed.set()
+
+
+def source_snapshot():
+    """
+    Size and mtime of the source data files
+
+    :return: dict with the (size, mtime) of every source file
+    """
+
+    snapshot = {}
+    for file in list_source_files(INPUT_FOLDER_PATH):
+        try:
+            stat = os.stat(file)
+        except OSError:
+            continue
+        snapshot[file] = (stat.st_size, stat.st_mtime)
+
+    return snapshot
+
+
+def poll_sources(changed, interval, stop):
+    """
+    Scan the input folder flagging when the source files change
+
+    :param changed: (threading.Event) set when a source file changes
+    :param interval: (float) seconds between scans
+    :param stop: (threading.Event) ends the scans
+    """
+
+    snapshot = source_snapshot()
+    while not stop.wait(interval):
+        current = source_snapshot()
+        if current != snapshot:
+            snapshot = current
+            changed.set()
+
+
+def watch(args):
+    """
+    Run the process every time new data files arrive
+
+    The input folder is watched with inotify through watchdog, or scanned
+    every poll_interval seconds when it is not installed. A burst of
+    changes is debounced into a single run, waiting until no file changed
+    for debounce seconds.
+
+    args: command line arguments
+    """
+
+    global LOGGER
+
+    changed = threading.Event()
+    stop = threading.Event()
+    if Observer is not None:
+        observer = Observer()
+        observer.schedule(SourceEventHandler(changed), INPUT_FOLDER_PATH, recursive=False)
+        observer.start()
+        LOGGER.info(f"Watching {INPUT_FOLDER_PATH} with file system events (001)")
+    else:
+        observer = threading.Thread(target=poll_sources,
+                                    args=(changed, args.poll_interval, stop), daemon=True)
+        observer.start()
+        LOGGER.info(f"Polling {INPUT_FOLDER_PATH} every {args.poll_interval} s (001)")
+
+    # process the files arrived while not running
+    changed.set()
+    try:
+        while True:
+            changed.wait()
+            # wait until the burst of changes ends
+            while changed.is_set():
+                changed.clear()
+                time.sleep(args.debounce)
+            try:
+                main(args)
+            except Exception as err:
+                LOGGER.exception(f"Monitoring process failed (001)\n{err}")
+    except KeyboardInterrupt:
+        LOGGER.info("Watch mode stopped (001)")
+    finally:
+        stop.set()
+        if Observer is not None:
+            observer.stop()
+        observer.join()
+
 def main(args):
     """
     Run the main function
@@ -77,43 +221,30 @@ def main(args):
     move_to_next_step = False
     LOGGER.info("Launching automated monitoring")
     ##################Check and read new data
-    #first, get ingested files
-    #connect to a database, creating it if it doesn't exist 
-    conn = db.connect(DB_FILE)
-    LOGGER.info(f"Database Data File: {DB_FILE} (002)")
-    if conn is not None:
-        try: 
-            ingestedfiles = pd.read_sql_query("select * from ingested_files",conn)
-            LOGGER.info(f"Ingested Files table loaded from {DB_FILE} (003)")  
-        except ValueError:
-            # if exception occour Rollback
-            conn.rollback()
-            LOGGER.error(f"Can't read table 'ingested_files' in {DB_FILE} (005)")
-        finally:
-            # close out the connection
-            conn.close()
-            LOGGER.debug(f"Connection Closed (007)")
-    else:
-        LOGGER.error(f"Can't connect with {DB_FILE} (008)")
+    #first, get the manifest of ingested files
+    manifest = load_manifest(DB_FILE)
+    LOGGER.info(f"Ingested Files manifest loaded from {DB_FILE} (003)")
 
-    #second, determine whether the source data folder has files that aren't listed in ingestedfiles.txt
-    ingestedfiles['file'] = ingestedfiles['file'].apply(lambda x: os.path.basename(x))
-    files = os.listdir(INPUT_FOLDER_PATH)
-    files = [file for file in files if file not in ingestedfiles['file'].tolist()]
+    #second, determine whether the source data folder has files whose content isn't on the manifest
+    files = list(find_new_files(list_source_files(INPUT_FOLDER_PATH, LOGGER), manifest))
     
     ##################Deciding whether to proceed, part 1
     #if you found new data, you should proceed. otherwise, do end the process here
     if files !=[]:
         LOGGER.info("ingesting new files")
+        previous = load_batch(DB_FILE)
         # Ingest the files using the pipeline step
         _ = mlflow.run(
             os.path.join(RUNNING_PATH, "components"),
             "main",
             parameters={
                 "steps": 'ingestion',
+                "hydra_options": "ingestion.mode=incremental"
             }
         )
-        move_to_next_step = True
+        # the batch written by this ingestion, if it wrote one
+        batch = load_batch(DB_FILE)
+        move_to_next_step = batch is not None and batch != previous
     else:
         LOGGER.info("No new files - ending process")
 
@@ -132,41 +263,48 @@ def main(args):
     """You can manually change the dataset instead the latest score and 
     get an worse result only to make sure your code runs fine."""
     
-    #check whether the score from the deployed model is different from the score from the model that uses the newest ingested data
+    #check whether the score from the deployed model on the newest ingested data is below its recorded score
     if move_to_next_step :
-        # Score the new model using the pipeline step
-        _ = mlflow.run(
-            os.path.join(RUNNING_PATH, "components"),
-            "main",
-            parameters={
-                "steps": 'scoring',
-                "hydra_options": "training.output_model_path=" + config['production']['prod_deployment_path']
-            }
-        )
-        #connect to a database, creating it if it doesn't exist 
-        conn = db.connect(DB_FILE)
-        LOGGER.info(f"Database Data File: {DB_FILE} (002)")
-        if conn is not None:
-            try: 
-                modelscores = pd.read_sql_query("select * from model_score ORDER BY date ASC",conn)
-                LOGGER.info(f"Score table loaded from {DB_FILE} (003)")  
-            except ValueError:
-                # if exception occour Rollback
-                conn.rollback()
-                LOGGER.error(f"Can't read table 'model_test_score' in {DB_FILE} (005)")
-            finally:
-                # close out the connection
-                conn.close()
-                LOGGER.debug(f"Connection Closed (007)")
+        # the score and confidence interval recorded for the deployed model,
+        # on the test data it was scored last time
+        prod_model = os.path.join(PROD_DEPLOYMENT_PATH, 'trainedmodel.pkl')
+        recorded = lookup_score(DB_FILE, (model_digest(prod_model),), LOGGER)
+        if recorded is None:
+            # never scored, as on a new database, score it in-process on the
+            # test data recording its score for the next batches
+            LOGGER.info(f"Deployed model score not recorded, scoring it on {TEST_DATA_FILE} (010)")
+            score_model(TEST_DATA_FILE, prod_model, DB_FILE, LOGGER,
+                        chunksize=config['scoring']['chunksize'],
+                        resamples=config['scoring']['resamples'],
+                        confidence=config['scoring']['confidence'])
+            recorded = lookup_score(DB_FILE, score_key(prod_model, TEST_DATA_FILE,
+                                                       config['scoring']['resamples'],
+                                                       config['scoring']['confidence']), LOGGER)
+
+        # Score the deployed model in-process only on the rows of the new
+        # batch, the cost follows the batch size and not the whole dataset
+        new = None
+        if recorded is not None:
+            new = batch_score(DB_FILE, prod_model, batch['batch'], LOGGER,
+                              chunksize=config['scoring']['chunksize'],
+                              resamples=config['scoring']['resamples'],
+                              confidence=config['scoring']['confidence'])
+        if recorded is None:
+            move_to_next_step = False
+            LOGGER.error(f"Deployed model scores not found in {DB_FILE} - ending process (008)")
+        elif new is None:
+            move_to_next_step = False
+            LOGGER.info(f"Batch {batch['batch']} without new rows to score - ending process (009)")
         else:
-            LOGGER.error(f"Can't connect with {DB_FILE} (008)")
-    
-        latest_score = modelscores.iloc[-2].values[1]
-        new_score = modelscores.iloc[-1].values[1]
-        LOGGER.info(f'latest score: {latest_score}, new score: {new_score} (001)')
-        if new_score >= latest_score:
-            move_to_next_step = False  # No model drift, keep existing model
-            LOGGER.info('No model drift - ending process (001)')
+            latest_score, latest_low, latest_high = recorded
+            new_score, new_low, new_high = new
+            LOGGER.info(f'latest score: {latest_score} [{latest_low}, {latest_high}], '
+                        f'new score: {new_score} [{new_low}, {new_high}] (001)')
+            # drift only when the whole new interval is below the recorded
+            # one, a lower point estimate inside the noise doesn't retrain
+            if new_high >= latest_low:
+                move_to_next_step = False  # No model drift, keep existing model
+                LOGGER.info('No model drift - ending process (001)')
     
     ##################Deciding whether to proceed, part 2
     #if you found model drift, you should proceed. otherwise, do end the process here
@@ -219,6 +357,8 @@ if __name__ == '__main__':
     args = build_argparser()
     if args.version:
         print("Risk Pipeline v1.0.0")
+    elif args.watch:
+        watch(args)
     else:
         main(args)
     LOGGER.debug("Finished. (001)")
@@ -0,0 +1,108 @@
+"""
+Ingestion tests
+
+By: Julian Bolivar
+Version: 1.0.0
+Date:  2026/10/17
+Revision 1.0.0 (2026/10/17): Initial Release
+"""
+
+# Main System Imports
+from argparse import Namespace
+import logging as log
+import os
+import shutil
+import sys
+
+# Data Base Imports
+import sqlite3
+
+# Data Science Imports
+import pandas as pd
+
+# Get the running script path
+RUNNING_PATH = os.path.realpath(os.path.dirname(__file__))
+
+# adding ingestion directory to the system path
+sys.path.insert(0, os.path.join(RUNNING_PATH, '../components/ingestion'))
+
+# Imports from other libraries
+import ingestion
+
+ingestion.LOGGER = log.getLogger("test_ingestion")
+
+COLUMNS = ['corporation', 'lastmonth_activity', 'lastyear_activity', 'number_of_employees', 'exited']
+
+
+def ingestion_args(path, mode, chunksize=4):
+    """
+    Ingestion arguments writing into a temporary directory
+
+    :param path: (pathlib.Path) temporary directory with the 'input' folder
+    :param mode: (str) 'full' or 'incremental'
+    :param chunksize: (int) rows per chunk, streaming the files
+    :return: command line arguments
+    """
+
+    return Namespace(input_path=str(path / 'input'), output_file=str(path / 'finaldata.csv'),
+                     record_file=str(path / 'ingestedfiles.txt'),
+                     db_file=str(path / 'pipeline_data.sqlite'), mode=mode, chunksize=chunksize,
+                     max_memory=0, workers=1, feature_store='', parser='pandas', block_size=64)
+
+
+def test_incremental_streaming_writes_header_on_new_csv(tmp_path):
+    """
+    Incremental streaming ingestion without a finaldata.csv creates it with its header
+    """
+
+    os.mkdir(tmp_path / 'input')
+    shutil.copy(os.path.join(RUNNING_PATH, '../practicedata/dataset1.csv'), tmp_path / 'input')
+    ingestion.main(ingestion_args(tmp_path, 'full'))
+    os.remove(tmp_path / 'finaldata.csv')
+
+    shutil.copy(os.path.join(RUNNING_PATH, '../sourcedata/dataset3.csv'), tmp_path / 'input')
+    ingestion.main(ingestion_args(tmp_path, 'incremental'))
+
+    finaldata = pd.read_csv(tmp_path / 'finaldata.csv')
+    assert list(finaldata.columns) == COLUMNS
+    assert len(finaldata) == ingestion.load_batch(str(tmp_path / 'pipeline_data.sqlite'))['rows']
+
+
+def test_full_rebuild_keeps_incremental_order(tmp_path):
+    """
+    A full rebuild reproduces the incremental output when a later file sorts first
+    """
+
+    os.mkdir(tmp_path / 'input')
+    for file in ['practicedata/dataset1.csv', 'practicedata/dataset2.csv', 'sourcedata/dataset3.csv']:
+        shutil.copy(os.path.join(RUNNING_PATH, '..', file), tmp_path / 'input')
+    ingestion.main(ingestion_args(tmp_path, 'full', chunksize=0))
+    shutil.copy(os.path.join(RUNNING_PATH, '../sourcedata/dataset4.csv'), tmp_path / 'input/a.csv')
+    ingestion.main(ingestion_args(tmp_path, 'incremental', chunksize=0))
+    with open(tmp_path / 'finaldata.csv', 'rb') as file:
+        incremental = file.read()
+
+    ingestion.main(ingestion_args(tmp_path, 'full', chunksize=0))
+    with open(tmp_path / 'finaldata.csv', 'rb') as file:
+        assert file.read() == incremental
+
+
+def test_empty_full_streaming_clears_dataset(tmp_path):
+    """
+    A full streaming ingestion without rows replaces the previous dataset
+    """
+
+    os.mkdir(tmp_path / 'input')
+    shutil.copy(os.path.join(RUNNING_PATH, '../practicedata/dataset1.csv'), tmp_path / 'input')
+    ingestion.main(ingestion_args(tmp_path, 'full'))
+    os.remove(tmp_path / 'input/dataset1.csv')
+    ingestion.main(ingestion_args(tmp_path, 'full'))
+
+    conn = sqlite3.connect(tmp_path / 'pipeline_data.sqlite')
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM ingested_data").fetchone()[0] == 0
+    finally:
+        conn.close()
+    finaldata = pd.read_csv(tmp_path / 'finaldata.csv')
+    assert list(finaldata.columns) == COLUMNS
+    assert len(finaldata) == 0